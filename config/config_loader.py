@@ -1,14 +1,23 @@
 # config/config_loader.py (범용 로더 - 저수준)
 import yaml
 import os
+import re
 from pathlib import Path
-from functools import lru_cache
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 from copy import deepcopy
 
+# libyaml(C) 파서 우선, 없으면 순수 Python 파서
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from typing import Dict, Any
 from copy import deepcopy
 
+# 값 전체가 ${VAR_NAME} 인 문자열
+_ENV_VAR_RE = re.compile(r'^\$\{([^}]+)\}$')
+
 
 class ConfigLoader:
     """범용 YAML 설정 로더 (싱글톤) - base config 상속 지원"""
@@ -16,7 +25,8 @@ class ConfigLoader:
     def __init__(self) -> None:
         self.project_root = self._find_project_root()
         self.config_dir = self.project_root / 'config'
-        self._base_cache = {}  # base config 캐시
+        # config_name → (의존 파일별 (경로, mtime_ns) 목록, 파싱 결과)
+        self._cache: Dict[str, Tuple[List[Tuple[Path, int]], Dict[Any, Any]]] = {}
         
     def _find_project_root(self) -> Path:
         """프로젝트 루트 자동 탐색"""
@@ -26,10 +36,12 @@ class ConfigLoader:
                 return parent
         return current.parent.parent
     
-    @lru_cache(maxsize=32)
     def load(self, config_name: str) -> Dict[Any, Any]:
         """YAML 파일 로드 및 캐싱
 
+        파일(및 _base로 상속한 파일)의 mtime이 그대로면 캐시를 반환하고,
+        수정되었으면 다시 파싱한다 (개발 중 reload 반영).
+
         Args:
             config_name: 'base', 'preprocess/cleaning' 등
 
@@ -41,77 +53,43 @@ class ConfigLoader:
         if not config_path.exists():
             raise FileNotFoundError(f'Config not found: {config_path}')
         
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        cached = self._cache.get(config_name)
+        if cached is not None and self._is_fresh(cached[0]):
+            return cached[1]
         
-        # base config 상속 처리
-        if '_base' in config:
-            config = self._merge_with_base(config, config_path)
+        deps = [(config_path, config_path.stat().st_mtime_ns)]
+        
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = yaml.load(f, Loader=_YamlLoader)
         
         # base config 상속 처리
         if '_base' in config:
-            config = self._merge_with_base(config, config_path)
-        
-        return self._replace_env_vars(config)
-    
-    def _merge_with_base(self, config: Dict[Any, Any], current_path: Path) -> Dict[Any, Any]:
-        """base config와 병합
-        
-        Args:
-            config: 현재 config
-            current_path: 현재 config 파일 경로
-            
-        Returns:
-            병합된 config
-        """
-        base_ref = config.pop('_base')
-        
-        # 상대 경로 해석
-        if base_ref.startswith('../'):
-            base_path = (current_path.parent / base_ref).resolve()
-        else:
-            base_path = self.config_dir / base_ref
-        
-        # base config 로드
-        base_name = base_path.relative_to(self.config_dir).with_suffix('').as_posix()
-        base_config = self.load(base_name)
+            config = self._merge_with_base(config, config_path, deps)
         
-        # Deep merge: base를 먼저, 현재 config로 오버라이드
-        merged = self._deep_merge(deepcopy(base_config), config)
-        
-        return merged
+        config = self._replace_env_vars(config)
+        self._cache[config_name] = (deps, config)
+        return config
     
-    def _deep_merge(self, base: Dict, override: Dict) -> Dict:
-        """딕셔너리 재귀 병합
-        
-        Args:
-            base: 기본 설정
-            override: 오버라이드할 설정
-            
-        Returns:
-            병합된 설정
-        """
-        result = deepcopy(base)
-        
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = value
-        
-        return result
+    @staticmethod
+    def _is_fresh(deps: List[Tuple[Path, int]]) -> bool:
+        """캐시에 기록된 파일들의 mtime이 변하지 않았는지 확인"""
+        try:
+            return all(path.stat().st_mtime_ns == mtime for path, mtime in deps)
+        except FileNotFoundError:
+            return False
     
-    def _replace_env_vars(self, config: Any) -> Any:
-        """환경변수 치환 (재귀적)
-        
-        ${VAR_NAME} 형태를 실제 환경변수 값으로 치환
-        """
-    def _merge_with_base(self, config: Dict[Any, Any], current_path: Path) -> Dict[Any, Any]:
+    def _merge_with_base(
+        self,
+        config: Dict[Any, Any],
+        current_path: Path,
+        deps: List[Tuple[Path, int]] = None
+    ) -> Dict[Any, Any]:
         """base config와 병합
         
         Args:
             config: 현재 config
             current_path: 현재 config 파일 경로
+            deps: 캐시 무효화용 의존 파일 목록 (base의 의존 파일을 추가)
             
         Returns:
             병합된 config
@@ -127,6 +105,8 @@ class ConfigLoader:
         # base config 로드
         base_name = base_path.relative_to(self.config_dir).with_suffix('').as_posix()
         base_config = self.load(base_name)
+        if deps is not None:
+            deps.extend(self._cache[base_name][0])
         
         # Deep merge: base를 먼저, 현재 config로 오버라이드
         merged = self._deep_merge(deepcopy(base_config), config)
@@ -157,24 +137,26 @@ class ConfigLoader:
         """환경변수 치환 (재귀적)
         
         ${VAR_NAME} 형태를 실제 환경변수 값으로 치환
+        새로 파싱/병합된 객체이므로 제자리에서 바꾸고, 치환된 값만 다시 대입
         """
         if isinstance(config, dict):
-            return {k: self._replace_env_vars(v) for k, v in config.items()}
-        elif isinstance(config, list):
-            return [self._replace_env_vars(item) for item in config]
+            for k, v in config.items():
+                new_v = self._replace_env_vars(v)
+                if new_v is not v:
+                    config[k] = new_v
         elif isinstance(config, list):
-            return [self._replace_env_vars(item) for item in config]
-        elif isinstance(config, str) and config.startswith('${') and config.endswith('}'):
-            env_var = config[2:-1]
-            value = os.getenv(env_var)
-            if value is None:
-                raise ValueError(f"Environment variable not found: {env_var}")
-            return value
-            env_var = config[2:-1]
-            value = os.getenv(env_var)
-            if value is None:
-                raise ValueError(f"Environment variable not found: {env_var}")
-            return value
+            for i, item in enumerate(config):
+                new_item = self._replace_env_vars(item)
+                if new_item is not item:
+                    config[i] = new_item
+        elif isinstance(config, str) and '${' in config:
+            match = _ENV_VAR_RE.match(config)
+            if match:
+                env_var = match.group(1)
+                value = os.getenv(env_var)
+                if value is None:
+                    raise ValueError(f"Environment variable not found: {env_var}")
+                return value
         return config
     
     def get_path(self, config_name: str, *path_keys: str) -> Path:
@@ -18,7 +18,7 @@ import spike_tab as s_tab
 
 # 4. 프로젝트 유틸 / 설정
 from utils.dashboard_config import get_config
-from utils.constants import DisplayNames
+from utils.constants import ColumnNames, DisplayNames
 from dashboard.utils.custom_css import apply_custom_css
 
 # 커스텀 CSS 적용
@@ -40,11 +40,33 @@ st.set_page_config(
 
 # ==================== 데이터 로딩 ====================
 
-@st.cache_data
+# 대시보드 탭(overview/eda/spike/cluster)과 BaselineAggregator가 실제로 읽는 컬럼
+# 메모리 상주 데이터는 이 컬럼만 유지 (MDR 원문 등 대용량 텍스트 컬럼 제외)
+DASHBOARD_COLUMNS = (
+    ColumnNames.MANUFACTURER,
+    ColumnNames.PRODUCT_CODE,
+    ColumnNames.DATE_RECEIVED,
+    ColumnNames.DATE_OCCURRED,
+    ColumnNames.DEFECT_TYPE,
+    ColumnNames.PROBLEM_COMPONENTS,
+    ColumnNames.EVENT_TYPE,
+    ColumnNames.PATIENT_HARM,
+    ColumnNames.DEFECT_CONFIRMED,
+    ColumnNames.UDI_DI,
+    ColumnNames.CLUSTER,
+    "mdr_report_key",
+    "year_month",
+)
+
+
+@st.cache_resource(show_spinner=False)
 def load_maude_data(cache_key: str) -> pl.DataFrame:
     """Silver Stage3 (클러스터링) 데이터 로드
 
     매월 1일에 자동 갱신 (cache_key가 변경되면 캐시 무효화)
+    parquet은 한 번만 읽어 메모리에 올려두고 모든 세션이 공유합니다.
+    위젯이 바뀔 때마다 디스크(S3)를 다시 스캔하지 않도록 하기 위함입니다.
+    서버 수명 동안 상주하므로 DASHBOARD_COLUMNS만 읽어 메모리 사용량을 제한합니다.
 
     Args:
         cache_key: 캐시 키 (예: "2025-01") - 월이 바뀌면 자동 갱신
@@ -57,13 +79,31 @@ def load_maude_data(cache_key: str) -> pl.DataFrame:
 
     if storage_options:
         # S3 경로: 존재 체크 없이 바로 로드
-        return pl.scan_parquet(str(data_path), storage_options=storage_options)
+        lf = pl.scan_parquet(str(data_path), storage_options=storage_options)
     else:
         # 로컬 경로: 존재 체크 후 로드
         if not data_path.exists():
             st.error(f"데이터 파일을 찾을 수 없습니다: {data_path}")
             st.stop()
-        return pl.scan_parquet(data_path)
+        lf = pl.scan_parquet(data_path)
+
+    # 파일에 있는 컬럼만 선택 (year_month 등 구버전 파일에 없는 컬럼은 건너뜀)
+    schema = lf.collect_schema()
+    columns = [col for col in DASHBOARD_COLUMNS if col in schema]
+
+    # 제조사/제품군은 모든 is_in, group_by, unique에 쓰이므로 Categorical로 사전 인코딩
+    # (문자열 해싱 대신 u32 코드 비교, 메모리 절감)
+    # manufacturer_product 조합은 필터 후 Utf8로 생성되어 하위 pandas/plotly 코드와 호환 유지
+    return (
+        lf
+        .select(columns)
+        .with_columns(
+            pl.col(ColumnNames.MANUFACTURER).cast(pl.Categorical),
+            pl.col(ColumnNames.PRODUCT_CODE).cast(pl.Categorical),
+        )
+        .collect()
+        .rechunk()
+    )
 
 # 세션 상태 초기화
 if 'TODAY' not in st.session_state:
@@ -75,7 +115,8 @@ cache_key = st.session_state.TODAY.strftime("%Y-%m")
 
 if 'data' not in st.session_state:
     with st.spinner("데이터 로딩 중..."):
-        st.session_state.data = load_maude_data(cache_key)
+        # 메모리에 올린 DataFrame을 LazyFrame으로 감싸 하위 함수는 그대로 쿼리 최적화 사용
+        st.session_state.data = load_maude_data(cache_key).lazy()
 
 TODAY = st.session_state.TODAY
 maude_lf = st.session_state.data
@@ -115,7 +156,10 @@ from utils.constants import ColumnNames
 from utils.data_utils import get_year_month_expr
 
 # year_month 표현식 생성 (공통)
-year_month_expr = get_year_month_expr(maude_lf, ColumnNames.DATE_RECEIVED)
+# 날짜 컬럼 타입 확인에 스키마 조회가 필요하므로, 세션 데이터와 같은 수명으로 한 번만 생성
+if 'year_month_expr' not in st.session_state:
+    st.session_state.year_month_expr = get_year_month_expr(maude_lf, ColumnNames.DATE_RECEIVED)
+year_month_expr = st.session_state.year_month_expr
 
 # 공통 필터 옵션 로드 (모든 탭에서 사용)
 from dashboard.utils.filter_helpers import (
@@ -127,7 +171,8 @@ from dashboard.utils.filter_helpers import (
 _, available_manufacturers, available_products = get_available_filters(
     maude_lf,
     date_col=ColumnNames.DATE_RECEIVED,
-    _year_month_expr=year_month_expr
+    _year_month_expr=year_month_expr,
+    cache_key=cache_key
 )
 
 # 2. 클러스터 (전체 데이터 기준, -1 제외)
@@ -158,7 +203,9 @@ common_dynamic_options = {
     "_cascade_config": {
         "products": {
             "depends_on": "manufacturers",
-            "data_source": maude_lf
+            "data_source": maude_lf,
+            # 인접 맵 캐시를 get_available_filters와 같은 데이터 스냅샷에 맞춤
+            "cache_key": cache_key
         },
         "devices": {
             "depends_on": ["manufacturers", "products"],
@@ -228,4 +275,4 @@ elif current_tab == "cluster":
 
 # ==================== 푸터 ====================
 st.markdown("---")
-st.caption(f"최종 업데이트: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | 버전: 1.0.0")
\ No newline at end of file
+st.caption(f"최종 업데이트: {TODAY.strftime('%Y-%m-%d %H:%M:%S')} | 버전: 1.0.0")
\ No newline at end of file
@@ -13,7 +13,8 @@ from dashboard.utils.ui_components import (
     convert_date_range_to_months,
     create_harm_pie_chart,
     create_defect_confirmed_pie_chart,
-    create_horizontal_bar_chart
+    create_horizontal_bar_chart,
+    render_html_metrics_row
 )
 
 
@@ -57,8 +58,17 @@ def show(filters=None, lf: pl.LazyFrame = None):
         clusters=clusters
     )
 
-    # year_month 표현식 생성 (재사용)
-    year_month_expr = get_year_month_expr(filtered_lf, ColumnNames.DATE_RECEIVED)
+    # year_month 표현식 (공통 필터는 스키마를 바꾸지 않으므로 Home.py에서 만든 것을 재사용)
+    year_month_expr = st.session_state.get("year_month_expr")
+    if year_month_expr is None:
+        year_month_expr = get_year_month_expr(filtered_lf, ColumnNames.DATE_RECEIVED)
+
+    # cluster_check 캐시 키: filtered_lf에 반영된 공통 필터 전체
+    # (_lf는 해시되지 않으므로 필터 값이 키에 없으면 이전 결과가 재사용됨)
+    filter_key = tuple(
+        tuple(values) if values else ()
+        for values in (manufacturers, products, devices, defect_types, clusters)
+    )
 
     # ==================== 사용 가능한 클러스터 목록 가져오기 ====================
     with st.spinner("클러스터 목록 로딩 중..."):
@@ -94,8 +104,7 @@ def show(filters=None, lf: pl.LazyFrame = None):
         available_clusters,
         selected_dates,
         year_month_expr,
-        manufacturers,
-        products
+        filter_key
     )
     st.markdown("---")
 
@@ -113,8 +122,7 @@ def show(filters=None, lf: pl.LazyFrame = None):
             available_clusters,
             selected_dates,
             year_month_expr,
-            manufacturers,
-            products
+            filter_key
         )
 
     # ==================== 탭 2: 클러스터 간 비교 ====================
@@ -124,8 +132,7 @@ def show(filters=None, lf: pl.LazyFrame = None):
             available_clusters,
             selected_dates,
             year_month_expr,
-            manufacturers,
-            products
+            filter_key
         )
 
     # ==================== 탭 3: 전체 클러스터 개요 ====================
@@ -135,12 +142,140 @@ def show(filters=None, lf: pl.LazyFrame = None):
             available_clusters,
             selected_dates,
             year_month_expr,
-            manufacturers,
-            products
+            filter_key
+        )
+
+
+def _get_cluster_data(lf, cluster_id, selected_dates, year_month_expr, top_n, filter_key):
+    """클러스터 분석 데이터 조회 (캐시된 cluster_check 호출)"""
+    return cluster_check(
+        _lf=lf,
+        cluster_name=cluster_id,
+        cluster_col=ColumnNames.CLUSTER,
+        component_col=ColumnNames.PROBLEM_COMPONENTS,
+        event_col=ColumnNames.PATIENT_HARM,
+        date_col=ColumnNames.DATE_RECEIVED,
+        selected_dates=selected_dates,
+        selected_manufacturers=None,
+        selected_products=None,
+        top_n=top_n,
+        _year_month_expr=year_month_expr,
+        filter_key=filter_key
+    )
+
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def _build_bar_figure(_df, content_hash, category_col, top_n, colorscale):
+    """수평 막대 차트 생성 (표 내용 해시로 캐시)
+
+    기간/클러스터가 바뀌어도 상위 항목 표가 같으면 이전 Figure를 그대로 재사용한다.
+    """
+    fig = create_horizontal_bar_chart(
+        df=_df,
+        category_col=category_col,
+        count_col='count',
+        ratio_col='ratio',
+        top_n=top_n,
+        xaxis_title=Terms.KOREAN.REPORT_COUNT,
+        yaxis_title=None,  # y축 제목 없음 (항목명이 이미 y축에 표시됨)
+        colorscale=colorscale
+    )
+    if fig is not None:
+        fig.update_layout(uirevision=content_hash)
+    return fig
+
+
+def _frame_hash(df: pl.DataFrame) -> int:
+    """작은 결과 표의 내용 해시 (행 순서 포함)"""
+    return hash(tuple(df.hash_rows().to_list()))
+
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def _build_individual_figures(_cluster_data, cluster_id, selected_dates, top_n, filter_key):
+    """개별 클러스터 분석 차트 생성 (Figure 객체 캐시)
+
+    Figure는 cluster_data로만 결정되고, cluster_data는 cluster_check의 캐시 키
+    (cluster_id, selected_dates, top_n, filter_key)로 결정되므로 같은 키로 캐시한다.
+    _cluster_data는 해시하지 않는다.
+
+    Returns:
+        {'pie', 'bar', 'defect', 'confirmed', 'line'}: 데이터가 없으면 None
+    """
+    figures = dict.fromkeys(['pie', 'bar', 'defect', 'confirmed', 'line'])
+
+    # 환자 피해 분포
+    fig_pie = create_harm_pie_chart(_cluster_data.harm_summary, height=400, show_legend=True)
+    if fig_pie:
+        fig_pie.update_traces(
+            textposition='inside',  # 라벨을 파이 안쪽에 배치
+            textinfo='percent+label'  # 퍼센트와 라벨 표시
+        )
+    figures['pie'] = fig_pie
+
+    # 상위 부품
+    top_components = _cluster_data.top_components
+    if not top_components.is_empty():
+        figures['bar'] = _build_bar_figure(
+            top_components, _frame_hash(top_components),
+            ColumnNames.PROBLEM_COMPONENTS, top_n, 'Blues'
+        )
+
+    # 결함 유형
+    defect_types = _cluster_data.defect_types
+    if not defect_types.is_empty():
+        figures['defect'] = _build_bar_figure(
+            defect_types, _frame_hash(defect_types),
+            ColumnNames.DEFECT_TYPE, top_n, 'Oranges'
+        )
+
+    # 결함 확정
+    defect_confirmed = _cluster_data.defect_confirmed
+    if not defect_confirmed.is_empty():
+        figures['confirmed'] = create_defect_confirmed_pie_chart(
+            defect_confirmed_df=defect_confirmed,
+            defect_col=ColumnNames.DEFECT_CONFIRMED,
+            count_col='count',
+            height=400,
+            show_legend=True
+        )
+
+    # 월별 추이
+    time_series = _cluster_data.time_series
+    if not time_series.is_empty():
+        fig_line = px.line(
+            time_series,
+            x='year_month',
+            y='count',
+            markers=True,
+            labels={'year_month': '년-월', 'count': '발생 건수'}
+        )
+
+        fig_line.update_traces(
+            line_color=ChartStyles.PRIMARY_COLOR,
+            line_width=3,
+            marker=dict(size=8)
+        )
+
+        fig_line.update_layout(
+            height=400,
+            margin=dict(l=20, r=20, t=20, b=80),
+            hovermode='x unified',
+            xaxis_tickangle=-45
         )
+        figures['line'] = fig_line
 
+    # 같은 클러스터를 다시 그릴 때는 줌/범례 선택 등 사용자 조작 상태 유지
+    # (막대 차트는 내용 기준으로 공유되므로 _build_bar_figure에서 설정)
+    for name in ('pie', 'confirmed', 'line'):
+        if figures[name] is not None:
+            figures[name].update_layout(uirevision=cluster_id)
 
-def render_individual_cluster_analysis(lf, available_clusters, selected_dates, year_month_expr, manufacturers, products):
+    return figures
+
+
+# 클러스터/Top N 선택 시 이 섹션만 재실행 (인사이트·다른 탭 차트 재계산 생략)
+@st.fragment
+def render_individual_cluster_analysis(lf, available_clusters, selected_dates, year_month_expr, filter_key):
     """개별 클러스터 상세 분석"""
     st.markdown("### 🔍 개별 클러스터 상세 분석")
     st.caption(f"특정 클러스터의 {Terms.KOREAN.PATIENT_HARM}, {Terms.KOREAN.PROBLEM_COMPONENT}, 시계열 추이를 분석합니다")
@@ -188,48 +323,43 @@ def render_individual_cluster_analysis(lf, available_clusters, selected_dates, y
     st.markdown("---")
 
     # 클러스터 분석 실행
-    with st.spinner(f"Cluster {selected_cluster} 분석 중..."):
-        cluster_data = cluster_check(
-            _lf=lf,
-            cluster_name=selected_cluster,
-            cluster_col=ColumnNames.CLUSTER,
-            component_col=ColumnNames.PROBLEM_COMPONENTS,
-            event_col=ColumnNames.PATIENT_HARM,
-            date_col=ColumnNames.DATE_RECEIVED,
-            selected_dates=selected_dates,
-            selected_manufacturers=None,
-            selected_products=None,
-            top_n=top_n,
-            _year_month_expr=year_month_expr,
-            manufacturers=tuple(manufacturers) if manufacturers else (),
-            products=tuple(products) if products else ()
-        )
+    # 입력이 직전 실행과 같으면 (다른 위젯으로 인한 재실행) 세션에 보관한 결과를 그대로 사용해
+    # 캐시 키 해시/조회도 생략
+    render_key = (selected_cluster, top_n, tuple(selected_dates), filter_key)
+    last = st.session_state.get("_individual_cluster_result")
+    if last is not None and last[0] == render_key:
+        cluster_data, figures = last[1]
+    else:
+        with st.spinner(f"Cluster {selected_cluster} 분석 중..."):
+            cluster_data = _get_cluster_data(lf, selected_cluster, selected_dates, year_month_expr, top_n, filter_key)
+            figures = _build_individual_figures(cluster_data, selected_cluster, selected_dates, top_n, filter_key)
+        st.session_state["_individual_cluster_result"] = (render_key, (cluster_data, figures))
 
     # ==================== 1. 전체 요약 메트릭 ====================
     st.subheader(f"📊 Cluster {selected_cluster} 요약")
 
     col1, col2, col3, col4, col5 = st.columns(5)
     with col1:
-        st.metric("전체 케이스", f"{cluster_data['total_count']:,}")
+        st.metric("전체 케이스", f"{cluster_data.total_count:,}")
     with col2:
         # 치명률 (사망 + 중증부상)
-        death_count = cluster_data['harm_summary']['total_deaths']
-        serious_count = cluster_data['harm_summary']['total_serious_injuries']
+        death_count = cluster_data.deaths
+        serious_count = cluster_data.serious_injuries
         severe_harm_count = death_count + serious_count
-        cfr = (severe_harm_count / cluster_data['total_count'] * 100) if cluster_data['total_count'] > 0 else 0
+        cfr = (severe_harm_count / cluster_data.total_count * 100) if cluster_data.total_count > 0 else 0
         st.metric("치명률 (CFR)", f"{cfr:.2f}%",
                   delta=f"{severe_harm_count:,}건", delta_color="inverse")
     with col3:
-        death_rate = (death_count / cluster_data['total_count'] * 100) if cluster_data['total_count'] > 0 else 0
+        death_rate = (death_count / cluster_data.total_count * 100) if cluster_data.total_count > 0 else 0
         st.metric(Terms.KOREAN.DEATH_COUNT, f"{death_count:,}",
                   delta=f"{death_rate:.2f}%", delta_color="inverse")
     with col4:
-        serious_rate = (serious_count / cluster_data['total_count'] * 100) if cluster_data['total_count'] > 0 else 0
+        serious_rate = (serious_count / cluster_data.total_count * 100) if cluster_data.total_count > 0 else 0
         st.metric(Terms.KOREAN.SERIOUS_INJURY, f"{serious_count:,}",
                   delta=f"{serious_rate:.2f}%", delta_color="inverse")
     with col5:
-        minor_count = cluster_data['harm_summary']['total_minor_injuries']
-        minor_rate = (minor_count / cluster_data['total_count'] * 100) if cluster_data['total_count'] > 0 else 0
+        minor_count = cluster_data.minor_injuries
+        minor_rate = (minor_count / cluster_data.total_count * 100) if cluster_data.total_count > 0 else 0
         st.metric(Terms.KOREAN.MINOR_INJURY, f"{minor_count:,}",
                   delta=f"{minor_rate:.2f}%", delta_color="inverse")
 
@@ -241,42 +371,23 @@ def render_individual_cluster_analysis(lf, available_clusters, selected_dates, y
     with col_left:
         st.markdown(f"#### 🎯 {Terms.KOREAN.PATIENT_HARM} 분포")
 
-        harm_summary = cluster_data['harm_summary']
-
-        # 공통 함수 사용
-        fig_pie = create_harm_pie_chart(harm_summary, height=400, show_legend=True)
-    
-        # 라벨 위치 조정 (선택사항)
-        fig_pie.update_traces(
-            textposition='inside',  # 라벨을 파이 안쪽에 배치
-            textinfo='percent+label'  # 퍼센트와 라벨 표시
-        )
+        fig_pie = figures['pie']
 
         if fig_pie:
-            st.plotly_chart(fig_pie, width='stretch', config={'displayModeBar': False})
+            st.plotly_chart(fig_pie, width='stretch', config={'displayModeBar': False}, key='cluster_pie')
         else:
             st.info(f"{Terms.KOREAN.PATIENT_HARM} 데이터가 없습니다.")
 
     with col_right:
         st.markdown(f"#### 🔧 상위 {top_n}개 {Terms.KOREAN.PROBLEM_COMPONENT}")
 
-        top_components = cluster_data['top_components']
-
-        # 공통 함수 사용
-        if len(top_components) > 0:
-            fig_bar = create_horizontal_bar_chart(
-                df=top_components,
-                category_col=ColumnNames.PROBLEM_COMPONENTS,
-                count_col='count',
-                ratio_col='ratio',
-                top_n=top_n,
-                xaxis_title=Terms.KOREAN.REPORT_COUNT,
-                yaxis_title=None,  # y축 제목 없음 (부품명이 이미 y축에 표시됨)
-                colorscale='Blues'
-            )
+        top_components = cluster_data.top_components
+
+        if not top_components.is_empty():
+            fig_bar = figures['bar']
 
             if fig_bar:
-                st.plotly_chart(fig_bar, width='stretch', config={'displayModeBar': False})
+                st.plotly_chart(fig_bar, width='stretch', config={'displayModeBar': False}, key='cluster_bar')
 
             # 상세 데이터 - 컬럼명 한글로 변경
             with st.expander(f"📋 {Terms.KOREAN.DATA_TABLE}"):
@@ -310,23 +421,13 @@ def render_individual_cluster_analysis(lf, available_clusters, selected_dates, y
     with col_defect:
         st.markdown(f"#### 🔍 상위 {top_n}개 {Terms.KOREAN.DEFECT_TYPE}")
 
-        defect_types = cluster_data['defect_types']
-
-        if len(defect_types) > 0:
-            # 공통 함수 사용
-            fig_defect = create_horizontal_bar_chart(
-                df=defect_types,
-                category_col=ColumnNames.DEFECT_TYPE,
-                count_col='count',
-                ratio_col='ratio',
-                top_n=top_n,
-                xaxis_title=Terms.KOREAN.REPORT_COUNT,
-                yaxis_title=None,  # y축 제목 없음
-                colorscale='Oranges'
-            )
+        defect_types = cluster_data.defect_types
+
+        if not defect_types.is_empty():
+            fig_defect = figures['defect']
 
             if fig_defect:
-                st.plotly_chart(fig_defect, width='stretch', config={'displayModeBar': False})
+                st.plotly_chart(fig_defect, width='stretch', config={'displayModeBar': False}, key='cluster_defect')
 
             with st.expander(f"📋 {Terms.KOREAN.DATA_TABLE}"):
                 # 컬럼명 한글로 변경
@@ -353,20 +454,13 @@ def render_individual_cluster_analysis(lf, available_clusters, selected_dates, y
     with col_confirmed:
         st.markdown(f"#### ✅ {Terms.KOREAN.DEFECT_CONFIRMED} 분포")
 
-        defect_confirmed = cluster_data['defect_confirmed']
+        defect_confirmed = cluster_data.defect_confirmed
 
-        if len(defect_confirmed) > 0:
-            # 전용 파이 차트 함수 사용
-            fig_confirmed = create_defect_confirmed_pie_chart(
-                defect_confirmed_df=defect_confirmed,
-                defect_col=ColumnNames.DEFECT_CONFIRMED,
-                count_col='count',
-                height=400,
-                show_legend=True
-            )
+        if not defect_confirmed.is_empty():
+            fig_confirmed = figures['confirmed']
 
             if fig_confirmed:
-                st.plotly_chart(fig_confirmed, width='stretch', config={'displayModeBar': False})
+                st.plotly_chart(fig_confirmed, width='stretch', config={'displayModeBar': False}, key='cluster_confirmed')
 
             with st.expander("📋 상세 데이터"):
                 # 컬럼명 한글로 변경
@@ -391,48 +485,34 @@ def render_individual_cluster_analysis(lf, available_clusters, selected_dates, y
     # ==================== 4. 시계열 분석 ====================
     st.markdown("#### 📈 월별 발생 추이")
 
-    time_series = cluster_data['time_series']
-
-    if len(time_series) > 0:
-        fig_line = px.line(
-            time_series,
-            x='year_month',
-            y='count',
-            markers=True,
-            labels={'year_month': '년-월', 'count': '발생 건수'}
-        )
+    time_series = cluster_data.time_series
 
-        fig_line.update_traces(
-            line_color=ChartStyles.PRIMARY_COLOR,
-            line_width=3,
-            marker=dict(size=8)
-        )
+    if not time_series.is_empty():
+        fig_line = figures['line']
 
-        fig_line.update_layout(
-            height=400,
-            margin=dict(l=20, r=20, t=20, b=80),
-            hovermode='x unified',
-            xaxis_tickangle=-45
-        )
+        st.plotly_chart(fig_line, width='stretch', config={'displayModeBar': False}, key='cluster_line')
 
-        st.plotly_chart(fig_line, width='stretch', config={'displayModeBar': False})
+        # 통계 요약 (한 번의 select로 네 가지 집계)
+        mean_count, max_count, min_count, std_dev = time_series.select(
+            pl.col('count').mean(),
+            pl.col('count').max().alias('max'),
+            pl.col('count').min().alias('min'),
+            pl.col('count').std().alias('std')
+        ).row(0)
 
-        # 통계 요약
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("평균 월별 발생", f"{time_series['count'].mean():.2f}")
-        with col2:
-            st.metric("최대 월별 발생", f"{time_series['count'].max()}")
-        with col3:
-            st.metric("최소 월별 발생", f"{time_series['count'].min()}")
-        with col4:
-            std_dev = time_series['count'].std()
-            st.metric("표준편차", f"{std_dev:.2f}" if std_dev is not None else "N/A")
+        render_html_metrics_row([
+            {"label": "평균 월별 발생", "value": f"{mean_count:.2f}"},
+            {"label": "최대 월별 발생", "value": f"{max_count}"},
+            {"label": "최소 월별 발생", "value": f"{min_count}"},
+            {"label": "표준편차", "value": f"{std_dev:.2f}" if std_dev is not None else "N/A"}
+        ])
     else:
         st.info("시계열 데이터가 없습니다.")
 
 
-def render_cluster_comparison(lf, available_clusters, selected_dates, year_month_expr, manufacturers, products):
+# 비교 대상 선택 시 이 섹션만 재실행
+@st.fragment
+def render_cluster_comparison(lf, available_clusters, selected_dates, year_month_expr, filter_key):
     """클러스터 간 비교 분석"""
     st.markdown("### ⚖️ 클러스터 간 비교")
     st.caption("두 클러스터의 특성을 나란히 비교합니다")
@@ -489,25 +569,9 @@ def render_cluster_comparison(lf, available_clusters, selected_dates, year_month
 
     # 두 클러스터 데이터 로드
     with st.spinner("클러스터 비교 데이터 로딩 중..."):
-        data_a = cluster_check(
-            _lf=lf, cluster_name=cluster_a, cluster_col=ColumnNames.CLUSTER,
-            component_col=ColumnNames.PROBLEM_COMPONENTS, event_col=ColumnNames.PATIENT_HARM,
-            date_col=ColumnNames.DATE_RECEIVED, selected_dates=selected_dates,
-            selected_manufacturers=None, selected_products=None,
-            top_n=top_n, _year_month_expr=year_month_expr,
-            manufacturers=tuple(manufacturers) if manufacturers else (),
-            products=tuple(products) if products else ()
-        )
+        data_a = _get_cluster_data(lf, cluster_a, selected_dates, year_month_expr, top_n, filter_key)
 
-        data_b = cluster_check(
-            _lf=lf, cluster_name=cluster_b, cluster_col=ColumnNames.CLUSTER,
-            component_col=ColumnNames.PROBLEM_COMPONENTS, event_col=ColumnNames.PATIENT_HARM,
-            date_col=ColumnNames.DATE_RECEIVED, selected_dates=selected_dates,
-            selected_manufacturers=None, selected_products=None,
-            top_n=top_n, _year_month_expr=year_month_expr,
-            manufacturers=tuple(manufacturers) if manufacturers else (),
-            products=tuple(products) if products else ()
-        )
+        data_b = _get_cluster_data(lf, cluster_b, selected_dates, year_month_expr, top_n, filter_key)
 
     # ==================== 1. 요약 비교 ====================
     st.markdown("#### 📊 요약 비교")
@@ -516,15 +580,15 @@ def render_cluster_comparison(lf, available_clusters, selected_dates, year_month
 
     with col1:
         st.markdown(f"**Cluster {cluster_a}**")
-        st.metric(Terms.KOREAN.TOTAL_CASES, f"{data_a['total_count']:,}")
-        st.metric(Terms.KOREAN.DEATH_COUNT, f"{data_a['harm_summary']['total_deaths']:,}")
-        st.metric(Terms.KOREAN.SERIOUS_INJURY, f"{data_a['harm_summary']['total_serious_injuries']:,}")
+        st.metric(Terms.KOREAN.TOTAL_CASES, f"{data_a.total_count:,}")
+        st.metric(Terms.KOREAN.DEATH_COUNT, f"{data_a.deaths:,}")
+        st.metric(Terms.KOREAN.SERIOUS_INJURY, f"{data_a.serious_injuries:,}")
 
     with col2:
         st.markdown(f"**Cluster {cluster_b}**")
-        st.metric(Terms.KOREAN.TOTAL_CASES, f"{data_b['total_count']:,}")
-        st.metric(Terms.KOREAN.DEATH_COUNT, f"{data_b['harm_summary']['total_deaths']:,}")
-        st.metric(Terms.KOREAN.SERIOUS_INJURY, f"{data_b['harm_summary']['total_serious_injuries']:,}")
+        st.metric(Terms.KOREAN.TOTAL_CASES, f"{data_b.total_count:,}")
+        st.metric(Terms.KOREAN.DEATH_COUNT, f"{data_b.deaths:,}")
+        st.metric(Terms.KOREAN.SERIOUS_INJURY, f"{data_b.serious_injuries:,}")
 
     st.markdown("---")
 
@@ -538,14 +602,8 @@ def render_cluster_comparison(lf, available_clusters, selected_dates, year_month
     )
 
     # Cluster A 파이 차트
-    harm_a = data_a['harm_summary']
     labels_a = [Terms.KOREAN.DEATH_COUNT, Terms.KOREAN.SERIOUS_INJURY, Terms.KOREAN.MINOR_INJURY, Terms.KOREAN.NO_HARM]
-    values_a = [
-        harm_a['total_deaths'],
-        harm_a['total_serious_injuries'],
-        harm_a['total_minor_injuries'],
-        harm_a['total_no_injuries']
-    ]
+    values_a = [data_a.deaths, data_a.serious_injuries, data_a.minor_injuries, data_a.no_injuries]
 
     fig.add_trace(go.Pie(
         labels=labels_a,
@@ -555,13 +613,7 @@ def render_cluster_comparison(lf, available_clusters, selected_dates, year_month
     ), row=1, col=1)
 
     # Cluster B 파이 차트
-    harm_b = data_b['harm_summary']
-    values_b = [
-        harm_b['total_deaths'],
-        harm_b['total_serious_injuries'],
-        harm_b['total_minor_injuries'],
-        harm_b['total_no_injuries']
-    ]
+    values_b = [data_b.deaths, data_b.serious_injuries, data_b.minor_injuries, data_b.no_injuries]
 
     fig.add_trace(go.Pie(
         labels=labels_a,
@@ -578,8 +630,8 @@ def render_cluster_comparison(lf, available_clusters, selected_dates, year_month
     # ==================== 3. 상위 부품 비교 ====================
     st.markdown("#### 🔧 상위 부품 비교")
 
-    components_a = data_a['top_components'].to_pandas()
-    components_b = data_b['top_components'].to_pandas()
+    components_a = data_a.top_components.to_pandas()
+    components_b = data_b.top_components.to_pandas()
 
     if len(components_a) > 0 and len(components_b) > 0:
         # 공통 부품 찾기
@@ -643,8 +695,8 @@ def render_cluster_comparison(lf, available_clusters, selected_dates, year_month
     # ==================== 4. 결함 유형 비교 ====================
     st.markdown(f"#### 🔍 {Terms.KOREAN.DEFECT_TYPE} 비교")
 
-    defect_a = data_a['defect_types'].to_pandas()
-    defect_b = data_b['defect_types'].to_pandas()
+    defect_a = data_a.defect_types.to_pandas()
+    defect_b = data_b.defect_types.to_pandas()
 
     if len(defect_a) > 0 and len(defect_b) > 0:
         col1, col2 = st.columns(2)
@@ -700,8 +752,8 @@ def render_cluster_comparison(lf, available_clusters, selected_dates, year_month
     # ==================== 5. 결함 확정 비교 ====================
     st.markdown(f"#### ✅ {Terms.KOREAN.DEFECT_CONFIRMED} 비교")
 
-    confirmed_a = data_a['defect_confirmed'].to_pandas()
-    confirmed_b = data_b['defect_confirmed'].to_pandas()
+    confirmed_a = data_a.defect_confirmed.to_pandas()
+    confirmed_b = data_b.defect_confirmed.to_pandas()
 
     if len(confirmed_a) > 0 and len(confirmed_b) > 0:
         fig_confirmed = make_subplots(
@@ -767,7 +819,9 @@ def render_cluster_comparison(lf, available_clusters, selected_dates, year_month
         st.info(f"{Terms.KOREAN.DEFECT_CONFIRMED} 데이터가 부족합니다.")
 
 
-def render_cluster_overview(lf, available_clusters, selected_dates, year_month_expr, manufacturers, products):
+# Defect Type 선택 시 이 섹션만 재실행
+@st.fragment
+def render_cluster_overview(lf, available_clusters, selected_dates, year_month_expr, filter_key):
     """전체 클러스터 개요"""
     st.markdown("### 🌐 전체 클러스터 개요")
     st.caption("모든 클러스터의 전체적인 분포와 특성을 한눈에 확인합니다")
@@ -796,35 +850,27 @@ def render_cluster_overview(lf, available_clusters, selected_dates, year_month_e
         all_cluster_data = []
 
         for cluster_id in available_clusters:
-            data = cluster_check(
-                _lf=lf, cluster_name=cluster_id, cluster_col=ColumnNames.CLUSTER,
-                component_col=ColumnNames.PROBLEM_COMPONENTS, event_col=ColumnNames.PATIENT_HARM,
-                date_col=ColumnNames.DATE_RECEIVED, selected_dates=selected_dates,
-                selected_manufacturers=None, selected_products=None,
-                top_n=5, _year_month_expr=year_month_expr,
-                manufacturers=tuple(manufacturers) if manufacturers else (),
-                products=tuple(products) if products else ()
-            )
+            data = _get_cluster_data(lf, cluster_id, selected_dates, year_month_expr, 5, filter_key)
 
             # Defect Confirmed 통계
-            defect_confirmed = data['defect_confirmed']
-            confirmed_yes = defect_confirmed.filter(pl.col(ColumnNames.DEFECT_CONFIRMED) == '결함 있음')['count'].sum() if len(defect_confirmed) > 0 else 0
-            confirmed_no = defect_confirmed.filter(pl.col(ColumnNames.DEFECT_CONFIRMED) == '결함 없음')['count'].sum() if len(defect_confirmed) > 0 else 0
-            confirmed_unknown = defect_confirmed.filter(pl.col(ColumnNames.DEFECT_CONFIRMED) == '알 수 없음')['count'].sum() if len(defect_confirmed) > 0 else 0
+            defect_confirmed = data.defect_confirmed
+            confirmed_yes = defect_confirmed.filter(pl.col(ColumnNames.DEFECT_CONFIRMED) == '결함 있음')['count'].sum() if not defect_confirmed.is_empty() else 0
+            confirmed_no = defect_confirmed.filter(pl.col(ColumnNames.DEFECT_CONFIRMED) == '결함 없음')['count'].sum() if not defect_confirmed.is_empty() else 0
+            confirmed_unknown = defect_confirmed.filter(pl.col(ColumnNames.DEFECT_CONFIRMED) == '알 수 없음')['count'].sum() if not defect_confirmed.is_empty() else 0
 
             # Defect Type 통계 - 상위 5개 결함 유형 추출
-            defect_types = data['defect_types']
+            defect_types = data.defect_types
             defect_type_dict = {}
             for row in defect_types.iter_rows(named=True):
                 defect_type_dict[row[ColumnNames.DEFECT_TYPE]] = row['count']
 
             all_cluster_data.append({
                 'cluster': cluster_id,
-                'total_count': data['total_count'],
-                'deaths': data['harm_summary']['total_deaths'],
-                'serious_injuries': data['harm_summary']['total_serious_injuries'],
-                'minor_injuries': data['harm_summary']['total_minor_injuries'],
-                'no_harm': data['harm_summary']['total_no_injuries'],
+                'total_count': data.total_count,
+                'deaths': data.deaths,
+                'serious_injuries': data.serious_injuries,
+                'minor_injuries': data.minor_injuries,
+                'no_harm': data.no_injuries,
                 'defect_confirmed_yes': confirmed_yes,
                 'defect_confirmed_no': confirmed_no,
                 'defect_confirmed_unknown': confirmed_unknown,
@@ -1073,7 +1119,7 @@ def render_cluster_overview(lf, available_clusters, selected_dates, year_month_e
         )
 
 
-def render_cluster_insights(lf, available_clusters, selected_dates, year_month_expr, manufacturers, products):
+def render_cluster_insights(lf, available_clusters, selected_dates, year_month_expr, filter_key):
     """자동 인사이트 생성 (terminology 기반)"""
     from dashboard.utils.terminology import get_term_manager
 
@@ -1086,30 +1132,22 @@ def render_cluster_insights(lf, available_clusters, selected_dates, year_month_e
         # 모든 클러스터 데이터 수집
         all_data = []
         for cluster_id in available_clusters:
-            data = cluster_check(
-                _lf=lf, cluster_name=cluster_id, cluster_col=ColumnNames.CLUSTER,
-                component_col=ColumnNames.PROBLEM_COMPONENTS, event_col=ColumnNames.PATIENT_HARM,
-                date_col=ColumnNames.DATE_RECEIVED, selected_dates=selected_dates,
-                selected_manufacturers=None, selected_products=None,
-                top_n=10, _year_month_expr=year_month_expr,
-                manufacturers=tuple(manufacturers) if manufacturers else (),
-                products=tuple(products) if products else ()
-            )
+            data = _get_cluster_data(lf, cluster_id, selected_dates, year_month_expr, 10, filter_key)
             all_data.append((cluster_id, data))
 
         # 1. 가장 큰 클러스터
-        largest_cluster = max(all_data, key=lambda x: x[1]['total_count'])
+        largest_cluster = max(all_data, key=lambda x: x[1].total_count)
         insights.append({
             "type": "info",
             "text": term.format_message('cluster_most_cases',
                                        cluster_id=largest_cluster[0],
-                                       count=largest_cluster[1]['total_count'])
+                                       count=largest_cluster[1].total_count)
         })
 
         # 2. 가장 위험한 클러스터 (치명률 기준: 사망 + 중증부상)
         cfr_rates = [(c_id,
-                      (data['harm_summary']['total_deaths'] + data['harm_summary']['total_serious_injuries']) / data['total_count'] * 100 if data['total_count'] > 0 else 0,
-                      data['harm_summary']['total_deaths'] + data['harm_summary']['total_serious_injuries'])
+                      (data.deaths + data.serious_injuries) / data.total_count * 100 if data.total_count > 0 else 0,
+                      data.deaths + data.serious_injuries)
                      for c_id, data in all_data]
         highest_cfr = max(cfr_rates, key=lambda x: x[1])
 
@@ -1134,8 +1172,8 @@ def render_cluster_insights(lf, available_clusters, selected_dates, year_month_e
         # 4. 공통 문제 부품
         all_components = []
         for c_id, data in all_data:
-            if len(data['top_components']) > 0:
-                top_3 = data['top_components'].head(3)[ColumnNames.PROBLEM_COMPONENTS].to_list()
+            if not data.top_components.is_empty():
+                top_3 = data.top_components.head(3)[ColumnNames.PROBLEM_COMPONENTS].to_list()
                 all_components.extend(top_3)
 
         if all_components:
@@ -1177,7 +1215,7 @@ def render_cluster_insights(lf, available_clusters, selected_dates, year_month_e
         )
 
     # 케이스 수 많은 클러스터
-    if largest_cluster[1]['total_count'] > 100:
+    if largest_cluster[1].total_count > 100:
         recommendations.append(
             term.format_message('cluster_recommendation_large', cluster_id=largest_cluster[0])
         )
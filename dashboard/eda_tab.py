@@ -12,7 +12,6 @@ from utils.filter_helpers import (
 )
 from utils.analysis import (
     get_filtered_products,
-    get_monthly_counts,
     analyze_manufacturer_defects,
     analyze_defect_components,
     calculate_cfr_by_device
@@ -32,6 +31,15 @@ from dashboard.utils.ui_components import (
 
 # 기존 북마크 함수들은 ui_components.py의 render_bookmark_manager로 통합됨
 
+# 환자 피해 파이 차트 항목 (라벨, 색상) - 사망/중증/경증/부상 없음/Unknown 순서
+HARM_PIE_STYLES = (
+    ('사망', '#DC2626'),
+    ('중증 부상', '#F59E0B'),
+    ('경증 부상', '#ffd700'),
+    ('부상 없음', '#2ca02c'),
+    ('Unknown', '#9CA3AF')
+)
+
 
 def show(filters=None, lf: pl.LazyFrame = None):
     """EDA 탭 메인 함수 (전면 리팩토링)
@@ -88,9 +96,11 @@ def show(filters=None, lf: pl.LazyFrame = None):
         st.stop()
 
     try:
-        # 년-월 컬럼 생성 표현식 (재사용)
+        # 년-월 컬럼 생성 표현식 (Home.py에서 세션당 한 번 만든 것을 재사용)
         date_col = ColumnNames.DATE_RECEIVED
-        year_month_expr = get_year_month_expr(lf, date_col)
+        year_month_expr = st.session_state.get("year_month_expr")
+        if year_month_expr is None:
+            year_month_expr = get_year_month_expr(lf, date_col)
 
         # ==================== 스마트 인사이트 (새로 추가) ====================
         render_smart_insights(
@@ -342,16 +352,25 @@ def render_total_reports_chart(
     with st.spinner("데이터 분석 중..."):
         # 모든 필터 적용
         # TODO: devices/clusters/defect_types 지원 추가 필요
-        result_df = get_filtered_products(
+        # 월별 집계 한 번만 스캔하고, 제품별 합계는 메모리에서 계산
+        total_df = get_filtered_products(
             lf,
             date_col=date_col,
             selected_dates=selected_dates if selected_dates else None,
             selected_manufacturers=selected_manufacturers if selected_manufacturers else None,
             selected_products=selected_products if selected_products else None,
-            top_n=top_n,
+            by_month=True,
             _year_month_expr=year_month_expr
         )
 
+        result_df = (
+            total_df
+            .group_by("manufacturer_product")
+            .agg(pl.col("total_count").sum())
+            .sort("total_count", descending=True)
+            .head(top_n)
+        )
+
         if len(result_df) > 0:
             # 비율 계산 추가 (막대 차트용)
             result_df = result_df.with_columns([
@@ -364,22 +383,22 @@ def render_total_reports_chart(
             display_df = display_df[["순위", "manufacturer_product", "total_count"]]
             display_df.columns = ["순위", "제조사-제품군", "보고 건수"]
 
-            # 월별 데이터
-            total_df = get_monthly_counts(
-                lf,
-                date_col=date_col,
-                selected_dates=selected_dates if selected_dates else None,
-                selected_manufacturers=selected_manufacturers if selected_manufacturers else None,
-                selected_products=selected_products if selected_products else None,
-                _year_month_expr=year_month_expr
-            )
-
             if len(total_df) > 0:
-                total_pandas = total_df.to_pandas()
-                top_combinations = display_df.head(top_n)["제조사-제품군"].tolist()
-                chart_data = total_pandas[
-                    total_pandas["manufacturer_product"].isin(top_combinations)
-                ].copy()
+                # 선/영역 차트용: 상위 5개만 Polars에서 년-월 x 제품 형태로 pivot
+                # (월별 전체 결과를 pandas로 변환하지 않고, 빈 월은 0으로 채움)
+                top_5_combinations = result_df.head(5)["manufacturer_product"].to_list()
+                chart_pl = (
+                    total_df
+                    .filter(pl.col("manufacturer_product").is_in(top_5_combinations))
+                    .pivot(
+                        on="manufacturer_product",
+                        index="year_month",
+                        values="total_count",
+                        aggregate_function="first"
+                    )
+                    .fill_null(0)
+                    .sort("year_month")
+                )
 
                 # 차트 타입 선택
                 chart_type = st.radio(
@@ -424,22 +443,13 @@ def render_total_reports_chart(
                         st.plotly_chart(fig, width='stretch', config={'displayModeBar': False})
 
                 elif chart_type == "선 그래프":
-                    # 상위 5개만 선택해서 가독성 확보
-                    top_5_combinations = display_df.head(5)["제조사-제품군"].tolist()
-                    line_chart_data = chart_data[
-                        chart_data["manufacturer_product"].isin(top_5_combinations)
-                    ].copy()
-
+                    # 상위 5개만 표시해서 가독성 확보
                     fig = go.Figure()
 
                     for product in top_5_combinations:
-                        product_data = line_chart_data[
-                            line_chart_data["manufacturer_product"] == product
-                        ].sort_values("year_month")
-
                         fig.add_trace(go.Scatter(
-                            x=product_data["year_month"],
-                            y=product_data["total_count"],
+                            x=chart_pl["year_month"],
+                            y=chart_pl[product],
                             mode='lines+markers',
                             name=product,
                             hovertemplate='<b>%{fullData.name}</b><br>%{x}<br>건수: %{y:,}<extra></extra>'
@@ -466,22 +476,12 @@ def render_total_reports_chart(
                     st.caption("📌 상위 5개 제조사-제품군만 표시됩니다")
 
                 else:  # 영역 차트
-                    # 상위 5개만 선택
-                    top_5_combinations = display_df.head(5)["제조사-제품군"].tolist()
-                    area_chart_data = chart_data[
-                        chart_data["manufacturer_product"].isin(top_5_combinations)
-                    ].copy()
-
                     fig = go.Figure()
 
                     for product in top_5_combinations:
-                        product_data = area_chart_data[
-                            area_chart_data["manufacturer_product"] == product
-                        ].sort_values("year_month")
-
                         fig.add_trace(go.Scatter(
-                            x=product_data["year_month"],
-                            y=product_data["total_count"],
+                            x=chart_pl["year_month"],
+                            y=chart_pl[product],
                             mode='lines',
                             name=product,
                             stackgroup='one',
@@ -1610,66 +1610,49 @@ def render_cluster_and_event_analysis(
                 total_minor = harm_summary['total_minor_injuries']
                 total_none = harm_summary['total_no_injuries']
                 total_unknown = harm_summary.get('total_unknown', 0)
-                total_all = total_deaths + total_serious + total_minor + total_none + total_unknown
+                harm_values = (total_deaths, total_serious, total_minor, total_none, total_unknown)
+                total_all = sum(harm_values)
 
                 if total_all > 0:
-                    # 값이 0보다 큰 항목만 필터링
-                    harm_data = [
-                        ('사망', total_deaths, '#DC2626'),
-                        ('중증 부상', total_serious, '#F59E0B'),
-                        ('경증 부상', total_minor, '#ffd700'),
-                        ('부상 없음', total_none, '#2ca02c'),
-                        ('Unknown', total_unknown, '#9CA3AF')
-                    ]
-
-                    # 값이 0보다 큰 항목만 선택
-                    filtered_harm_data = [(label, value, color) for label, value, color in harm_data if value > 0]
-
-                    if filtered_harm_data:
-                        harm_labels = [item[0] for item in filtered_harm_data]
-                        harm_values = [item[1] for item in filtered_harm_data]
-                        harm_colors = [item[2] for item in filtered_harm_data]
-
-                        # 파이 차트 데이터 준비
-                        pie_data = pd.DataFrame({
-                            '유형': harm_labels,
-                            '건수': harm_values,
-                            '비율': [(v / total_all * 100) for v in harm_values]
-                        })
+                    # 값이 0보다 큰 항목만 한 번에 선택 (라벨, 값, 색상)
+                    # total_all > 0이므로 최소 한 항목은 남음
+                    harm_labels, harm_values, harm_colors = map(list, zip(*(
+                        (label, value, color)
+                        for (label, color), value in zip(HARM_PIE_STYLES, harm_values)
+                        if value > 0
+                    )))
+
+                    # Plotly 파이 차트 생성
+                    fig_pie = go.Figure(data=[go.Pie(
+                        labels=harm_labels,
+                        values=harm_values,
+                        hole=0.4,  # 도넛 차트 스타일
+                        marker=dict(
+                            colors=harm_colors,
+                            line=dict(color='#FFFFFF', width=2)
+                        ),
+                        textinfo='label+percent+value',
+                        texttemplate='%{label}<br>%{value:,}건<br>(%{percent})',
+                        hovertemplate='<b>%{label}</b><br>건수: %{value:,}<br>비율: %{percent}<extra></extra>'
+                    )])
 
-                        # Plotly 파이 차트 생성
-                        fig_pie = go.Figure(data=[go.Pie(
-                            labels=pie_data['유형'],
-                            values=pie_data['건수'],
-                            hole=0.4,  # 도넛 차트 스타일
-                            marker=dict(
-                                colors=harm_colors,
-                                line=dict(color='#FFFFFF', width=2)
-                            ),
-                            textinfo='label+percent+value',
-                            texttemplate='%{label}<br>%{value:,}건<br>(%{percent})',
-                            hovertemplate='<b>%{label}</b><br>건수: %{value:,}<br>비율: %{percent}<extra></extra>'
-                        )])
-
-                        fig_pie.update_layout(
-                            showlegend=True,
-                            legend=dict(
-                                orientation="v",
-                                yanchor="middle",
-                                y=0.5,
-                                xanchor="left",
-                                x=1.05
-                            ),
-                            height=400,
-                            margin=dict(l=20, r=20, t=20, b=20),
-                            paper_bgcolor='white',
-                            plot_bgcolor='white'
-                        )
+                    fig_pie.update_layout(
+                        showlegend=True,
+                        legend=dict(
+                            orientation="v",
+                            yanchor="middle",
+                            y=0.5,
+                            xanchor="left",
+                            x=1.05
+                        ),
+                        height=400,
+                        margin=dict(l=20, r=20, t=20, b=20),
+                        paper_bgcolor='white',
+                        plot_bgcolor='white'
+                    )
 
-                        # 파이 차트 표시
-                        st.plotly_chart(fig_pie, width='stretch', config={'displayModeBar': False})
-                    else:
-                        st.info("환자 피해 데이터가 없습니다.")
+                    # 파이 차트 표시
+                    st.plotly_chart(fig_pie, width='stretch', config={'displayModeBar': False})
 
                     # 요약 정보
                     st.markdown("**전체 요약**")
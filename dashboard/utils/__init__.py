@@ -12,17 +12,18 @@ from .data_utils import (
     get_year_month_expr,
     create_manufacturer_product_combo,
     get_window_dates,
+    get_month_range_bounds,
     apply_basic_filters
 )
 from .filter_helpers import (
     get_available_filters,
+    build_adjacency_maps,
     get_manufacturers_by_dates,
     get_products_by_manufacturers,
     get_available_defect_types
 )
 from .analysis import (
     get_filtered_products,
-    get_monthly_counts,
     analyze_manufacturer_defects,
     analyze_defect_components,
     calculate_cfr_by_device,
@@ -34,12 +35,12 @@ __all__ = [
     'ColumnNames', 'Defaults', 'EventTypes', 'PatientHarmLevels', 'ChartStyles',
     # Data utils
     'get_year_month_expr', 'create_manufacturer_product_combo',
-    'get_window_dates', 'apply_basic_filters',
+    'get_window_dates', 'get_month_range_bounds', 'apply_basic_filters',
     # Filter helpers
-    'get_available_filters', 'get_manufacturers_by_dates',
+    'get_available_filters', 'build_adjacency_maps', 'get_manufacturers_by_dates',
     'get_products_by_merchants', 'get_available_defect_types',
     # Analysis
-    'get_filtered_products', 'get_monthly_counts',
+    'get_filtered_products',
     'analyze_manufacturer_defects', 'analyze_defect_components',
     'calculate_cfr_by_device', 'calculate_big_numbers'
 ]
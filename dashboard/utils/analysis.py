@@ -5,7 +5,7 @@ import polars as pl
 import streamlit as st
 from typing import List, Optional
 from .constants import ColumnNames, PatientHarmLevels,Defaults
-from .data_utils import get_year_month_expr, apply_basic_filters
+from .data_utils import get_year_month_expr, apply_basic_filters, create_manufacturer_product_combo
 from .data_manager import cluster_keyword_unpack
 from src import BaselineAggregator
 from dateutil.relativedelta import relativedelta
@@ -20,10 +20,14 @@ def get_filtered_products(
     selected_manufacturers: Optional[List[str]] = None,
     selected_products: Optional[List[str]] = None,
     top_n: Optional[int] = None,
+    by_month: bool = False,
     _year_month_expr: Optional[pl.Expr] = None
 ) -> pl.DataFrame:
     """제조사-제품군 조합을 필터링하여 이상 사례 발생 수 집계
 
+    by_month=True이면 년-월별로 집계하여 반환합니다. 제품별 합계는 이 결과를
+    메모리에서 다시 group_by하여 얻을 수 있으므로 parquet을 한 번만 스캔합니다.
+
     Args:
         _lf: LazyFrame (언더스코어로 시작하여 캐싱에서 제외)
         manufacturer_col: 제조사 컬럼명
@@ -32,13 +36,15 @@ def get_filtered_products(
         selected_dates: 선택된 년-월 리스트 (예: ['2024-01', '2024-02'])
         selected_manufacturers: 선택된 제조사 리스트
         selected_products: 선택된 제품군 리스트
-        top_n: 상위 N개만 반환 (None이면 전체)
+        top_n: 상위 N개만 반환 (None이면 전체, by_month=True이면 무시)
+        by_month: 년-월별 집계 여부
         _year_month_expr: 년-월 컬럼 생성 표현식 (재사용용, 언더스코어로 시작하여 캐싱에서 제외)
 
     Returns:
         필터링된 결과 DataFrame
+        (by_month=True이면 year_month, manufacturer_product, total_count)
     """
-    # 기본 필터 적용
+    # 기본 필터 적용 (조합 문자열은 집계 후 생성하므로 add_combo=False, null 필터만 직접 추가)
     filtered_lf = apply_basic_filters(
         _lf,
         manufacturer_col=manufacturer_col,
@@ -48,13 +54,30 @@ def get_filtered_products(
         selected_manufacturers=selected_manufacturers,
         selected_products=selected_products,
         year_month_expr=_year_month_expr,
-        add_combo=True
+        add_combo=False,
+        custom_filters=[
+            pl.col(manufacturer_col).is_not_null() & pl.col(product_col).is_not_null()
+        ]
     )
 
+    # (제조사, 제품군) 쌍으로 집계한 뒤, 소수의 결과 행에만 조합 문자열 생성
+    combo_expr = create_manufacturer_product_combo(manufacturer_col, product_col)
+
+    if by_month:
+        # 년-월별, 제조사-제품군별 집계
+        return (
+            filtered_lf
+            .group_by(["year_month", manufacturer_col, product_col])
+            .agg(pl.len().alias("total_count"))
+            .select("year_month", combo_expr, "total_count")
+            .sort(["year_month", "total_count"], descending=[False, True])
+            .collect()
+        )
+
     # 집계
     result = (
         filtered_lf
-        .group_by("manufacturer_product")
+        .group_by([manufacturer_col, product_col])
         .agg(pl.len().alias("total_count"))
         .sort("total_count", descending=True)
     )
@@ -63,58 +86,7 @@ def get_filtered_products(
     if top_n is not None:
         result = result.head(top_n)
 
-    return result.collect()
-
-
-@st.cache_data
-def get_monthly_counts(
-    _lf: pl.LazyFrame,
-    manufacturer_col: str = ColumnNames.MANUFACTURER,
-    product_col: str = ColumnNames.PRODUCT_CODE,
-    date_col: str = ColumnNames.DATE_RECEIVED,
-    selected_dates: Optional[List[str]] = None,
-    selected_manufacturers: Optional[List[str]] = None,
-    selected_products: Optional[List[str]] = None,
-    _year_month_expr: Optional[pl.Expr] = None
-) -> pl.DataFrame:
-    """년-월별로 제조사-제품군 조합의 개수를 집계하여 반환
-
-    Args:
-        _lf: LazyFrame
-        manufacturer_col: 제조사 컬럼명
-        product_col: 제품군(제품코드) 컬럼명
-        date_col: 날짜 컬럼명
-        selected_dates: 선택된 년-월 리스트
-        selected_manufacturers: 선택된 제조사 리스트
-        selected_products: 선택된 제품군 리스트
-        _year_month_expr: 년-월 컬럼 생성 표현식 (재사용용, 언더스코어로 시작하여 캐싱에서 제외)
-
-    Returns:
-        년-월별 집계 DataFrame (year_month, manufacturer_product, total_count)
-    """
-    # 기본 필터 적용
-    filtered_lf = apply_basic_filters(
-        _lf,
-        manufacturer_col=manufacturer_col,
-        product_col=product_col,
-        date_col=date_col,
-        selected_dates=selected_dates,
-        selected_manufacturers=selected_manufacturers,
-        selected_products=selected_products,
-        year_month_expr=_year_month_expr,
-        add_combo=True
-    )
-
-    # 년-월별, 제조사-제품군별 집계
-    result = (
-        filtered_lf
-        .group_by(["year_month", "manufacturer_product"])
-        .agg(pl.len().alias("total_count"))
-        .sort(["year_month", "total_count"], descending=[False, True])
-        .collect()
-    )
-
-    return result
+    return result.select(combo_expr, "total_count").collect()
 
 
 @st.cache_data
@@ -4,11 +4,38 @@
 import polars as pl
 import streamlit as st
 import ast
+from dataclasses import dataclass
 from typing import List, Optional
 from .constants import ColumnNames, Defaults
 from .data_utils import apply_basic_filters
 
 
+@dataclass(slots=True, frozen=True)
+class ClusterResult:
+    """cluster_check 결과 (클러스터 하나의 요약/분포)"""
+    total_count: int
+    deaths: int
+    serious_injuries: int
+    minor_injuries: int
+    no_injuries: int
+    unknown: int
+    top_components: pl.DataFrame
+    time_series: pl.DataFrame
+    defect_types: pl.DataFrame
+    defect_confirmed: pl.DataFrame
+
+    @property
+    def harm_summary(self) -> dict:
+        """환자 피해 요약 (create_harm_pie_chart 입력 형식)"""
+        return {
+            'total_deaths': self.deaths,
+            'total_serious_injuries': self.serious_injuries,
+            'total_minor_injuries': self.minor_injuries,
+            'total_no_injuries': self.no_injuries,
+            'total_unknown': self.unknown
+        }
+
+
 @st.cache_data
 def get_available_clusters(
     _lf: pl.LazyFrame,
@@ -247,7 +274,7 @@ def get_patient_harm_summary(
     }
 
 
-@st.cache_data
+@st.cache_data(ttl=3600, show_spinner=False)
 def cluster_check(
     _lf: pl.LazyFrame,
     cluster_name: int = 0,
@@ -260,9 +287,8 @@ def cluster_check(
     selected_products: Optional[List[str]] = None,
     top_n: int = Defaults.TOP_N,
     _year_month_expr: Optional[pl.Expr] = None,
-    manufacturers: tuple = None,  # Cache key parameter
-    products: tuple = None,       # Cache key parameter
-) -> dict:
+    filter_key: tuple = None,     # Cache key parameter
+) -> ClusterResult:
     """클러스터별로 분포와 top_n problem_component 차트를 확인
 
     Args:
@@ -277,14 +303,11 @@ def cluster_check(
         selected_products: 선택된 제품군 리스트
         top_n: 상위 N개 부품
         _year_month_expr: 년-월 컬럼 생성 표현식
+        filter_key: _lf에 적용된 공통 필터 값 (캐시 키용)
 
     Returns:
-        {
-            'harm_summary': 환자 피해 분포,
-            'top_components': 상위 부품 DataFrame,
-            'total_count': 전체 케이스 수,
-            'time_series': 시계열 데이터 (월별 케이스 수)
-        }
+        ClusterResult (전체 케이스 수, 피해 유형별 건수, 상위 부품,
+        월별 시계열, 결함 유형/결함 확정 분포)
     """
     # 기본 필터 적용
     filtered_lf = apply_basic_filters(
@@ -302,11 +325,14 @@ def cluster_check(
     # 클러스터 필터링
     cluster_lf = filtered_lf.filter(pl.col(cluster_col) == cluster_name)
 
+    # 아래 집계들은 LazyFrame 계획만 만들고, 마지막에 collect_all로 한 번에 실행
+    # (cluster_lf 스캔/필터를 공유)
+
     # 1. 전체 케이스 수
-    total_count = cluster_lf.select(pl.len()).collect()[0, 0]
+    total_lf = cluster_lf.select(pl.len())
 
     # 2. 환자 피해 분포 (patient_harm 컬럼 사용)
-    harm_summary = cluster_lf.select([
+    harm_lf = cluster_lf.select([
         (pl.col(event_col) == 'Death').sum().alias('death_count'),
         (pl.col(event_col) == 'Serious Injury').sum().alias('serious_injury_count'),
         (pl.col(event_col) == 'Minor Injury').sum().alias('minor_injury_count'),
@@ -315,15 +341,7 @@ def cluster_check(
             (pl.col(event_col) == 'No Harm')
         ).sum().alias('no_injury_count'),
         (pl.col(event_col) == 'Unknown').sum().alias('unknown_count')
-    ]).collect()
-
-    event_dict = {
-        'total_deaths': harm_summary['death_count'][0] if len(harm_summary) > 0 else 0,
-        'total_serious_injuries': harm_summary['serious_injury_count'][0] if len(harm_summary) > 0 else 0,
-        'total_minor_injuries': harm_summary['minor_injury_count'][0] if len(harm_summary) > 0 else 0,
-        'total_no_injuries': harm_summary['no_injury_count'][0] if len(harm_summary) > 0 else 0,
-        'total_unknown': harm_summary['unknown_count'][0] if len(harm_summary) > 0 else 0
-    }
+    ])
 
     # 3. 상위 부품 추출 (cluster_keyword_unpack과 유사한 로직)
     lf_temp = cluster_lf.select([component_col])
@@ -346,7 +364,7 @@ def cluster_check(
         )
 
     # 리스트 explode 및 카운트
-    top_components_df = (
+    top_components_lf = (
         lf_temp
         .explode(component_col)
         .filter(pl.col(component_col).is_not_null())
@@ -358,10 +376,6 @@ def cluster_check(
         .agg(pl.len().alias('count'))
         .sort('count', descending=True)
         .head(top_n)
-        .with_columns(
-            (pl.col('count') / total_count * 100).round(2).alias('ratio')
-        )
-        .collect()
     )
 
     # 4. 시계열 데이터 (월별 케이스 수)
@@ -369,17 +383,16 @@ def cluster_check(
         from .data_utils import get_year_month_expr
         _year_month_expr = get_year_month_expr(_lf, date_col)
 
-    time_series_df = (
+    time_series_lf = (
         cluster_lf
         .with_columns(_year_month_expr)
         .group_by('year_month')
         .agg(pl.len().alias('count'))
         .sort('year_month')
-        .collect()
     )
 
     # 5. Defect Type 분포 (상위 N개)
-    defect_type_df = (
+    defect_type_lf = (
         cluster_lf
         .filter(pl.col(ColumnNames.DEFECT_TYPE).is_not_null())
         .filter(pl.col(ColumnNames.DEFECT_TYPE) != "")
@@ -387,14 +400,10 @@ def cluster_check(
         .agg(pl.len().alias('count'))
         .sort('count', descending=True)
         .head(top_n)
-        .with_columns(
-            (pl.col('count') / total_count * 100).round(2).alias('ratio')
-        )
-        .collect()
     )
 
     # 6. Defect Confirmed 분포 (한글로 매핑)
-    defect_confirmed_df = (
+    defect_confirmed_lf = (
         cluster_lf
         .filter(pl.col(ColumnNames.DEFECT_CONFIRMED).is_not_null())
         .with_columns(
@@ -410,17 +419,35 @@ def cluster_check(
         .group_by(ColumnNames.DEFECT_CONFIRMED)
         .agg(pl.len().alias('count'))
         .sort('count', descending=True)
-        .with_columns(
-            (pl.col('count') / total_count * 100).round(2).alias('ratio')
-        )
-        .collect()
     )
 
-    return {
-        'harm_summary': event_dict,
-        'top_components': top_components_df,
-        'total_count': total_count,
-        'time_series': time_series_df,
-        'defect_types': defect_type_df,
-        'defect_confirmed': defect_confirmed_df
-    }
+    (
+        total_df, harm_summary, top_components_df,
+        time_series_df, defect_type_df, defect_confirmed_df
+    ) = pl.collect_all([
+        total_lf, harm_lf, top_components_lf,
+        time_series_lf, defect_type_lf, defect_confirmed_lf
+    ])
+
+    total_count = total_df[0, 0]
+    harm_counts = harm_summary.row(0) if len(harm_summary) > 0 else (0, 0, 0, 0, 0)
+
+    # 비율(%)은 전체 케이스 수가 필요하므로 수집 후 (작은 결과 테이블에서) 계산
+    ratio = (pl.col('count') / total_count * 100).round(2).alias('ratio')
+    top_components_df = top_components_df.with_columns(ratio)
+    defect_type_df = defect_type_df.with_columns(ratio)
+    defect_confirmed_df = defect_confirmed_df.with_columns(ratio)
+
+    deaths, serious_injuries, minor_injuries, no_injuries, unknown = harm_counts
+    return ClusterResult(
+        total_count=total_count,
+        deaths=deaths,
+        serious_injuries=serious_injuries,
+        minor_injuries=minor_injuries,
+        no_injuries=no_injuries,
+        unknown=unknown,
+        top_components=top_components_df,
+        time_series=time_series_df,
+        defect_types=defect_type_df,
+        defect_confirmed=defect_confirmed_df
+    )
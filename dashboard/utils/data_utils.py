@@ -2,8 +2,7 @@
 """Polars 데이터 처리 유틸리티 함수"""
 
 import polars as pl
-from datetime import datetime
-from dateutil.relativedelta import relativedelta
+from datetime import date, datetime
 from typing import List, Tuple, Optional
 from .constants import ColumnNames, Defaults
 
@@ -11,6 +10,9 @@ from .constants import ColumnNames, Defaults
 def get_year_month_expr(lf: pl.LazyFrame, date_col: str = ColumnNames.DATE_RECEIVED) -> pl.Expr:
     """년-월 컬럼 생성 표현식을 반환 (날짜 타입에 따라 자동 처리)
 
+    Stage3 parquet에 year_month 컬럼이 미리 저장되어 있으면 그 컬럼을 그대로 사용한다.
+    (매 쿼리마다 날짜 파싱/포맷 생략)
+
     Args:
         lf: LazyFrame
         date_col: 날짜 컬럼명
@@ -20,11 +22,11 @@ def get_year_month_expr(lf: pl.LazyFrame, date_col: str = ColumnNames.DATE_RECEI
     """
     try:
         schema = lf.collect_schema()
-        date_dtype = None
-        for name, dtype in schema.items():
-            if name == date_col:
-                date_dtype = dtype
-                break
+        if "year_month" in schema:
+            # 미리 계산된 물리 컬럼
+            return pl.col("year_month")
+
+        date_dtype = schema.get(date_col)
 
         if date_dtype == pl.Date:
             # 이미 Date 타입인 경우
@@ -71,9 +73,8 @@ def create_manufacturer_product_combo(
     return (
         pl.when(pl.col(manufacturer_col).is_not_null() & pl.col(product_col).is_not_null())
         .then(
-            pl.col(manufacturer_col).cast(pl.Utf8)
-            + pl.lit(" - ")
-            + pl.col(product_col).cast(pl.Utf8)
+            # 단일 할당으로 결합 (문자열 + 연산의 중간 컬럼 생성 회피, Categorical도 자동 변환)
+            pl.concat_str([pl.col(manufacturer_col), pl.col(product_col)], separator=" - ")
         )
         .otherwise(pl.lit(missing_label))
         .alias("manufacturer_product")
@@ -113,14 +114,16 @@ def get_window_dates(
     if as_of_month is None:
         as_of_month = available_dates[0]  # 가장 최근 월
 
-    # datetime 객체로 변환
+    # 정수 월 키(year*12 + month-1)로 변환 → i개월 전 = 키 - i (relativedelta 연산 생략)
     as_of_date = datetime.strptime(as_of_month, Defaults.DATE_FORMAT)
+    as_of_key = as_of_date.year * 12 + as_of_date.month - 1
+
+    def _months_ago(i: int) -> str:
+        key = as_of_key - i
+        return date(key // 12, key % 12 + 1, 1).strftime(Defaults.DATE_FORMAT)
 
     # 최근 기간 계산 (0부터 window_size-1개월 전까지)
-    recent_months = [
-        (as_of_date - relativedelta(months=i)).strftime(Defaults.DATE_FORMAT)
-        for i in range(window_size)
-    ]
+    recent_months = [_months_ago(i) for i in range(window_size)]
 
     # 비교 기간 계산
     if include_overlap:
@@ -130,18 +133,39 @@ def get_window_dates(
         # 겹치지 않는 기간: recent 다음 달부터 시작
         base_start = window_size
 
-    base_months = [
-        (as_of_date - relativedelta(months=i)).strftime(Defaults.DATE_FORMAT)
-        for i in range(base_start, base_start + window_size)
-    ]
+    base_months = [_months_ago(i) for i in range(base_start, base_start + window_size)]
 
-    # available_dates에 존재하는 월만 필터링
-    recent_months = [m for m in recent_months if m in available_dates]
-    base_months = [m for m in base_months if m in available_dates]
+    # available_dates에 존재하는 월만 필터링 (set으로 한 번 변환)
+    available = set(available_dates)
+    recent_months = [m for m in recent_months if m in available]
+    base_months = [m for m in base_months if m in available]
 
     return recent_months, base_months
 
 
+def get_month_range_bounds(selected_dates: List[str]) -> Optional[Tuple[str, str]]:
+    """연속된 년-월 리스트를 (첫 월, 마지막 월) 구간으로 변환
+
+    'YYYY-MM' 문자열은 사전순과 시간순이 같으므로 구간 비교에 그대로 사용할 수 있다.
+
+    Args:
+        selected_dates: 선택된 년-월 리스트 (순서 무관)
+
+    Returns:
+        (첫 월, 마지막 월) 튜플. 월이 연속되지 않으면 None
+    """
+    # 정수 월 키(year*12 + month-1)로 연속성 확인
+    keys = set()
+    for ym in selected_dates:
+        d = datetime.strptime(ym, Defaults.DATE_FORMAT)
+        keys.add(d.year * 12 + d.month - 1)
+
+    if max(keys) - min(keys) + 1 != len(keys):
+        return None
+
+    return min(selected_dates), max(selected_dates)
+
+
 def apply_basic_filters(
     lf: pl.LazyFrame,
     manufacturer_col: str = ColumnNames.MANUFACTURER,
@@ -183,30 +207,30 @@ def apply_basic_filters(
         ...     ]
         ... )
     """
-    # 조합 컬럼 추가
-    if add_combo:
-        combo_expr = create_manufacturer_product_combo(manufacturer_col, product_col)
-        filtered_lf = lf.with_columns([combo_expr])
-
-        # null 필터 (선택적)
-        if filter_nulls:
-            filtered_lf = filtered_lf.filter(
-                pl.col(manufacturer_col).is_not_null() &
-                pl.col(product_col).is_not_null()
-            )
-    else:
-        filtered_lf = lf
+    filtered_lf = lf
+
+    # null 필터 (선택적, add_combo=True일 때만)
+    # 원본 컬럼에 대한 저비용 필터를 먼저 적용해 조합 문자열 생성 대상 행을 줄임
+    if add_combo and filter_nulls:
+        filtered_lf = filtered_lf.filter(
+            pl.col(manufacturer_col).is_not_null() &
+            pl.col(product_col).is_not_null()
+        )
 
     # 날짜 필터
     if selected_dates and len(selected_dates) > 0:
         if year_month_expr is None:
             year_month_expr = get_year_month_expr(lf, date_col)
 
-        filtered_lf = (
-            filtered_lf
-            .with_columns(year_month_expr)
-            .filter(pl.col("year_month").is_in(selected_dates))
-        )
+        filtered_lf = filtered_lf.with_columns(year_month_expr)
+
+        # 연속된 월 선택이면 is_in(해시 조회) 대신 year_month 구간 비교 2번으로 처리
+        # (스키마 조회 없이 동작, 비연속 선택만 is_in 사용)
+        bounds = get_month_range_bounds(selected_dates)
+        if bounds is not None:
+            filtered_lf = filtered_lf.filter(pl.col("year_month").is_between(*bounds))
+        else:
+            filtered_lf = filtered_lf.filter(pl.col("year_month").is_in(selected_dates))
 
     # 제조사 필터
     if selected_manufacturers and len(selected_manufacturers) > 0:
@@ -216,6 +240,11 @@ def apply_basic_filters(
     if selected_products and len(selected_products) > 0:
         filtered_lf = filtered_lf.filter(pl.col(product_col).is_in(selected_products))
 
+    # 조합 컬럼 추가 (필터를 통과한 행에만 cast + concat 수행)
+    if add_combo:
+        combo_expr = create_manufacturer_product_combo(manufacturer_col, product_col)
+        filtered_lf = filtered_lf.with_columns([combo_expr])
+
     # 커스텀 필터 적용
     if custom_filters:
         for custom_filter in custom_filters:
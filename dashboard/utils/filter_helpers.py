@@ -3,27 +3,33 @@
 
 import polars as pl
 import streamlit as st
-from typing import List, Tuple, Optional
+from typing import Dict, FrozenSet, List, Tuple, Optional
 from .constants import ColumnNames, Defaults
 from .data_utils import get_year_month_expr
 
 
-@st.cache_data
+@st.cache_resource(show_spinner=False)
 def get_available_filters(
     _lf: pl.LazyFrame,
     manufacturer_col: str = ColumnNames.MANUFACTURER,
     product_col: str = ColumnNames.PRODUCT_CODE,
     date_col: str = ColumnNames.DATE_RECEIVED,
-    _year_month_expr: Optional[pl.Expr] = None
+    _year_month_expr: Optional[pl.Expr] = None,
+    cache_key: Optional[str] = None
 ) -> Tuple[List[str], List[str], List[str]]:
     """필터에 사용할 unique 값들을 추출
 
+    전체 데이터 기준 목록은 앱 수명 동안 변하지 않으므로 프로세스 전역(cache_resource)에
+    한 번만 계산해 둡니다. 필터 변경 시 호출되는 st.cache_data.clear()의 영향도 받지 않습니다.
+    반환된 리스트는 공유 객체이므로 수정하지 말 것.
+
     Args:
         _lf: LazyFrame (언더스코어로 시작하여 캐싱에서 제외)
         manufacturer_col: 제조사 컬럼명
         product_col: 제품군(제품코드) 컬럼명
         date_col: 날짜 컬럼명
         _year_month_expr: 년-월 컬럼 생성 표현식 (재사용용, 언더스코어로 시작하여 캐싱에서 제외)
+        cache_key: 캐시 키 (데이터 로드 캐시 키와 동일하게 전달하면 월 갱신 시 함께 재계산)
 
     Returns:
         tuple: (available_dates, available_manufacturers, available_products)
@@ -31,50 +37,115 @@ def get_available_filters(
     # 년-월 리스트 (재사용 또는 새로 생성)
     year_month_expr = _year_month_expr if _year_month_expr is not None else get_year_month_expr(_lf, date_col)
 
-    try:
-        available_dates = (
-            _lf
-            .filter(pl.col(date_col).is_not_null())
-            .with_columns(year_month_expr)
-            .select("year_month")
-            .filter(pl.col("year_month").is_not_null())
-            .unique()
-            .sort("year_month", descending=True)
-            .collect()
-        )["year_month"].to_list()
-    except Exception:
-        available_dates = []
+    dates_lf = (
+        _lf
+        .filter(pl.col(date_col).is_not_null())
+        .with_columns(year_month_expr)
+        .select("year_month")
+        .filter(pl.col("year_month").is_not_null())
+        .unique()
+        .sort("year_month", descending=True)
+    )
 
     # 제조사 리스트
-    available_manufacturers = (
+    manufacturers_lf = (
         _lf
         .select(pl.col(manufacturer_col))
         .filter(pl.col(manufacturer_col).is_not_null())
         .unique()
         .sort(manufacturer_col)
-        .collect()
-    )[manufacturer_col].to_list()
+    )
 
     # 제품군 리스트
-    available_products = (
+    products_lf = (
         _lf
         .select(pl.col(product_col))
         .filter(pl.col(product_col).is_not_null())
         .unique()
         .sort(product_col)
-        .collect()
-    )[product_col].to_list()
+    )
+
+    # 세 쿼리를 한 번에 실행하여 parquet 스캔을 공유
+    try:
+        dates_df, manufacturers_df, products_df = pl.collect_all(
+            [dates_lf, manufacturers_lf, products_lf]
+        )
+        available_dates = dates_df["year_month"].to_list()
+    except Exception:
+        # 년-월 생성 실패 시 날짜 없이 나머지만 수집
+        available_dates = []
+        manufacturers_df, products_df = pl.collect_all([manufacturers_lf, products_lf])
+
+    available_manufacturers = manufacturers_df[manufacturer_col].to_list()
+    available_products = products_df[product_col].to_list()
 
     return available_dates, available_manufacturers, available_products
 
 
-@st.cache_data
+@st.cache_resource(show_spinner=False)
+def build_adjacency_maps(
+    _lf: pl.LazyFrame,
+    manufacturer_col: str = ColumnNames.MANUFACTURER,
+    product_col: str = ColumnNames.PRODUCT_CODE,
+    date_col: str = ColumnNames.DATE_RECEIVED,
+    _year_month_expr: Optional[pl.Expr] = None,
+    cache_key: Optional[str] = None
+) -> Tuple[Dict[str, FrozenSet[str]], Dict[str, FrozenSet[str]]]:
+    """cascade 필터용 인접 맵(년-월→제조사, 제조사→제품군)을 한 번만 생성
+
+    위젯 선택이 바뀔 때마다 컬럼 전체를 스캔하는 대신, 미리 만든 맵에서
+    Python 집합 합집합으로 옵션 목록을 구합니다.
+
+    Args:
+        _lf: LazyFrame (언더스코어로 시작하여 캐싱에서 제외)
+        manufacturer_col: 제조사 컬럼명
+        product_col: 제품군(제품코드) 컬럼명
+        date_col: 날짜 컬럼명
+        _year_month_expr: 년-월 컬럼 생성 표현식 (재사용용, 언더스코어로 시작하여 캐싱에서 제외)
+        cache_key: 캐시 키 (get_available_filters와 같은 데이터 로드 캐시 키, 월 갱신 시 함께 재계산)
+
+    Returns:
+        tuple: (ym_to_mfrs, mfr_to_products)
+    """
+    year_month_expr = _year_month_expr if _year_month_expr is not None else get_year_month_expr(_lf, date_col)
+
+    ym_lf = (
+        _lf
+        .filter(pl.col(date_col).is_not_null() & pl.col(manufacturer_col).is_not_null())
+        .with_columns(year_month_expr)
+        .filter(pl.col("year_month").is_not_null())
+        .group_by("year_month")
+        .agg(pl.col(manufacturer_col).unique())
+    )
+
+    mfr_lf = (
+        _lf
+        .filter(pl.col(manufacturer_col).is_not_null() & pl.col(product_col).is_not_null())
+        .group_by(manufacturer_col)
+        .agg(pl.col(product_col).unique())
+    )
+
+    ym_df, mfr_df = pl.collect_all([ym_lf, mfr_lf])
+
+    ym_to_mfrs = {
+        ym: frozenset(mfrs)
+        for ym, mfrs in zip(ym_df["year_month"].to_list(), ym_df[manufacturer_col].to_list())
+    }
+    mfr_to_products = {
+        mfr: frozenset(products)
+        for mfr, products in zip(mfr_df[manufacturer_col].to_list(), mfr_df[product_col].to_list())
+    }
+
+    return ym_to_mfrs, mfr_to_products
+
+
 def get_manufacturers_by_dates(
     _lf: pl.LazyFrame,
     selected_dates: List[str],
     date_col: str = ColumnNames.DATE_RECEIVED,
     manufacturer_col: str = ColumnNames.MANUFACTURER,
-    _year_month_expr: Optional[pl.Expr] = None
+    _year_month_expr: Optional[pl.Expr] = None,
+    cache_key: Optional[str] = None
 ) -> List[str]:
     """선택된 년-월에 존재하는 제조사 목록을 반환
 
@@ -84,6 +155,7 @@ def get_manufacturers_by_dates(
         date_col: 날짜 컬럼명
         manufacturer_col: 제조사 컬럼명
         _year_month_expr: 년-월 컬럼 생성 표현식 (재사용용, 언더스코어로 시작하여 캐싱에서 제외)
+        cache_key: 캐시 키 (인접 맵 캐시를 데이터 로드와 함께 갱신)
 
     Returns:
         선택된 년-월에 존재하는 제조사 목록
@@ -91,29 +163,23 @@ def get_manufacturers_by_dates(
     if not selected_dates or len(selected_dates) == 0:
         return []
 
-    year_month_expr = _year_month_expr if _year_month_expr is not None else get_year_month_expr(_lf, date_col)
+    ym_to_mfrs, _ = build_adjacency_maps(
+        _lf,
+        manufacturer_col=manufacturer_col,
+        date_col=date_col,
+        _year_month_expr=_year_month_expr,
+        cache_key=cache_key
+    )
 
-    manufacturers = (
-        _lf
-        .filter(pl.col(date_col).is_not_null())
-        .filter(pl.col(manufacturer_col).is_not_null())
-        .with_columns(year_month_expr)
-        .filter(pl.col("year_month").is_in(selected_dates))
-        .select(pl.col(manufacturer_col))
-        .unique()
-        .sort(manufacturer_col)
-        .collect()
-    )[manufacturer_col].to_list()
+    return sorted(set().union(*(ym_to_mfrs.get(d, ()) for d in selected_dates)))
 
-    return manufacturers
 
-
-@st.cache_data
 def get_products_by_manufacturers(
     _lf: pl.LazyFrame,
     selected_manufacturers: List[str],
     manufacturer_col: str = ColumnNames.MANUFACTURER,
-    product_col: str = ColumnNames.PRODUCT_CODE
+    product_col: str = ColumnNames.PRODUCT_CODE,
+    cache_key: Optional[str] = None
 ) -> List[str]:
     """선택된 제조사에 해당하는 제품군 목록을 반환
 
@@ -122,6 +188,7 @@ def get_products_by_manufacturers(
         selected_manufacturers: 선택된 제조사 리스트
         manufacturer_col: 제조사 컬럼명
         product_col: 제품군(제품코드) 컬럼명
+        cache_key: 캐시 키 (인접 맵 캐시를 데이터 로드와 함께 갱신)
 
     Returns:
         선택된 제조사에 해당하는 제품군 리스트
@@ -129,18 +196,14 @@ def get_products_by_manufacturers(
     if not selected_manufacturers or len(selected_manufacturers) == 0:
         return []
 
-    products = (
-        _lf
-        .filter(pl.col(manufacturer_col).is_not_null())
-        .filter(pl.col(product_col).is_not_null())
-        .filter(pl.col(manufacturer_col).is_in(selected_manufacturers))
-        .select(pl.col(product_col))
-        .unique()
-        .sort(product_col)
-        .collect()
-    )[product_col].to_list()
+    _, mfr_to_products = build_adjacency_maps(
+        _lf,
+        manufacturer_col=manufacturer_col,
+        product_col=product_col,
+        cache_key=cache_key
+    )
 
-    return products
+    return sorted(set().union(*(mfr_to_products.get(m, ()) for m in selected_manufacturers)))
 
 
 @st.cache_data
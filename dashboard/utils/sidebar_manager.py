@@ -14,6 +14,14 @@ sys.path.append(str(root_path))
 from dashboard.utils.dashboard_config import get_config
 
 
+# ==================== 캐시 리소스 ====================
+
+@st.cache_resource
+def _load_logo(logo_path: str) -> bytes:
+    """로고 이미지를 한 번만 읽어 rerun 간 재사용"""
+    return Path(logo_path).read_bytes()
+
+
 # ==================== 데코레이터 ====================
 
 def check_enabled(config_path: str):
@@ -64,7 +72,8 @@ class SidebarManager:
         """
         self.cfg = get_config()
         self.dashboard_type = dashboard_type
-        self.TODAY = datetime.now()
+        # Home.py가 세션 시작 시 저장한 기준 시각 재사용 (rerun마다 새로 계산 X)
+        self.TODAY = st.session_state.get("TODAY") or datetime.now()
 
         # 공통 설정과 대시보드별 설정 로드
         self.common_config = self.cfg.sidebar.get("common", {})
@@ -80,7 +89,7 @@ class SidebarManager:
         # 로고
         logo_path = header_config.get("logo")
         if logo_path:
-            st.image(logo_path, width='stretch')
+            st.image(_load_logo(logo_path), width='stretch')
 
         # 프로젝트 정보
         project_info = header_config.get("project_info", {})
@@ -280,7 +289,8 @@ class SidebarManager:
                                     data_source,
                                     parent_values.get("manufacturers", []),
                                     manufacturer_col=ColumnNames.MANUFACTURER,
-                                    product_col=ColumnNames.PRODUCT_CODE
+                                    product_col=ColumnNames.PRODUCT_CODE,
+                                    cache_key=cascade_config.get("cache_key")
                                 )
                             elif key == "devices":
                                 from dashboard.utils.filter_helpers import get_devices_by_filters
@@ -7,8 +7,8 @@
 import streamlit as st
 import polars as pl
 import plotly.graph_objects as go
-from datetime import datetime
-from dateutil.relativedelta import relativedelta
+from datetime import date, datetime
+from html import escape
 from typing import Optional, List, Dict, Any, Tuple
 
 from dashboard.utils.constants import DisplayNames, HarmColors, ChartStyles
@@ -207,14 +207,17 @@ def convert_date_range_to_months(date_range: Optional[Tuple]) -> List[str]:
     else:
         end = end_val
 
-    # 월 리스트 생성
-    months = []
-    current = start
-    while current <= end:
-        months.append(current.strftime("%Y-%m"))
-        current += relativedelta(months=1)
-
-    return months
+    # 월 리스트 생성 (월초 기준 1개월 간격, Python 루프 대신 Polars에서 한 번에)
+    return (
+        pl.date_range(
+            date(start.year, start.month, 1),
+            date(end.year, end.month, 1),
+            interval="1mo",
+            eager=True
+        )
+        .dt.strftime("%Y-%m")
+        .to_list()
+    )
 
 
 # ==================== 차트 생성 ====================
@@ -585,6 +588,37 @@ def render_metrics_row(metrics: List[Dict[str, Any]], columns: int = 4) -> None:
             )
 
 
+def render_html_metrics_row(metrics: List[Dict[str, Any]]) -> None:
+    """메트릭 행을 HTML 카드 하나로 렌더링 (델타 없는 단순 지표용)
+
+    st.columns + st.metric 조합은 지표마다 별도 요소를 만들지만,
+    이 함수는 st.markdown 한 번으로 전체 행을 그린다. (스타일은 custom_css의 stMetric과 동일)
+
+    Args:
+        metrics: 메트릭 딕셔너리 리스트
+            - label: 라벨
+            - value: 값 (포맷된 문자열)
+
+    Example:
+        >>> render_html_metrics_row([
+        ...     {"label": "평균 월별 발생", "value": "12.50"},
+        ...     {"label": "최대 월별 발생", "value": "30"}
+        ... ])
+    """
+    cards = "".join(
+        '<div style="flex:1; background-color:#f8f9fa; border:1px solid #dee2e6; '
+        'border-radius:8px; padding:16px; box-shadow:0 1px 3px rgba(0,0,0,0.05);">'
+        f'<div style="font-size:14px; font-weight:600; color:#495057;">{escape(str(metric.get("label", "")))}</div>'
+        f'<div style="font-size:28px; font-weight:700; color:#212529;">{escape(str(metric.get("value", "N/A")))}</div>'
+        '</div>'
+        for metric in metrics
+    )
+    st.markdown(
+        f'<div style="display:flex; gap:1rem;">{cards}</div>',
+        unsafe_allow_html=True
+    )
+
+
 # ==================== 데이터 다운로드 ====================
 
 def render_download_button(
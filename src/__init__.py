@@ -2,5 +2,5 @@ from src.loading import DataLoader
 from src.utils.baseline_aggregator import BaselineAggregator
 
 __all__ = [
-    'DataLoader', 'ZipStreamer', 'Flattener', 'SchemaCollector', 'ParquetWriter', 'BaselineAggregator'
+    'DataLoader', 'ZipStreamer', 'Flattener', 'ParquetWriter', 'BaselineAggregator'
 ]
\ No newline at end of file
@@ -14,8 +14,8 @@ def main():
                         help="Output file path (e.g., output.parquet)")
     parser.add_argument("--max-workers", "-w", type=int, default=4,
                         help="Maximum number of workers")
-    parser.add_argument("--skip", action="store_true",
-                        help="Skip processing if schema exists")
+    parser.add_argument("--cache-dir", "-c", type=str, default=None,
+                        help="Reuse per-URL parquet shards if the source is unchanged")
 
     args = parser.parse_args()
 
@@ -24,10 +24,11 @@ def main():
         start=args.start,
         end=args.end,
         output_file=args.output_file,
-        max_workers=args.max_workers
+        max_workers=args.max_workers,
+        cache_dir=args.cache_dir
     )
 
-    loader.process(skip=args.skip)
+    loader.process()
 
 if __name__=='__main__':
     main()
\ No newline at end of file
@@ -1,5 +1,9 @@
 """
 MAUDE 데이터 로딩 모듈
+
+JSON 파싱은 ijson C 백엔드(yajl2_c)를 권장합니다.
+없으면 yajl2_cffi → yajl2 → 순수 Python 순으로 대체됩니다.
+(yajl2_c/yajl2는 시스템 라이브러리 libyajl 필요)
 """
 
 __all__ = ["DataLoader"]
@@ -6,8 +6,9 @@
 # 표준 라이브러리
 # -----------------------------
 import tempfile
-from typing import List, Tuple, Union
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Tuple, Union, Optional, Dict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import threading
 import time
 import os
 import json
@@ -21,7 +22,9 @@ from pathlib import Path
 # -----------------------------
 import requests
 from tqdm import tqdm
+import pyarrow as pa
 import pyarrow.parquet as pq
+import pyarrow.dataset as ds
 from pyspark.sql import SparkSession
 import polars as pl
 import pandas as pd
@@ -31,8 +34,7 @@ import pandas as pd
 # -----------------------------
 from src.loading.zip_streamer import ZipStreamer
 from src.loading.flattener import Flattener
-from src.loading.parquet_writer import ParquetWriter
-from src.loading.schema_collector import SchemaCollector
+from src.loading.parquet_writer import ParquetWriter, ShardWriter
 
 
 
@@ -58,21 +60,26 @@ class DataLoader:
         start: int = None,
         end: int = None,
         output_file: str = 'output.parquet',
-        schema_file: str = '.schema_cache.json',
         max_workers: int = 4,
-        adapter: DatasetAdapter = DatasetAdapter.PANDAS
+        adapter: DatasetAdapter = DatasetAdapter.PANDAS,
+        cache_dir: Optional[str] = None
     ) -> None:
         self.name = name
         self.start = start
         self.end = end
         self.output_file = output_file
-        self.schema_file = schema_file
         self.max_workers = max_workers
         self.adapter = adapter
+        # URL별 샤드 캐시 디렉토리 (None이면 캐시 사용 안 함)
+        self.cache_dir = cache_dir
         self.urls = []
         self.schema_columns = []
+        # 마지막 변환에서 실패한 URL → 에러 메시지
+        self.failed_urls: Dict[str, str] = {}
         
         Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        if cache_dir:
+            Path(cache_dir).mkdir(parents=True, exist_ok=True)
     
     def search_download_url(self) -> List[str]:
         """다운로드 URL 목록 조회"""
@@ -89,77 +96,110 @@ class DataLoader:
                 urls.append(item['file'])
         return urls
     
-    def _collect_schema_worker(self, url: str) -> Tuple[str, set, int]:
-        """워커 함수: 단일 URL에서 스키마 수집"""
-        collector = SchemaCollector()
-        return collector.collect_from_url(url)
-    
-    def _collect_schema(self, skip: bool = False) -> List[str]:
-        """Phase 1: 병렬로 전체 스키마 수집"""
-        if skip and os.path.exists(self.schema_file):
-            print(f"♻️  기존 스키마 로드: {self.schema_file}")
-            with open(self.schema_file, 'r') as f:
-                schema_columns = json.load(f)
-            print(f"✅ {len(schema_columns):,}개 컬럼 로드 완료\n")
-            return schema_columns
-        
-        print(f"\n=== Phase 1: 전체 스키마 수집 (병렬 {self.max_workers}개) ===\n")
+    def _collect_schema(self, temp_files: List[str]) -> List[str]:
+        """샤드 파일 메타데이터에서 전체 스키마 통합"""
+        schemas = [pq.read_schema(f) for f in temp_files]
+        unified = pa.unify_schemas(schemas, promote_options='default')
+        schema_columns = sorted(unified.names)
         
-        all_columns = set()
-        total_records = 0
+        print(f"\n✅ {len(schema_columns):,}개 고유 컬럼 발견")
         
-        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {executor.submit(self._collect_schema_worker, url): url 
-                      for url in self.urls}
-            
-            for i, future in enumerate(tqdm(as_completed(futures), 
-                                            total=len(self.urls), 
-                                            desc="스키마 수집"), 1):
-                file_columns, record_count = future.result()
-                all_columns.update(file_columns)
-                total_records += record_count
+        return schema_columns
+    
+    def _fingerprint(self, url: str) -> Optional[Dict[str, str]]:
+        """HEAD 요청으로 URL 지문(ETag, Content-Length) 조회"""
+        try:
+            r = requests.head(url, allow_redirects=True)
+            r.raise_for_status()
+        except requests.RequestException:
+            return None
         
-        schema_columns = sorted(all_columns)
+        fingerprint = {
+            'etag': r.headers.get('ETag'),
+            'content_length': r.headers.get('Content-Length'),
+        }
+        if not any(fingerprint.values()):
+            return None
+        return fingerprint
+    
+    def _cache_meta_file(self, url: str) -> str:
+        """URL별 캐시 메타데이터 파일 경로"""
+        return os.path.join(self.cache_dir, f"{hashlib.md5(url.encode()).hexdigest()}.json")
+    
+    def _load_cached_shards(self, 
+            url: str, 
+            fingerprint: Dict[str, str]
+        ) -> Optional[Tuple[List[str], int]]:
+        """지문이 같으면 캐시된 샤드 반환, 다르면 이전 샤드 삭제"""
+        meta_file = self._cache_meta_file(url)
+        if not os.path.exists(meta_file):
+            return None
         
-        # 스키마 저장
-        with open(self.schema_file, 'w') as f:
-            json.dump(schema_columns, f)
+        with open(meta_file, 'r') as f:
+            meta = json.load(f)
         
-        print(f"\n✅ 총 {total_records:,}개 레코드, {len(schema_columns):,}개 고유 컬럼 발견")
-        print(f"📝 스키마 저장: {self.schema_file}\n")
+        files = meta.get('files', [])
+        if meta.get('fingerprint') == fingerprint and all(os.path.exists(p) for p in files):
+            return files, meta.get('record_count', 0)
         
-        return schema_columns
+        # 원본이 바뀌었으면 이전 샤드 정리
+        for p in files:
+            if os.path.exists(p):
+                os.remove(p)
+        os.remove(meta_file)
+        return None
+    
+    def _save_cached_shards(self, 
+            url: str, 
+            fingerprint: Dict[str, str], 
+            files: List[str], 
+            record_count: int
+        ) -> None:
+        """URL 지문과 샤드 목록을 캐시 메타데이터로 저장"""
+        meta = {'url': url, 'fingerprint': fingerprint, 'files': files, 'record_count': record_count}
+        with open(self._cache_meta_file(url), 'w') as f:
+            json.dump(meta, f)
     
     def _convert_url_to_temp_parquet(self, 
             url: str, 
-            temp_dir: str
-        ) -> Tuple[str, str, int]:
-        """워커 함수: 단일 URL을 임시 Parquet 파일로 변환"""
+            shard_dir: str,
+            zip_path: Optional[str] = None
+        ) -> Tuple[List[str], int]:
+        """워커 함수: 단일 URL을 임시 Parquet 샤드로 변환 (다운로드/파싱 1회)
+
+        실패 시 이미 쓴 샤드를 삭제한 뒤 예외를 다시 발생시킨다.
+        (부분 샤드가 병합/캐시 재사용 대상에 섞이지 않도록)
+        """
+        writer = None
         try:
             # 고유한 파일명 생성
             url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
-            filename = f"{url_hash}_{url.split('/')[-1].replace('.zip', '.parquet')}"
-            temp_file = os.path.join(temp_dir, filename)
+            prefix = f"{url_hash}_{url.split('/')[-1].replace('.zip', '')}"
             
             # 스트리밍 변환
             streamer = ZipStreamer(url)
             flattener = Flattener()
-            writer = ParquetWriter(self.schema_columns, temp_file)
+            writer = ShardWriter(os.path.join(shard_dir, prefix))
             
             record_count = 0
-            for record in streamer.stream_records():
-                normalized = flattener.normalize(record, self.schema_columns)
-                writer.write(normalized)
+            for record in streamer.stream_records(zip_path):
+                writer.write(flattener.flatten(record))
                 record_count += 1
             
-            writer.close()
-            return temp_file, record_count
+            return writer.close(), record_count
+        
+        except Exception:
+            if writer is not None:
+                writer.abort()
+            raise
         
-        except Exception as e:
-            return None, 0
+        finally:
+            # 프리페치된 ZIP은 파싱 후 삭제
+            if zip_path and os.path.exists(zip_path):
+                os.remove(zip_path)
     
     def _merge_parquet_files(self, temp_files: List[str]) -> None:
-        """임시 Parquet 파일들을 하나로 병합"""
+        """임시 Parquet 파일들을 통합 스키마로 병합"""
         print("\n📦 Parquet 파일 병합 중...")
         
         existing_files = [f for f in temp_files if os.path.exists(f)]
@@ -168,24 +208,18 @@ class DataLoader:
             print("❌ 병합할 파일이 없습니다.")
             return
         
-        # ParquetWriter로 병합
+        # 통합 스키마로 샤드를 스캔 (없는 컬럼은 Arrow가 null로 채움)
         writer = ParquetWriter(self.schema_columns, self.output_file)
+        dataset = ds.dataset(existing_files, schema=writer.schema, format='parquet')
         
-        for temp_file in tqdm(existing_files, desc="병합"):
-            if os.path.exists(temp_file):
-                table = pq.read_table(temp_file)
-                writer.write_table(table)
-                
-                try:
-                    os.remove(temp_file)
-                except:
-                    pass
+        for batch in tqdm(dataset.to_batches(), desc="병합", mininterval=0.5, miniters=8):
+            writer.write_batch(batch)
         
         writer.close()
     
     def _convert_to_parquet(self) -> None:
-        """Phase 2: 병렬로 Parquet 변환"""
-        print(f"=== Phase 2: Parquet 변환 (병렬 {self.max_workers}개) ===\n")
+        """다운로드/평탄화 1회로 샤드 생성 후 통합 스키마로 병합"""
+        print(f"=== Parquet 변환 (병렬 {self.max_workers}개) ===\n")
         
         # 임시 디렉토리 생성
         temp_dir = tempfile.mkdtemp(prefix='fda_parquet_')
@@ -194,21 +228,82 @@ class DataLoader:
         total_records = 0
         temp_files = []
         
-        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {
-                executor.submit(self._convert_url_to_temp_parquet, url, temp_dir): url 
-                for url in self.urls
-            }
+        # 캐시 사용 시 샤드는 캐시 디렉토리에 유지, 변경되지 않은 URL은 건너뜀
+        shard_dir = self.cache_dir or temp_dir
+        fingerprints = {}
+        pending_urls = []
+        for url in self.urls:
+            fingerprint = self._fingerprint(url) if self.cache_dir else None
+            cached = self._load_cached_shards(url, fingerprint) if fingerprint else None
+            if cached:
+                temp_files.extend(cached[0])
+                total_records += cached[1]
+            else:
+                fingerprints[url] = fingerprint
+                pending_urls.append(url)
+        
+        if self.cache_dir:
+            print(f"♻️  캐시 재사용: {len(self.urls) - len(pending_urls)}개 URL\n")
+        
+        # 파싱 대기 중인 ZIP 수 제한 (디스크 사용량 backpressure)
+        slots = threading.BoundedSemaphore(self.max_workers * 2)
+        
+        def prefetch(url: str) -> str:
+            slots.acquire()
+            try:
+                return ZipStreamer(url).download(temp_dir)
+            except Exception:
+                slots.release()
+                raise
+        
+        # 다운로드/변환에 실패한 URL (종료 시 보고)
+        failed_urls: Dict[str, str] = {}
+        
+        # 다운로드(스레드)와 파싱(프로세스)을 겹쳐서 실행
+        with ThreadPoolExecutor(max_workers=self.max_workers) as downloader, \
+             ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            downloads = {downloader.submit(prefetch, url): url for url in pending_urls}
+            futures = {}
+            
+            for download in as_completed(downloads):
+                url = downloads[download]
+                error = download.exception()
+                if error is not None:
+                    print(f"⚠️  다운로드 실패: {url} ({error!r})")
+                    failed_urls[url] = repr(error)
+                    continue
+                future = executor.submit(
+                    self._convert_url_to_temp_parquet, url, shard_dir, download.result()
+                )
+                future.add_done_callback(lambda _: slots.release())
+                futures[future] = url
             
-            for future in tqdm(as_completed(futures), total=len(self.urls), desc="변환"):
-                temp_file, record_count = future.result()
+            for future in tqdm(as_completed(futures), total=len(futures), desc="변환"):
+                try:
+                    shard_files, record_count = future.result()
+                except Exception as error:
+                    print(f"⚠️  변환 실패: {futures[future]} ({error!r})")
+                    failed_urls[futures[future]] = repr(error)
+                    continue
                 
-                if temp_file:
-                    temp_files.append(temp_file)
+                if shard_files:
+                    temp_files.extend(shard_files)
                     total_records += record_count
+                    
+                    fingerprint = fingerprints.get(futures[future])
+                    if fingerprint:
+                        self._save_cached_shards(futures[future], fingerprint, shard_files, record_count)
                 
-        # 임시 Parquet 파일들 병합
+        # 실패한 URL 보고 (해당 파일의 레코드는 결과에 포함되지 않음)
+        self.failed_urls = failed_urls
+        if failed_urls:
+            print(f"\n❌ {len(failed_urls)}개 URL 처리 실패 (결과에서 누락됨):")
+            for url, error in failed_urls.items():
+                print(f"   - {url}: {error}")
+        
+        # 스키마 통합 후 임시 Parquet 파일들 병합
         if temp_files:
+            self.schema_columns = self._collect_schema(temp_files)
             self._merge_parquet_files(temp_files)
             
             # 임시 디렉토리 삭제
@@ -223,7 +318,7 @@ class DataLoader:
         else:
             print("\n❌ 변환된 파일이 없습니다.")
     
-    def process(self, skip: bool = False):
+    def process(self):
         """전체 파이프라인 실행 및 데이터 로드"""
         start_time = time.time()
         
@@ -236,10 +331,7 @@ class DataLoader:
             print("❌ 다운로드할 파일이 없습니다.")
             return None
         
-        # Phase 1: 스키마 수집
-        self.schema_columns = self._collect_schema(skip)
-        
-        # Phase 2: Parquet 변환
+        # 단일 패스: 다운로드 → 샤드 → 스키마 통합 → 병합
         self._convert_to_parquet()
         
         total_time = time.time() - start_time
@@ -284,4 +376,4 @@ if __name__ == '__main__':
         max_workers=4
     )
 
-    loader.process(skip=False)
+    loader.process()
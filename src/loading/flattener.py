@@ -5,14 +5,22 @@
 # -----------------------------
 # 표준 라이브러리
 # -----------------------------
-from typing import Set, List, Dict, Any
+from typing import Set, List, Dict, Any, Tuple
+import sys
 
 
 class Flattener:
-    """레코드 평탄화 및 정규화"""
+    """레코드 평탄화 및 정규화
+    
+    Polars/Arrow JSON 리더(scan_ndjson + unnest)는 딕셔너리 리스트의
+    인덱스 평탄화(`key_0_sub`)와 빈 문자열/[""] 정리를 지원하지 않으므로
+    기존 컬럼명 호환을 위해 Python 단일 순회를 유지합니다.
+    """
     
     def __init__(self, sep: str = '_'):
         self.sep = sep
+        # (부모 키, 자식 키) → 인턴된 평탄화 키 (레코드 간 재사용)
+        self._key_cache: Dict[Tuple[str, Any], str] = {}
     
     def clean_empty_arrays(self, obj: Any) -> Any:
         """빈 값 정리"""
@@ -26,34 +34,48 @@ class Flattener:
             return None
         return obj
     
-    def flatten_dict(self, nested_dict: Dict, parent_key: str = '') -> Dict:
-        """중첩된 딕셔너리를 평탄화"""
-        items = []
-        for k, v in nested_dict.items():
-            new_key = f"{parent_key}{self.sep}{k}" if parent_key else k
-            
-            if isinstance(v, dict):
-                items.extend(self.flatten_dict(v, new_key).items())
-            elif isinstance(v, list) and v and isinstance(v[0], dict):
-                for i, item in enumerate(v):
-                    items.extend(self.flatten_dict(item, f"{new_key}_{i}").items())
-            else:
-                items.append((new_key, v))
-        return dict(items)
+    def _join_key(self, parent_key: str, key: Any) -> str:
+        """평탄화 키 생성 (캐시 + 인턴)"""
+        cache_key = (parent_key, key)
+        new_key = self._key_cache.get(cache_key)
+        if new_key is None:
+            new_key = sys.intern(f"{parent_key}{self.sep}{key}" if parent_key else str(key))
+            self._key_cache[cache_key] = new_key
+        return new_key
+    
+    def flatten(self, record: Dict) -> Dict:
+        """빈 값 정리와 평탄화를 한 번의 반복 순회로 수행 (재귀 없음, 값 타입 유지)"""
+        flattened = {}
+        stack = [('', record)]
+        
+        while stack:
+            parent_key, node = stack.pop()
+            for k, v in node.items():
+                new_key = self._join_key(parent_key, k)
+                
+                if isinstance(v, dict):
+                    stack.append((new_key, v))
+                elif isinstance(v, list) and v and isinstance(v[0], dict):
+                    for i, item in enumerate(v):
+                        stack.append((self._join_key(new_key, i), item))
+                elif isinstance(v, list):
+                    if v == [""]:
+                        flattened[new_key] = None
+                    elif any(isinstance(item, (dict, list)) for item in v):
+                        # 중첩 컨테이너가 있는 드문 경우만 재귀 정리
+                        flattened[new_key] = self.clean_empty_arrays(v)
+                    else:
+                        # 스칼라 리스트 (대부분): 함수 호출 없이 바로 정리
+                        flattened[new_key] = [None if item == "" else item for item in v]
+                else:
+                    flattened[new_key] = None if v == "" else v
+        return flattened
     
     def extract_columns(self, record: Dict) -> Set[str]:
         """레코드에서 컬럼명 추출"""
-        cleaned = self.clean_empty_arrays(record)
-        flattened = self.flatten_dict(cleaned)
-        return set(flattened.keys())
+        return set(self.flatten(record))
     
     def normalize(self, record: Dict, schema_columns: List[str]) -> Dict:
-        """스키마에 맞춰 레코드 정규화"""
-        cleaned = self.clean_empty_arrays(record)
-        flattened = self.flatten_dict(cleaned)
-        
-        normalized = {}
-        for col in schema_columns:
-            val = flattened.get(col, None)
-            normalized[col] = str(val) if val is not None else None
-        return normalized
\ No newline at end of file
+        """스키마에 맞춰 레코드 정규화 (문자열 변환은 ParquetWriter가 일괄 처리)"""
+        flattened = self.flatten(record)
+        return {col: flattened.get(col) for col in schema_columns}
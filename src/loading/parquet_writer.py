@@ -5,6 +5,7 @@
 # -----------------------------
 # 표준 라이브러리
 # -----------------------------
+import os
 from typing import List, Dict
 
 # -----------------------------
@@ -13,37 +14,152 @@ from typing import List, Dict
 import pyarrow as pa
 import pyarrow.parquet as pq
 
+def to_string_array(values: list) -> pa.Array:
+    """값 리스트를 Arrow string 배열로 변환 (셀 단위 str() 호출 최소화)"""
+    try:
+        # 대부분의 컬럼은 이미 문자열/None → C 루프에서 바로 변환
+        return pa.array(values, type=pa.string())
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # 숫자/bool/리스트/혼합 타입은 기존과 동일하게 Python str()로 문자열화
+        # (Arrow cast는 True→"true", 1.0→"1"로 표기가 달라지므로 사용하지 않음)
+        return pa.array([str(v) if v is not None else None for v in values], type=pa.string())
+
+
 class ParquetWriter:
     """Parquet 파일 쓰기 (버퍼링 지원)"""
     
+    # 자유 텍스트(고유값이 많은) 컬럼은 사전 인코딩에서 제외 (예: mdr_text_0_text)
+    NO_DICTIONARY_SUFFIXES = ('_text',)
+    
     def __init__(self, 
                  schema_columns: List[str],
                  output_file: str,
-                 chunk_size: int = 5000):
+                 chunk_size: int = 5000,
+                 row_group_size: int = 200_000):
         self.schema_columns = schema_columns
         self.schema = pa.schema([(col, pa.string()) for col in schema_columns])
-        self.writer = pq.ParquetWriter(output_file, self.schema, compression='zstd')
-        self.buffer = []
+        self.writer = pq.ParquetWriter(
+            output_file, 
+            self.schema, 
+            compression='zstd',
+            compression_level=3,
+            use_dictionary=[col for col in schema_columns 
+                            if not col.endswith(self.NO_DICTIONARY_SUFFIXES)],
+            dictionary_pagesize_limit=1 << 20,
+            write_statistics=True,
+            data_page_version='2.0',
+            write_batch_size=chunk_size,
+            data_page_size=1 << 20
+        )
+        # 작은 배치를 모아 하나의 row group으로 쓰기 (row group 단편화 방지)
+        self.row_group_size = row_group_size
+        self.pending_batches: List[pa.RecordBatch] = []
+        self.pending_rows = 0
+        # 컬럼별 버퍼 (SoA): flush 시 컬럼 단위로 Arrow 배열 생성
+        self.col_buffers = {col: [] for col in schema_columns}
+        self.buffered_rows = 0
         self.chunk_size = chunk_size
     
     def write(self, record: Dict) -> None:
-        """단일 레코드를 버퍼에 추가"""
-        self.buffer.append(record)
-        if len(self.buffer) >= self.chunk_size:
+        """단일 레코드를 컬럼별 버퍼에 추가"""
+        for col, values in self.col_buffers.items():
+            values.append(record.get(col))
+        self.buffered_rows += 1
+        if self.buffered_rows >= self.chunk_size:
             self._flush()
     
-    def write_table(self, table: pa.Table) -> None:
-        """PyArrow Table을 직접 쓰기 (병합용)"""
-        self.writer.write_table(table)
+    def write_batch(self, batch: pa.RecordBatch) -> None:
+        """PyArrow RecordBatch를 row group 버퍼에 추가"""
+        self.pending_batches.append(batch)
+        self.pending_rows += batch.num_rows
+        if self.pending_rows >= self.row_group_size:
+            self._write_row_group()
+    
+    def _write_row_group(self) -> None:
+        """모인 배치를 하나의 row group으로 쓰기"""
+        if self.pending_batches:
+            table = pa.Table.from_batches(self.pending_batches, schema=self.schema)
+            self.writer.write_table(table, row_group_size=self.row_group_size)
+            self.pending_batches = []
+            self.pending_rows = 0
     
     def _flush(self) -> None:
         """버퍼를 파일에 쓰기"""
-        if self.buffer:
-            table = pa.Table.from_pylist(self.buffer, schema=self.schema)
-            self.writer.write_table(table)
-            self.buffer = []
+        if self.buffered_rows:
+            arrays = [to_string_array(self.col_buffers[col]) 
+                      for col in self.schema_columns]
+            batch = pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+            self.write_batch(batch)
+            for values in self.col_buffers.values():
+                values.clear()
+            self.buffered_rows = 0
     
     def close(self) -> None:
         """남은 버퍼 처리 후 파일 닫기"""
         self._flush()
-        self.writer.close()
\ No newline at end of file
+        self._write_row_group()
+        self.writer.close()
+
+
+class ShardWriter:
+    """스키마를 모르는 레코드를 청크 단위 Parquet 샤드로 쓰기
+    
+    청크마다 Arrow가 컬럼을 추론하므로 사전 스키마 수집이 필요 없음.
+    샤드별 스키마는 병합 단계에서 통합.
+    """
+    
+    def __init__(self, file_prefix: str, chunk_size: int = 5000):
+        self.file_prefix = file_prefix
+        self.chunk_size = chunk_size
+        # 컬럼별 버퍼 (SoA): 새 컬럼은 처음 등장할 때 추가
+        self.col_buffers: Dict[str, list] = {}
+        self.buffered_rows = 0
+        self.files = []
+    
+    def write(self, record: Dict) -> None:
+        """단일 레코드를 컬럼별 버퍼에 추가"""
+        rows = self.buffered_rows
+        for col, val in record.items():
+            values = self.col_buffers.get(col)
+            if values is None:
+                values = self.col_buffers[col] = []
+            # 이전 레코드에 없던 컬럼은 null로 채워 행 위치를 맞춤
+            if len(values) < rows:
+                values.extend([None] * (rows - len(values)))
+            values.append(val)
+        self.buffered_rows += 1
+        if self.buffered_rows >= self.chunk_size:
+            self._flush()
+    
+    def _flush(self) -> None:
+        """버퍼를 새 샤드 파일로 쓰기"""
+        if self.buffered_rows:
+            rows = self.buffered_rows
+            for values in self.col_buffers.values():
+                if len(values) < rows:
+                    values.extend([None] * (rows - len(values)))
+            
+            shard_file = f"{self.file_prefix}_{len(self.files):05d}.parquet"
+            batch = pa.RecordBatch.from_arrays(
+                [to_string_array(values) for values in self.col_buffers.values()],
+                names=list(self.col_buffers)
+            )
+            pq.write_table(pa.Table.from_batches([batch]), shard_file, compression='zstd')
+            self.files.append(shard_file)
+            self.col_buffers = {}
+            self.buffered_rows = 0
+    
+    def close(self) -> List[str]:
+        """남은 버퍼 처리 후 샤드 파일 목록 반환"""
+        self._flush()
+        return self.files
+    
+    def abort(self) -> None:
+        """실패 시 버퍼를 버리고 이미 쓴(또는 쓰다 만) 샤드 파일 삭제"""
+        self.col_buffers = {}
+        self.buffered_rows = 0
+        partial = f"{self.file_prefix}_{len(self.files):05d}.parquet"
+        for shard_file in self.files + [partial]:
+            if os.path.exists(shard_file):
+                os.remove(shard_file)
+        self.files = []
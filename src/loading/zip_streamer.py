@@ -5,41 +5,80 @@
 # -----------------------------
 # 표준 라이브러리
 # -----------------------------
-from typing import Dict, Iterator
+from typing import Dict, Iterator, Optional, Union, IO
 import zipfile
+import shutil
+import tempfile
 import io
+import os
 
 # -----------------------------
 # 서드파티 라이브러리
 # -----------------------------
 import requests
-import ijson
+
+# C 백엔드 우선 사용 (yajl2_c > yajl2_cffi > yajl2 > python)
+try:
+    import ijson.backends.yajl2_c as ijson
+except ImportError:
+    try:
+        import ijson.backends.yajl2_cffi as ijson
+    except ImportError:
+        try:
+            import ijson.backends.yajl2 as ijson
+        except ImportError:
+            import ijson.backends.python as ijson
 
 
 class ZipStreamer:
     """ZIP 파일에서 JSON 레코드를 스트리밍"""
     
+    # 이 크기를 넘으면 메모리 대신 디스크 임시 파일로 넘김
+    SPOOL_MAX_SIZE = 64 * 1024 * 1024
+    # 파서에 큰 단위로 읽어 넘기기 위한 버퍼 크기
+    READ_BUFFER_SIZE = 4 * 1024 * 1024
+    
     def __init__(self, url: str, chunk_size: int = 8 * 1024 * 1024):
         self.url = url
         self.chunk_size = chunk_size
         self.filename = url.split('/')[-1]
     
-    def stream_records(self) -> Iterator[Dict]:
-        """URL에서 레코드를 스트리밍으로 yield"""
-        # ZIP 다운로드
+    def _fetch(self, dest: IO[bytes]) -> None:
+        """ZIP 응답 본문을 파일 객체로 복사"""
         with requests.get(self.url, stream=True) as r:
             r.raise_for_status()
-            zip_buffer = io.BytesIO()
-            for chunk in r.iter_content(chunk_size=self.chunk_size):
-                zip_buffer.write(chunk)
-            zip_buffer.seek(0)
-        
-        # ZIP 압축 해제 및 JSON 스트리밍
-        with zipfile.ZipFile(zip_buffer, 'r') as z:
+            r.raw.decode_content = True
+            shutil.copyfileobj(r.raw, dest, length=self.chunk_size)
+    
+    def download(self, dest_dir: str) -> str:
+        """ZIP을 디스크에 미리 다운로드하고 경로 반환 (프리페치용)"""
+        fd, zip_path = tempfile.mkstemp(suffix='.zip', dir=dest_dir)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                self._fetch(f)
+        except Exception:
+            os.remove(zip_path)
+            raise
+        return zip_path
+    
+    def _parse_zip(self, source: Union[str, IO[bytes]]) -> Iterator[Dict]:
+        """ZIP 압축 해제 및 JSON 스트리밍"""
+        with zipfile.ZipFile(source, 'r') as z:
             json_file = [n for n in z.namelist() if n.endswith(".json")][0]
-            with z.open(json_file) as f:
+            with z.open(json_file) as raw:
+                f = io.BufferedReader(raw, buffer_size=self.READ_BUFFER_SIZE)
                 parser = ijson.items(f, 'results.item')
                 for record in parser:
                     yield record
+    
+    def stream_records(self, zip_path: Optional[str] = None) -> Iterator[Dict]:
+        """URL(또는 미리 받은 ZIP)에서 레코드를 스트리밍으로 yield"""
+        if zip_path is not None:
+            yield from self._parse_zip(zip_path)
+            return
         
-        del zip_buffer
\ No newline at end of file
+        with tempfile.SpooledTemporaryFile(max_size=self.SPOOL_MAX_SIZE) as spool:
+            # ZIP 다운로드 (큰 파일은 디스크로 spill)
+            self._fetch(spool)
+            spool.seek(0)
+            yield from self._parse_zip(spool)
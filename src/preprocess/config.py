@@ -264,6 +264,10 @@ class PreprocessConfig:
         """임시 디렉토리 경로"""
         return Path(self._base['paths']['local']['temp'])
     
+    def get_cache_dir(self) -> Path:
+        """재실행 간 재사용할 캐시 디렉토리 경로"""
+        return Path(self._base['paths']['local'].get('cache', './data/cache'))
+    
     # ==================== 디버그/개발 ====================
     
     def print_config(self, config_name: Optional[str] = None):
@@ -31,17 +31,18 @@ def eda_proportion(lf: pl.LazyFrame, col: str, n_rows: int = 100, top_n: int = 5
         >>> eda_proportion(lf, 'device_class', n_rows=50, top_n=3)
     """
     # 값별 카운트 및 비율 계산
-    count_lf = lf.select(
-        pl.col(col).value_counts(sort=True)  # 빈도수 계산 및 정렬
-    ).unnest(col).with_columns(
+    count_lf = lf.group_by(col).len(name='count').with_columns(  # 빈도수 계산 (hash 집계)
         (pl.col('count') / pl.col('count').sum() * 100).round(2).alias('percentage')  # 백분율 계산
     ).sort(by='count', descending=True).head(n_rows)
 
+    # 한 번만 실행하여 테이블/차트에 재사용
+    count_df = count_lf.collect(engine='streaming')
+
     # 테이블 표시
-    display(count_lf.collect().to_pandas())
+    display(count_df.to_pandas())
 
     # 도넛 차트 표시
-    draw_donut_chart(count_lf.collect(), col, top_n)
+    draw_donut_chart(count_df, col, top_n)
 
 
 def overview_col(lf: pl.LazyFrame, col: str, n_rows: int = 100) -> None:
@@ -62,12 +63,10 @@ def overview_col(lf: pl.LazyFrame, col: str, n_rows: int = 100) -> None:
         manufacturer_name의 고유 개수: 1234
         [head/tail 샘플 테이블 표시]
     """
-    # 고유값 개수 계산
-    nunique = lf.select(
+    # 고유값 개수
+    nunique_lf = lf.select(
         pl.col(col).n_unique().alias(f'unique_{col}')
-    ).collect().item()
-
-    print(f'{col}의 고유 개수: {nunique}')
+    )
 
     # 고유값을 정렬하여 상위/하위 샘플 추출
     unique_lf = lf.select(
@@ -75,8 +74,13 @@ def overview_col(lf: pl.LazyFrame, col: str, n_rows: int = 100) -> None:
         pl.col(col).unique().sort().tail(n_rows).alias(f'tail_{col}'),  # 하위 n개
     )
 
+    # 두 쿼리를 한 번에 실행 (공통 스캔 공유)
+    nunique_df, unique_df = pl.collect_all([nunique_lf, unique_lf])
+
+    print(f'{col}의 고유 개수: {nunique_df.item()}')
+
     # 테이블 표시
-    display(unique_lf.collect().to_pandas())
+    display(unique_df.to_pandas())
 
 
 def analyze_null_values(lf: pl.LazyFrame, analysis_cols=None, verbose=True) -> pl.DataFrame:
@@ -108,13 +112,16 @@ def analyze_null_values(lf: pl.LazyFrame, analysis_cols=None, verbose=True) -> p
     if analysis_cols is None:
         analysis_cols = lf.collect_schema().names()
 
-    # 전체 행 수 계산
-    total_rows = lf.select(pl.len()).collect().item()
+    # 전체 행 수와 각 컬럼의 null count를 한 번의 스캔으로 계산
+    stats = lf.select(
+        pl.len().alias('__total'),
+        pl.col(analysis_cols).null_count(),
+    ).collect(engine='streaming')  # streaming 엔진으로 실행 (메모리 효율)
+
+    total_rows = stats['__total'][0]
 
-    # 각 컬럼의 null count를 한 번에 계산
     null_df = (
-        lf.select([pl.col(col).null_count().alias(col) for col in analysis_cols])
-        .collect()
+        stats.drop('__total')
         .transpose(include_header=True, header_name='column', column_names=['null_count'])  # 전치
         .with_columns(
             (pl.col('null_count') / total_rows * 100).round(2).alias('null_pct')  # 백분율 계산
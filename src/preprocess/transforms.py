@@ -43,16 +43,19 @@ def replace_pattern_with_null(lf: pl.LazyFrame, cols: Union[str, List[str]], na_
 
     Notes:
     ------
-    - 대소문자를 구분하지 않습니다 (자동으로 대문자로 변환 후 비교)
+    - 대소문자를 구분하지 않습니다 (패턴 앞에 (?i) 플래그 추가)
     - 원본 컬럼명을 유지합니다 (.name.keep())
     """
     # 단일 컬럼 문자열을 리스트로 변환
     if isinstance(cols, str):
         cols = [cols]
 
+    # 대소문자 무시 플래그로 검사 (대문자 변환 버퍼 할당 없이 regex 엔진에서 처리)
+    ci_pattern = f'(?i){na_pattern}'
+
     # 패턴 매칭된 값을 null로 변경
     replace_null_lf = lf.with_columns(
-        pl.when(pl.col(cols).str.to_uppercase().str.contains(na_pattern))  # 대문자 변환 후 패턴 검사
+        pl.when(pl.col(cols).str.contains(ci_pattern))  # 대소문자 무시 패턴 검사
         .then(None)  # 매칭되면 null
         .otherwise(pl.col(cols))  # 매칭 안 되면 원본 유지
         .name.keep()  # 원본 컬럼명 유지
@@ -98,9 +101,9 @@ def yn_to_bool(lf: pl.LazyFrame, cols: List[str]) -> pl.LazyFrame:
     - 원본이 이미 null인 경우 null 유지
     """
     bool_lf = lf.with_columns([
-        pl.col(col)
-        .str.to_uppercase()  # 대소문자 통일 (Y/N으로 변환)
-        .replace({'Y': True, 'N': False})  # Y→True, N→False, 나머지→null
+        pl.when(pl.col(col).is_in(['Y', 'y'])).then(True)  # Y/y→True
+        .when(pl.col(col).is_in(['N', 'n'])).then(False)  # N/n→False
+        .otherwise(None)  # 나머지→null (대문자 변환 버퍼 할당 없음)
         .alias(col)  # 동일한 컬럼명으로 덮어쓰기
         for col in cols
     ])
@@ -5,7 +5,16 @@ UDI 데이터 전처리 및 매칭을 위한 도메인 특화 함수
 
 import re
 from typing import Optional
-from rapidfuzz import fuzz
+import numpy as np
+import polars as pl
+from rapidfuzz import fuzz, process
+
+# GS1 형식: (01) 뒤 14자리 숫자
+GS1_DI_PATTERN = r'\(01\)(\d{14})'
+# + 기호 뒤의 문자열 (/ 또는 $ 전까지)
+HIBCC_DI_PATTERN = r'\+([^/\$]+)'
+# cdist 한 번에 계산할 유사도 행렬 최대 셀 수 (float32 기준 약 64MB)
+FUZZY_MAX_CELLS = 1 << 24
 
 
 def extract_di_from_public(udi_public: str) -> Optional[str]:
@@ -41,18 +50,44 @@ def extract_di_from_public(udi_public: str) -> Optional[str]:
         return None
 
     # GS1 형식: (01) 뒤 14자리 숫자
-    match = re.search(r'\(01\)(\d{14})', str(udi_public))
+    match = re.search(GS1_DI_PATTERN, str(udi_public))
     if match:
         return match.group(1)
 
     # + 기호 뒤의 문자열 (/ 또는 $ 전까지)
-    match = re.search(r'\+([^/\$]+)', str(udi_public))
+    match = re.search(HIBCC_DI_PATTERN, str(udi_public))
     if match:
         return match.group(1).strip()
 
     return None
 
 
+def extract_di_expr(col: str = 'udi_public') -> pl.Expr:
+    """UDI-Public 컬럼에서 DI를 추출하는 Polars 표현식
+
+    extract_di_from_public과 동일한 규칙을 행별 Python 호출 없이
+    Polars 문자열 커널로 처리합니다 (GS1 패턴 우선, 실패 시 + 패턴).
+
+    Parameters:
+    -----------
+    col : str, default='udi_public'
+        UDI-Public 문자열 컬럼명
+
+    Returns:
+    --------
+    pl.Expr
+        추출된 DI 문자열 표현식 (실패 시 null)
+
+    Examples:
+    ---------
+    >>> lf.with_columns(extract_di_expr('udi_public').alias('extracted_di'))
+    """
+    return pl.coalesce([
+        pl.col(col).str.extract(GS1_DI_PATTERN, 1),
+        pl.col(col).str.extract(HIBCC_DI_PATTERN, 1).str.strip_chars(),
+    ])
+
+
 def fuzzy_match_dict(source_list: list, target_list: list, threshold: int = 85) -> dict:
     """리스트 간 퍼지 매칭을 통한 매핑 딕셔너리 생성
 
@@ -89,26 +124,52 @@ def fuzzy_match_dict(source_list: list, target_list: list, threshold: int = 85)
     ------
     - 대소문자를 구분하지 않고 비교합니다
     - 유사도는 Levenshtein distance 기반 비율로 계산됩니다 (0-100)
-    - 각 source 항목마다 target 전체를 순회하므로 O(n*m) 시간 복잡도
-    - 대용량 리스트의 경우 성능에 주의가 필요합니다
+    - 소문자 변환은 항목마다 한 번만 수행하고, 소문자 기준 완전 일치는
+      유사도 계산 없이 바로 매핑합니다 (ratio 100인 첫 번째 target과 동일)
+    - 나머지는 rapidfuzz.process.cdist로 유사도 행렬을 C 레벨에서 병렬 계산하며,
+      메모리를 제한하기 위해 FUZZY_MAX_CELLS 단위로 source를 나눠 처리합니다
+    - 동점이면 target_list에서 먼저 나온 항목을 선택합니다
     """
+    targets = [tgt for tgt in target_list if tgt]
+    target_keys = [str(tgt).lower() for tgt in targets]
+
+    # 완전 일치 fast-path: 소문자 키 → 첫 번째 target
+    exact = {}
+    for key, tgt in zip(target_keys, targets):
+        exact.setdefault(key, tgt)
+
     mapping = {}
+    pending = []
 
     for src in source_list:
         if not src:
             continue
 
-        best_score = 0
-        best_match = src
-
-        for tgt in target_list:
-            if not tgt:
-                continue
-            score = fuzz.ratio(str(src).lower(), str(tgt).lower())
-            if score > best_score:
-                best_score = score
-                best_match = tgt
-
-        mapping[src] = best_match if best_score >= threshold else src
+        key = str(src).lower()
+        if key in exact and threshold <= 100:
+            mapping[src] = exact[key]
+        else:
+            pending.append(src)
+
+    if not targets:
+        mapping.update((src, src) for src in pending)
+        return mapping
+
+    block_size = max(1, FUZZY_MAX_CELLS // len(targets))
+
+    for start in range(0, len(pending), block_size):
+        block = pending[start:start + block_size]
+        scores = process.cdist(
+            [str(src).lower() for src in block],
+            target_keys,
+            scorer=fuzz.ratio,
+            dtype=np.float32,
+            workers=-1,
+        )
+        best_idx = scores.argmax(axis=1)
+        best_scores = scores[np.arange(len(block)), best_idx]
+
+        for src, idx, score in zip(block, best_idx, best_scores):
+            mapping[src] = targets[idx] if 0 < score and score >= threshold else src
 
     return mapping
@@ -1,6 +1,10 @@
 """
 UDI 처리 메인 클래스 (Score 기반 매칭, Path 기반 설계)
 """
+import hashlib
+import os
+import pickle
+import tempfile
 from uuid import uuid4
 import polars as pl
 from pathlib import Path
@@ -8,7 +12,7 @@ from tqdm import tqdm
 
 from src.preprocess.config import get_config
 from src.preprocess.udi import (
-    extract_di_from_public,
+    extract_di_expr,
     fuzzy_match_dict,
 )
 
@@ -48,11 +52,16 @@ class UDIProcessor:
     - 상위 레벨에서만 scan_parquet
     - temp 삭제는 최상위 finally에서만
     """
+    
+    # 유지할 퍼지 매칭 캐시 파일 수 (UDI 제조사 목록 버전별로 1개씩 생성됨)
+    MFR_CACHE_KEEP = 3
 
     def __init__(self):
         self.udi_di_lookup = None  # Primary 직접 매칭용 (collect됨)
         self.udi_full_lookup_lf = None  # Score 매칭용 (LazyFrame, 큰 데이터)
+        self.secondary_cols: list[str] = []  # Secondary 식별자 컬럼 (identifiers_*_id)
         self.mfr_mapping = None
+        self.mfr_mapping_lf = None  # join용 매핑 테이블 (manufacturer → mfr_std)
 
         self._temp_paths: list[Path] = []
         self.fuzzy_threshold = cfg.get_legacy_cleaning_fuzzy_threshold()
@@ -72,6 +81,7 @@ class UDIProcessor:
         self.temp_dir = cfg.get_temp_dir()
         self.should_cleanup_temp = cfg.should_cleanup_temp()
         self.temp_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = cfg.get_cache_dir()
         
         # --- debug (config sanity check) ---
         assert self.temp_dir is not None, "config load failed: temp_dir is None"
@@ -109,21 +119,20 @@ class UDIProcessor:
         
         cols = lf.collect_schema().names()
         
+        # 같은 with_columns 안에서 재사용하기 위해 표현식으로 보관
+        extracted_di = extract_di_expr("udi_public")
+        
         lf = lf.with_columns([
-            pl.col("udi_public")
-              .map_elements(extract_di_from_public, return_dtype=pl.Utf8)
-              .alias("extracted_di"),
+            extracted_di.alias("extracted_di"),
             
             pl.coalesce([pl.col(c) for c in self.maude_dates if c in cols])
               .alias("report_date"),
-        ])
-        
-        lf = lf.with_columns([
-            pl.coalesce(["udi_di", "extracted_di"]).alias("udi_combined"),
+            
+            pl.coalesce([pl.col("udi_di"), extracted_di]).alias("udi_combined"),
             
             pl.when(pl.col("udi_di").is_not_null())
               .then(pl.lit("original"))
-              .when(pl.col("extracted_di").is_not_null())
+              .when(extracted_di.is_not_null())
               .then(pl.lit("extracted"))
               .otherwise(pl.lit("missing"))
               .alias("udi_source"),
@@ -151,16 +160,79 @@ class UDIProcessor:
         maude_mfrs = collect_unique_safe(maude_lf, "manufacturer")
         udi_mfrs = collect_unique_safe(udi_lf, "manufacturer")
         
-        self.mfr_mapping = fuzzy_match_dict(
-            maude_mfrs, udi_mfrs, self.fuzzy_threshold
-        )
+        self.mfr_mapping = self._cached_fuzzy_match(maude_mfrs, udi_mfrs)
+        
+        # 매핑을 작은 테이블로 만들어 hash join으로 적용
+        self.mfr_mapping_lf = pl.DataFrame(
+            {
+                "manufacturer": list(self.mfr_mapping.keys()),
+                "mfr_std": list(self.mfr_mapping.values()),
+            },
+            schema={"manufacturer": pl.Utf8, "mfr_std": pl.Utf8},
+        ).lazy()
         
         print(f"   매칭: {sum(k!=v for k,v in self.mfr_mapping.items())}/{len(maude_mfrs)} 건")
 
+    def _cached_fuzzy_match(self, maude_mfrs: list, udi_mfrs: list) -> dict:
+        """퍼지 매칭 결과를 재실행 간 재사용
+        
+        target 목록 + threshold가 같으면 source별 결과도 같으므로
+        그 해시를 키로 {source: match}를 pickle로 저장하고,
+        캐시에 없는 source만 새로 퍼지 매칭
+        
+        UDI 제조사 목록이 바뀔 때마다 새 캐시 파일이 생기므로,
+        최근 수정된 MFR_CACHE_KEEP개만 남기고 오래된 매핑 파일은 삭제
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str(self.fuzzy_threshold).encode())
+        for mfr in sorted(str(m) for m in udi_mfrs if m):
+            digest.update(b"\n" + mfr.encode())
+        cache_path = self.cache_dir / f"mfr_mapping_{digest.hexdigest()}.pkl"
+        
+        cached = {}
+        if cache_path.exists():
+            with open(cache_path, "rb") as f:
+                cached = pickle.load(f)
+        
+        new_mfrs = [m for m in maude_mfrs if m and m not in cached]
+        print(f"   캐시 재사용: {len(maude_mfrs) - len(new_mfrs)}건, 신규 매칭: {len(new_mfrs)}건")
+        
+        if new_mfrs:
+            cached.update(fuzzy_match_dict(new_mfrs, udi_mfrs, self.fuzzy_threshold))
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # 실행마다 고유한 임시 파일에 쓴 뒤 교체 (동시 실행 시 임시 파일 충돌 방지)
+            with tempfile.NamedTemporaryFile(
+                dir=self.cache_dir, prefix=f"{cache_path.stem}_", suffix=".tmp", delete=False
+            ) as f:
+                tmp_path = Path(f.name)
+                try:
+                    pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+                except BaseException:
+                    f.close()
+                    tmp_path.unlink(missing_ok=True)
+                    raise
+            os.replace(tmp_path, cache_path)
+            self._evict_fuzzy_cache()
+        
+        return {m: cached[m] for m in maude_mfrs if m}
+    
+    def _evict_fuzzy_cache(self) -> None:
+        """최근 MFR_CACHE_KEEP개를 제외한 오래된 퍼지 매칭 캐시 삭제"""
+        files = sorted(
+            self.cache_dir.glob("mfr_mapping_*.pkl"),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True
+        )
+        for old in files[self.MFR_CACHE_KEEP:]:
+            old.unlink(missing_ok=True)
+
     def apply_normalization(self, lf: pl.LazyFrame) -> pl.LazyFrame:
-        """제조사명 정규화 적용"""
-        return lf.with_columns(
-            pl.col("manufacturer").replace(self.mfr_mapping).alias("mfr_std")
+        """제조사명 정규화 적용 (매핑 테이블 left join, 없으면 원본 유지)"""
+        return (
+            lf.join(self.mfr_mapping_lf, on="manufacturer", how="left", maintain_order="left")
+            .with_columns(
+                pl.coalesce(["mfr_std", "manufacturer"]).alias("mfr_std")
+            )
         )
 
     # ==================== 3단계: Lookup 생성 ====================
@@ -170,37 +242,36 @@ class UDIProcessor:
         print("🔧 Lookup 테이블 생성...")
         
         # Primary 직접 매칭용 (collect - 작음)
+        # join/select에 쓰는 컬럼만 남기고, null 키는 어차피 매칭 안 되므로 미리 제거
         self.udi_di_lookup = (
             udi_lf
             .select([
                 "udi_di", "manufacturer", "brand",
-                "model_number", "catalog_number", "publish_date"
+                "model_number", "catalog_number"
             ])
+            .filter(pl.col("udi_di").is_not_null())
             .unique(subset=["udi_di"])
             .collect()
         )
         
         print(f"   Primary UDI Lookup: {len(self.udi_di_lookup):,} 건")
         
-        # Full info + Secondary list (LazyFrame - 큼)
+        # Full info + Secondary 컬럼 (LazyFrame - 큼)
         schema = udi_lf.collect_schema()
-        sec_cols = [c for c in schema.names()
-                   if c.startswith("identifiers_") and c.endswith("_id")]
+        self.secondary_cols = [c for c in schema.names()
+                               if c.startswith("identifiers_") and c.endswith("_id")]
         
-        if sec_cols:
-            print(f"   Secondary 컬럼: {len(sec_cols)}개")
-            self.udi_full_lookup_lf = udi_lf.select([
-                "udi_di", "manufacturer", "brand",
-                "model_number", "catalog_number", "publish_date",
-                pl.concat_list(sec_cols).alias("secondary_list")
-            ])
+        if self.secondary_cols:
+            print(f"   Secondary 컬럼: {len(self.secondary_cols)}개")
         else:
             print("   ⚠️  Secondary 컬럼 없음")
-            self.udi_full_lookup_lf = udi_lf.select([
-                "udi_di", "manufacturer", "brand",
-                "model_number", "catalog_number", "publish_date",
-                pl.lit(None).cast(pl.List(pl.Utf8)).alias("secondary_list")
-            ])
+        
+        # 리스트로 묶지 않고 원본 컬럼 유지 (매칭 시 컬럼별로 non-null만 사용)
+        self.udi_full_lookup_lf = udi_lf.select([
+            "udi_di", "manufacturer", "brand",
+            "model_number", "catalog_number", "publish_date",
+            *self.secondary_cols
+        ])
         
         print("   Full UDI Lookup: LazyFrame")
 
@@ -269,31 +340,35 @@ class UDIProcessor:
             pl.col("udi_combined").alias("secondary_key")
         ).unique().sink_parquet(key_path)
         
-        keys_lf = pl.scan_parquet(key_path)
+        # 모든 chunk에서 같은 hash set을 재사용하도록 Series로 한 번만 로드
+        # (is_in에 같은 dtype Series를 넘기는 것은 deprecated → implode로 단일 리스트 값으로 전달)
+        secondary_keys = pl.scan_parquet(key_path).collect().to_series().implode()
         
-        # ========== Step 2: UDI DB explode + filter ==========
+        # ========== Step 2: UDI DB Secondary 컬럼별 필터 + union ==========
         lookup_path = self._new_temp_path(f"secondary_lookup_{uuid4().hex}.parquet")
         
-        def explode_filter(chunk_lf: pl.LazyFrame) -> pl.LazyFrame:
-            return (
+        base_cols = [
+            "udi_di", "manufacturer", "brand",
+            "model_number", "catalog_number", "publish_date"
+        ]
+        
+        def filter_secondary(chunk_lf: pl.LazyFrame) -> pl.LazyFrame:
+            # Secondary 컬럼별로 non-null & 후보 키인 행만 뽑아 세로로 합침 (explode 대신)
+            parts = [
                 chunk_lf
-                .select([
-                    "udi_di", "manufacturer", "brand",
-                    "model_number", "catalog_number",
-                    "publish_date", "secondary_list"
-                ])
-                .explode("secondary_list")
-                .join(
-                    keys_lf,
-                    left_on="secondary_list",
-                    right_on="secondary_key",
-                    how="inner"
-                )
-            )
+                .filter(pl.col(c).is_not_null() & pl.col(c).is_in(secondary_keys))
+                .select([*base_cols, pl.col(c).cast(pl.Utf8).alias("secondary_list")])
+                for c in self.secondary_cols
+            ]
+            if not parts:
+                return chunk_lf.select([
+                    *base_cols, pl.lit(None).cast(pl.Utf8).alias("secondary_list")
+                ]).clear()
+            return pl.concat(parts)
         
         process_lazyframe_in_chunks(
             lf=self.udi_full_lookup_lf,
-            transform_func=explode_filter,
+            transform_func=filter_secondary,
             output_path=lookup_path,
             chunk_size=chunk_size,
             desc="Secondary explode"
@@ -321,7 +396,22 @@ class UDIProcessor:
         lookup_lf: pl.LazyFrame
     ) -> pl.LazyFrame:
         """Secondary chunk별 score 매칭 - 일관성 있게 수정"""
-        remaining = candidates_chunk
+        # join + score는 score level과 무관 → chunk당 한 번만 계산해 재사용
+        remaining = (
+            candidates_chunk
+            .join(
+                lookup_lf,
+                left_on=["udi_combined", "mfr_std"],
+                right_on=["secondary_list", "manufacturer"],
+                how="inner"
+            )
+            .filter(pl.col("publish_date") < pl.col("report_date"))
+            .with_columns(
+                self._build_score_expr().alias("match_score")
+            )
+            .collect()
+            .lazy()
+        )
         results = []
         
         for min_score in self.score_levels:
@@ -330,16 +420,6 @@ class UDIProcessor:
             
             matched = (
                 remaining
-                .join(
-                    lookup_lf,
-                    left_on=["udi_combined", "mfr_std"],
-                    right_on=["secondary_list", "manufacturer"],
-                    how="inner"
-                )
-                .filter(pl.col("publish_date") < pl.col("report_date"))
-                .with_columns(
-                    self._build_score_expr().alias("match_score")
-                )
                 .filter(pl.col("match_score") >= min_score)
                 .group_by([
                     "udi_combined", "mfr_std", "brand",
@@ -469,7 +549,22 @@ class UDIProcessor:
         lookup_lf: pl.LazyFrame
     ) -> pl.LazyFrame:
         """No-UDI chunk별 score 매칭 - anti join 수정"""
-        remaining = candidates_chunk
+        # join + score는 score level과 무관 → chunk당 한 번만 계산해 재사용
+        remaining = (
+            candidates_chunk
+            .join(
+                lookup_lf,
+                left_on="mfr_std",
+                right_on="manufacturer",
+                how="inner"
+            )
+            .filter(pl.col("publish_date") < pl.col("report_date"))
+            .with_columns(
+                self._build_score_expr().alias("match_score")
+            )
+            .collect()
+            .lazy()
+        )
         results = []
         
         for min_score in [3, 2, 1]:
@@ -478,16 +573,6 @@ class UDIProcessor:
             
             matched = (
                 remaining
-                .join(
-                    lookup_lf,
-                    left_on="mfr_std",
-                    right_on="manufacturer",
-                    how="inner"
-                )
-                .filter(pl.col("publish_date") < pl.col("report_date"))
-                .with_columns(
-                    self._build_score_expr().alias("match_score")
-                )
                 .filter(pl.col("match_score") >= min_score)
                 .group_by([
                     "udi_combined", "mfr_std", "brand",
@@ -668,12 +753,11 @@ class UDIProcessor:
         # ========== 매칭 실패 처리 ==========
         # Secondary 실패
         if len_secondary > 0:
-            secondary_matched_udi = pl.scan_parquet(secondary_path).select(
-                "udi_combined"
-            ).collect().to_series().to_list()
-            
-            secondary_failed = secondary_candidates.filter(
-                ~pl.col("udi_combined").is_in(secondary_matched_udi)
+            # Python list로 꺼내지 않고 anti join (hash table 한 번만 생성)
+            secondary_failed = secondary_candidates.join(
+                pl.scan_parquet(secondary_path).select("udi_combined"),
+                on="udi_combined",
+                how="anti"
             )
         else:
             secondary_failed = secondary_candidates
@@ -752,7 +836,10 @@ class UDIProcessor:
             pl.scan_parquet(secondary_failed_path),
             pl.scan_parquet(no_udi_path),
             pl.scan_parquet(no_udi_failed_path)
-        ]).sink_parquet(final_path)
+        ]).with_columns(
+            # 값 종류가 몇 개뿐인 컬럼 → dictionary 인코딩 (행마다 문자열 복사 X)
+            pl.col("udi_match_type").cast(pl.Categorical)
+        ).sink_parquet(final_path)
         
         total = pl.scan_parquet(final_path).select(pl.len()).collect().item()
         print(f"   ✅ 최종 UDI 매핑: {total:,} 건")
@@ -770,175 +857,138 @@ class UDIProcessor:
     def process_all(
         self,
         maude_lf: pl.LazyFrame,
-        mapping_path: Path,
-        output_path: Path,
-        chunk_size: int
-    ):
-        """전체 파이프라인 (매핑 적용) - 스키마 통일 버전"""
+        mapping_path: Path
+    ) -> pl.LazyFrame:
+        """전체 파이프라인 (매핑 적용) - 스키마 통일 버전 (LazyFrame 반환)"""
         print("\n🔧 매칭 적용 중...")
         
         mapping_lf = pl.scan_parquet(mapping_path)
         
-        # 매핑 테이블을 UDI 있음/없음으로 분리
-        mapping_with_udi = mapping_lf.filter(pl.col("udi_combined").is_not_null())
-        mapping_no_udi = mapping_lf.filter(pl.col("udi_combined").is_null())
+        # 원본 컬럼 리스트
+        original_cols = maude_lf.collect_schema().names()
+        
+        # ========== UDI 있음/없음을 한 번의 join으로 ==========
+        # - UDI 있음: udi_combined만 비교 (meta 키는 양쪽 모두 null)
+        # - UDI 없음: udi_combined(null) + meta 4개 키 비교
+        # nulls_equal=True로 위 null끼리 매칭되게 하고,
+        # 기존처럼 meta 키에 null이 있는 No-UDI 매핑은 매칭 대상에서 제외
+        meta_cols = ["mfr_std", "brand", "model_number", "catalog_number"]
+        key_cols = [f"__key_{c}" for c in meta_cols]
+        
+        def with_join_keys(lf: pl.LazyFrame) -> pl.LazyFrame:
+            return lf.with_columns([
+                pl.when(pl.col("udi_combined").is_null())
+                  .then(pl.col(c))
+                  .alias(k)
+                for c, k in zip(meta_cols, key_cols)
+            ])
         
-        def transform_chunk(chunk_lf: pl.LazyFrame) -> pl.LazyFrame:
-            # 원본 컬럼 리스트
-            original_cols = chunk_lf.collect_schema().names()
-            
-            # UDI 있는 행과 없는 행 분리
-            chunk_with_udi = chunk_lf.filter(pl.col("udi_combined").is_not_null())
-            chunk_no_udi = chunk_lf.filter(pl.col("udi_combined").is_null())
-            
-            results = []
-            
-            # ========== Case 1: UDI 있는 경우 ==========
-            if chunk_with_udi.select(pl.len()).collect().item() > 0:
-                matched_with_udi = (
-                    chunk_with_udi
-                    .join(
-                        mapping_with_udi,
-                        on="udi_combined",
-                        how="left",
-                        suffix="_mapping"
-                    )
-                    .with_columns([
-                        pl.coalesce(["mapped_primary_udi", "udi_combined"]).alias("device_version_id"),
-                        pl.coalesce(["mapped_manufacturer", "manufacturer"]).alias("manufacturer_final"),
-                        pl.coalesce(["mapped_brand", "brand"]).alias("brand_final"),
-                        pl.coalesce(["mapped_model_number", "model_number"]).alias("model_number_final"),
-                        pl.coalesce(["mapped_catalog_number", "catalog_number"]).alias("catalog_number_final"),
-                        pl.coalesce(["udi_match_type", pl.lit(self.match_types["not_in_mapping"])]).alias("match_source")
-                    ])
-                    .select([
-                        *original_cols,  # 원본 컬럼 유지
-                        "device_version_id",
-                        "manufacturer_final",
-                        "brand_final",
-                        "model_number_final",
-                        "catalog_number_final",
-                        "match_source",
-                        "match_score"
-                    ])
-                )
-                results.append(matched_with_udi)
-            
-            # ========== Case 2: UDI 없는 경우 ==========
-            if chunk_no_udi.select(pl.len()).collect().item() > 0:
-                matched_no_udi = (
-                    chunk_no_udi
-                    .join(
-                        mapping_no_udi,
-                        on=["mfr_std", "brand", "model_number", "catalog_number"],
-                        how="left",
-                        suffix="_mapping"
-                    )
-                    .with_columns([
-                        pl.coalesce(["mapped_primary_udi"]).alias("device_version_id"),
-                        pl.coalesce(["mapped_manufacturer", "manufacturer"]).alias("manufacturer_final"),
-                        pl.coalesce(["mapped_brand", "brand"]).alias("brand_final"),
-                        pl.coalesce(["mapped_model_number", "model_number"]).alias("model_number_final"),
-                        pl.coalesce(["mapped_catalog_number", "catalog_number"]).alias("catalog_number_final"),
-                        pl.coalesce(["udi_match_type", pl.lit(self.match_types["not_in_mapping"])]).alias("match_source")
-                    ])
-                    .select([
-                        *original_cols,  # ✅ 같은 원본 컬럼
-                        "device_version_id",
-                        "manufacturer_final",
-                        "brand_final",
-                        "model_number_final",
-                        "catalog_number_final",
-                        "match_source",
-                        "match_score"
-                    ])
-                )
-                results.append(matched_no_udi)
-            
-            # ========== 통합 (스키마 동일!) ==========
-            return pl.concat(results) if results else chunk_lf
+        mapping_keyed = with_join_keys(
+            mapping_lf.filter(
+                pl.col("udi_combined").is_not_null()
+                | pl.all_horizontal([pl.col(c).is_not_null() for c in meta_cols])
+            )
+        )
         
-        process_lazyframe_in_chunks(
-            lf=maude_lf,
-            transform_func=transform_chunk,
-            output_path=output_path,
-            chunk_size=chunk_size,
-            desc="UDI 매핑 적용"
+        return (
+            with_join_keys(maude_lf)
+            .join(
+                mapping_keyed,
+                on=["udi_combined", *key_cols],
+                how="left",
+                suffix="_mapping",
+                nulls_equal=True
+            )
+            .with_columns([
+                # UDI 없는 행은 udi_combined가 null → mapped_primary_udi만 남음
+                pl.coalesce(["mapped_primary_udi", "udi_combined"]).alias("device_version_id"),
+                pl.coalesce(["mapped_manufacturer", "manufacturer"]).alias("manufacturer_final"),
+                pl.coalesce(["mapped_brand", "brand"]).alias("brand_final"),
+                pl.coalesce(["mapped_model_number", "model_number"]).alias("model_number_final"),
+                pl.coalesce(["mapped_catalog_number", "catalog_number"]).alias("catalog_number_final"),
+                pl.coalesce([
+                    "udi_match_type",
+                    pl.lit(self.match_types["not_in_mapping"], dtype=pl.Categorical)
+                ]).alias("match_source")
+            ])
+            .select([
+                *original_cols,  # 원본 컬럼 유지
+                "device_version_id",
+                "manufacturer_final",
+                "brand_final",
+                "model_number_final",
+                "catalog_number_final",
+                "match_source",
+                "match_score"
+            ])
         )
 
     # ==================== 8단계: 후처리 ====================
     
-    def _post_process_complex_cases(self, input_path: Path, chunk_size: int) -> Path:
-        """후처리 - Tier 3 생성 (Path 반환)"""
+    def _post_process_complex_cases(
+        self,
+        matched_lf: pl.LazyFrame,
+        maude_lf: pl.LazyFrame
+    ) -> pl.LazyFrame:
+        """후처리 - Tier 3 생성 (LazyFrame 반환)"""
         print("\n🔧 후처리 (Tier 3)...")
         
-        lf = pl.scan_parquet(input_path)
-        
-        compliance = lf.group_by("mfr_std").agg([
-            (pl.col("udi_combined").is_null().sum() / pl.len()).alias("missing_rate")
-        ]).collect()
-        
-        low_compliance_mfrs = compliance.filter(
-            pl.col("missing_rate") > self.compliance
-        )["mfr_std"].to_list()
+        # 제조사별 UDI 누락률은 매칭 전 MAUDE 컬럼만으로 결정됨
+        # 집계 + 필터를 한 plan으로 → streaming 엔진에서 제조사 목록만 수집
+        low_compliance_mfrs = (
+            maude_lf
+            .group_by("mfr_std")
+            .agg(pl.col("udi_combined").is_null().mean().alias("missing_rate"))
+            .filter(pl.col("missing_rate") > self.compliance)
+            .select("mfr_std")
+            .collect(engine="streaming")
+            .to_series()
+            .implode()  # is_in에 같은 dtype Series 전달은 deprecated
+        )
         
-        def resolve_chunk(chunk_lf: pl.LazyFrame) -> pl.LazyFrame:
-            chunk_lf = chunk_lf.with_columns([
-                # ✅ 매칭 실패 케이스 모두 처리
-                pl.when(
-                    pl.col("match_source").is_in([
-                        self.match_types["no_match"],
-                        self.match_types["not_in_mapping"],
-                        # "udi_no_match"
-                    ])
+        return matched_lf.with_columns([
+            # ✅ 매칭 실패 케이스 모두 처리
+            pl.when(
+                pl.col("match_source").is_in([
+                    self.match_types["no_match"],
+                    self.match_types["not_in_mapping"],
+                    # "udi_no_match"
+                ])
+            )
+            .then(
+                pl.when(pl.col("mfr_std").is_in(low_compliance_mfrs))
+                # concat_str는 mfr_std가 null이면 null을 반환 (pl.format은 "null" 문자열을 만듦)
+                .then(pl.concat_str([
+                    pl.lit("LOW_"),
+                    pl.col("mfr_std"),
+                    pl.lit("_"),
+                    pl.col("brand_final").fill_null("UNKNOWN")
+                ])
+                # .map_elements(uuid5_from_str)
                 )
-                .then(
-                    pl.when(pl.col("mfr_std").is_in(low_compliance_mfrs))
-                    .then(pl.concat_str([
-                        pl.lit("LOW_"), 
-                        pl.col("mfr_std"), 
-                        pl.lit("_"), 
-                        pl.coalesce(["brand_final", pl.lit("UNKNOWN")])
-                    ])
-                    # .map_elements(uuid5_from_str)
-                    )
-                    .otherwise(pl.concat_str([
-                        pl.lit("UNK_"), 
-                        pl.col("mfr_std"), 
-                        pl.lit("_"),
-                        pl.coalesce(["brand_final", pl.lit("UNKNOWN")]), 
-                        pl.lit("_"), 
-                        pl.coalesce(["catalog_number_final", pl.lit("NA")])
-                    ])
-                    # .map_elements(uuid5_from_str)
-                    )
+                .otherwise(pl.concat_str([
+                    pl.lit("UNK_"),
+                    pl.col("mfr_std"),
+                    pl.lit("_"),
+                    pl.col("brand_final").fill_null("UNKNOWN"),
+                    pl.lit("_"),
+                    pl.col("catalog_number_final").fill_null("NA")
+                ])
+                # .map_elements(uuid5_from_str)
                 )
-                .otherwise(pl.col("device_version_id"))
-                .alias("device_version_id"),
-                
-                # 신뢰도 매핑
-                pl.coalesce([
-                    pl.col("match_source").replace(self.confidence_map),
-                    pl.lit("VERY_LOW")
-                ]).alias("udi_confidence"),
-                
-                pl.col("match_source").alias("final_source")
-            ])
+            )
+            .otherwise(pl.col("device_version_id"))
+            .alias("device_version_id"),
             
-            return chunk_lf
-        
-        output_path = self._new_temp_path("resolved_final.parquet")
-        
-        process_lazyframe_in_chunks(
-            lf=lf,
-            transform_func=resolve_chunk,
-            output_path=output_path,
-            chunk_size=chunk_size,
-            desc="Tier 3 처리"
-        )
-        
-        print(f"✅ 최종 결과: {output_path}")
-        return output_path  # ✅ Path 반환!
+            # 신뢰도 매핑 (닫힌 집합 → hash lookup 한 번, 미등록/null은 VERY_LOW)
+            pl.col("match_source").cast(pl.Utf8).replace_strict(
+                self.confidence_map,
+                default="VERY_LOW",
+                return_dtype=pl.Categorical
+            ).alias("udi_confidence"),
+            
+            pl.col("match_source").alias("final_source")
+        ])
 
     # ==================== 9단계: 전체 실행 ====================
     
@@ -969,18 +1019,21 @@ class UDIProcessor:
             # 4. UDI 매핑 생성 (Path 받음!)
             mapping_path = self.build_udi_mapping(maude_lf, chunk_size)
             
-            # 5. 매칭 적용
-            temp_matched_path = self._new_temp_path("maude_matched.parquet")
-            self.process_all(maude_lf, mapping_path, temp_matched_path, chunk_size)
+            # 5. 매칭 적용 (LazyFrame)
+            matched_lf = self.process_all(maude_lf, mapping_path)
             
-            # 6. 후처리 (Path 받음!)
-            final_temp_path = self._post_process_complex_cases(temp_matched_path, chunk_size)
+            # 6. 후처리 (같은 plan에 이어 붙임)
+            resolved_lf = self._post_process_complex_cases(matched_lf, maude_lf)
             
             # join으로 늘어난 중복 제거
-            final_lf = pl.scan_parquet(final_temp_path).unique(subset=['mdr_report_key'],keep='first')
+            final_lf = resolved_lf.unique(subset=['mdr_report_key'],keep='first')
             
-            # 7. 최종 파일 이동
-            final_lf.sink_parquet(output_path)
+            # 7. 한 번의 sink로 최종 파일 저장
+            final_lf.sink_parquet(
+                output_path,
+                compression='zstd',
+                compression_level=3
+            )
             
             # 통계
             print("\n" + "=" * 60)
@@ -5,7 +5,8 @@
 
 import sys
 import psutil
-from typing import List, Dict
+from typing import List, Dict, Literal, Optional, Union
+import pandas as pd
 import polars as pl
 from tqdm import tqdm
 
@@ -451,8 +452,10 @@ def groupby_nunique_safe(
     group_cols: List[str],
     agg_cols: List[str] = None,
     top_n: int = 100,
-    streaming: bool = True
-) -> pl.DataFrame:
+    streaming: bool = True,
+    return_type: Literal['polars', 'pandas', 'parquet'] = 'polars',
+    output_path: Optional[str] = None
+) -> Union[pl.DataFrame, pd.DataFrame, str]:
     """메모리 효율적으로 group by 후 각 그룹의 행 개수와 unique 개수 계산
 
     대용량 데이터에서 메모리 오버플로우 없이 그룹별 집계를 수행
@@ -470,10 +473,14 @@ def groupby_nunique_safe(
         상위 몇 개 그룹만 반환할지. Defaults to 100.
     streaming : bool, optional
         streaming 엔진 사용 여부 (메모리 효율성 향상). Defaults to True.
+    return_type : {'polars', 'pandas', 'parquet'}, optional
+        반환 형식. 'parquet'이면 output_path에 바로 기록하고 경로 반환. Defaults to 'polars'.
+    output_path : str, optional
+        return_type='parquet'일 때 저장할 파일 경로. Defaults to None.
 
     Returns:
     --------
-    pl.DataFrame: 그룹별 집계 결과 DataFrame
+    pl.DataFrame | pd.DataFrame | str: 그룹별 집계 결과 (return_type='parquet'이면 파일 경로)
         - group_cols: 그룹화 컬럼들
         - count: 각 그룹의 행 개수
         - {col}_unique: 각 컬럼의 고유값 개수 (agg_cols 지정 시)
@@ -512,12 +519,26 @@ def groupby_nunique_safe(
     # streaming 여부에 따라 엔진 선택
     engine = 'streaming' if streaming else 'auto'
 
-    # group by 후 집계, 정렬, 상위 N개만 반환
-    return (
+    # group by 후 집계, 정렬, 상위 N개만
+    result_lf = (
         lf.group_by(group_cols)
         .agg(agg_exprs)
         .sort('count', descending=True)  # count 기준 내림차순
         .head(top_n)  # 상위 N개만
-        .collect(engine=engine)  # 지정된 엔진으로 실행
-        .to_pandas()  # pandas DataFrame으로 변환
     )
+
+    # 디스크로 바로 기록 (메모리에 materialize하지 않음)
+    if return_type == 'parquet':
+        if output_path is None:
+            raise ValueError("return_type='parquet'에는 output_path가 필요합니다")
+        result_lf.sink_parquet(output_path, compression='zstd')
+        return output_path
+
+    result = result_lf.collect(engine=engine)  # 지정된 엔진으로 실행
+
+    if return_type == 'pandas':
+        return result.to_pandas()  # pandas DataFrame으로 변환
+    if return_type == 'polars':
+        return result
+
+    raise ValueError(f"지원하지 않는 return_type입니다: {return_type}")
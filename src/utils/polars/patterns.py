@@ -1,10 +1,17 @@
 """Polars DataFrame/LazyFrame 컬럼 패턴 매칭 유틸리티"""
 
 import re
+from functools import lru_cache
 from typing import List, Dict, Tuple
 import polars as pl
 
 
+@lru_cache(maxsize=None)
+def _compile_patterns(patterns: Tuple[str, ...]) -> re.Pattern:
+    """패턴 리스트를 하나의 alternation 정규식으로 컴파일 (캐시)"""
+    return re.compile('|'.join(f'(?:{p})' for p in patterns))
+
+
 def get_pattern_cols(
     lf: pl.LazyFrame,
     pattern: List[str],
@@ -25,11 +32,11 @@ def get_pattern_cols(
     # 모든 컬럼명 가져오기
     cols = lf.collect_schema().names()
 
-    # 패턴 문자열을 정규표현식 객체로 컴파일
-    regexes = [re.compile(p) for p in pattern]
+    # 패턴 리스트를 단일 정규식으로 컴파일 (동일 패턴은 캐시 재사용)
+    regex = _compile_patterns(tuple(pattern))
 
     # 각 컬럼명이 패턴 중 하나라도 매칭되면 포함
-    return [c for c in cols if any(r.search(c) for r in regexes)]
+    return [c for c in cols if regex.search(c)]
 
 
 def get_use_cols(
@@ -55,17 +62,16 @@ def get_use_cols(
         >>> base_cols = ['report_id', 'date_received']
         >>> all_cols, pattern_cols = get_use_cols(lf, patterns, base_cols)
     """
-    # 기본 컬럼으로 시작
-    analysis_cols = base_cols
-
     # 패턴별로 컬럼 추출 및 저장
-    pattern_cols = {}
-    for k, pattern in patterns.items():
-        pattern_cols[k] = get_pattern_cols(lf, pattern)
-        analysis_cols += pattern_cols[k]
+    pattern_cols = {k: get_pattern_cols(lf, pattern) for k, pattern in patterns.items()}
+
+    # 기본 컬럼 + 패턴 컬럼을 순서 유지하며 중복 제거 (base_cols 원본은 변경하지 않음)
+    analysis_cols = list(dict.fromkeys(
+        base_cols + [c for cols in pattern_cols.values() for c in cols]
+    ))
 
-    # 중복 제거 후 역순 정렬
-    analysis_cols = sorted(list(set(analysis_cols)), reverse=True)
+    # 역순 정렬 (기존 출력 순서 유지)
+    analysis_cols.sort(reverse=True)
 
     # 요약 정보 출력
     print(f"총 컬럼: {len(analysis_cols)}개")
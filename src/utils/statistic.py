@@ -5,8 +5,11 @@
 
 # 1. 표준 라이브러리
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional, Sequence
+from functools import lru_cache
+import os
+from typing import Callable, List, Optional, Sequence
 
 # 2. 서드파티 라이브러리
 from matplotlib.artist import Artist
@@ -25,6 +28,7 @@ import matplotlib.pyplot as plt
 from scipy import stats
 from scipy.stats import shapiro, levene, ttest_ind, chi2_contingency
 from scipy.stats import mannwhitneyu, f_oneway
+from scipy.special import ndtr, ndtri
 import scikit_posthocs as sp
 import pingouin as pg
 from statsmodels.stats.multicomp import MultiComparison
@@ -35,7 +39,135 @@ from src.utils import is_running_in_notebook
 display = display if is_running_in_notebook() else print
 
 
-@dataclass
+def _silent(msg: str) -> None:
+    """출력하지 않는 reporter (병렬 실행 기본값)"""
+
+
+@lru_cache(maxsize=128)
+def _normal_order_quantiles(n: int) -> np.ndarray:
+    """
+    Q-Q plot의 이론 분위수 (Filliben 순서통계량 중앙값 → 표준정규 ppf)
+
+    stats.probplot과 같은 값이며, 표본 크기 n별로 한 번만 계산한다.
+    """
+    m = (np.arange(1, n + 1) - 0.3175) / (n + 0.365)
+    m[-1] = 0.5 ** (1.0 / n)
+    m[0] = 1 - m[-1]
+    quantiles = stats.norm.ppf(m)
+    quantiles.flags.writeable = False
+    return quantiles
+
+
+@lru_cache(maxsize=256)
+def _sw_coeffs(n: int) -> np.ndarray:
+    """
+    Shapiro-Wilk 계수 a_i (Royston 1995, AS R94 — scipy swilk와 같은 근사식)
+
+    표본 크기 n에만 의존하므로 n별로 한 번만 계산해 재사용한다.
+    dropna 후 크기가 같은 dv_col이 많으면 execute_all 전체에서 공유된다.
+    """
+    if n == 3:
+        a = np.array([-np.sqrt(0.5), 0.0, np.sqrt(0.5)])
+    else:
+        m = ndtri((np.arange(1, n + 1) - 0.375) / (n + 0.25))
+        summ2 = (m * m).sum()
+        ssumm2 = np.sqrt(summ2)
+        rsn = 1.0 / np.sqrt(n)
+        a_n = np.polyval([-2.706056, 4.434685, -2.07119, -0.147981, 0.221157, 0.0], rsn) + m[-1] / ssumm2
+        if n > 5:
+            a_n1 = np.polyval([-3.582633, 5.682633, -1.752461, -0.293762, 0.042981, 0.0], rsn) + m[-2] / ssumm2
+            fac = np.sqrt((summ2 - 2 * m[-1] ** 2 - 2 * m[-2] ** 2) / (1 - 2 * a_n ** 2 - 2 * a_n1 ** 2))
+            a = m / fac
+            a[-1], a[-2] = a_n, a_n1
+            a[0], a[1] = -a_n, -a_n1
+        else:
+            fac = np.sqrt((summ2 - 2 * m[-1] ** 2) / (1 - 2 * a_n ** 2))
+            a = m / fac
+            a[-1], a[0] = a_n, -a_n
+    a.flags.writeable = False
+    return a
+
+
+def _shapiro_wilk(x: ArrayLike) -> tuple[float, float]:
+    """
+    Shapiro-Wilk 검정 (W, p-value)
+
+    캐시된 계수로 W를 계산하고 Royston 정규화 변환으로 p-value를 구한다.
+    scipy.stats.shapiro와 같은 값이며 (p-value 차이 ~1e-7),
+    n < 3 또는 분산 0인 경우는 scipy에 위임한다.
+    """
+    x = np.sort(np.asarray(x, dtype=np.float64))
+    n = x.size
+    if n < 3:
+        return shapiro(x)
+
+    d = x - x.mean()
+    ssq = (d * d).sum()
+    if ssq == 0:
+        return shapiro(x)
+
+    w = min(1.0, (_sw_coeffs(n) @ x) ** 2 / ssq)
+
+    if n == 3:
+        p_value = max(0.0, 6 / np.pi * (np.arcsin(np.sqrt(w)) - np.arcsin(np.sqrt(0.75))))
+        return w, p_value
+
+    y = np.log1p(-w)
+    if n <= 11:
+        gamma = 0.459 * n - 2.273
+        if y >= gamma:
+            return w, 1e-99
+        y = -np.log(gamma - y)
+        mu = np.polyval([-6.714e-4, 0.025054, -0.39978, 0.544], n)
+        sigma = np.exp(np.polyval([-0.0020322, 0.062767, -0.77857, 1.3822], n))
+    else:
+        ln_n = np.log(n)
+        mu = np.polyval([0.0038915, -0.083751, -0.31082, -1.5861], ln_n)
+        sigma = np.exp(np.polyval([0.0030302, -0.082676, -0.4803], ln_n))
+
+    return w, ndtr(-(y - mu) / sigma)
+
+
+def _mannwhitneyu_two_sided(x: ArrayLike, y: ArrayLike) -> tuple[float, float]:
+    """
+    양측 Mann-Whitney U 검정 (x 기준 U, p-value)
+
+    정렬된 배열에 searchsorted로 순위합을 구하고 (동순위는 0.5로 계산),
+    정규근사 + 연속성 보정 + 동순위 보정으로 p-value를 계산한다.
+    scipy.stats.mannwhitneyu(method='auto')가 정규근사를 쓰는 경우
+    (두 그룹 모두 n > 8)에만 사용하고, 그 외에는 scipy에 위임해 결과를 맞춘다.
+    """
+    x = np.sort(np.asarray(x, dtype=np.float64))
+    y = np.sort(np.asarray(y, dtype=np.float64))
+    n0, n1 = x.size, y.size
+
+    if n0 <= 8 or n1 <= 8:
+        u_stat, p_value = mannwhitneyu(x, y, alternative='two-sided')
+        return u_stat, p_value
+
+    # U(x) = Σ_x [#(y < x) + 0.5 · #(y == x)]
+    u_stat = 0.5 * (
+        np.searchsorted(y, x, side='left').sum()
+        + np.searchsorted(y, x, side='right').sum()
+    )
+
+    # 동순위 보정 분산
+    n = n0 + n1
+    _, counts = np.unique(np.concatenate([x, y]), return_counts=True)
+    tie_term = (counts ** 3 - counts).sum() / (n * (n - 1))
+    sigma = np.sqrt(n0 * n1 / 12 * ((n + 1) - tie_term))
+    if sigma == 0:
+        u_stat, p_value = mannwhitneyu(x, y, alternative='two-sided')
+        return u_stat, p_value
+
+    mu = n0 * n1 / 2
+    z = (max(u_stat, n0 * n1 - u_stat) - mu - 0.5) / sigma
+    p_value = min(1.0, 2 * ndtr(-z))
+    return u_stat, p_value
+
+
+
+@dataclass(slots=True, frozen=True)
 class TestResult:
     test_name: str
     statistic: float
@@ -49,7 +181,16 @@ class TestResult:
         return self.p_value < alpha
     
     def to_dict(self) -> dict:
-        return self.__dict__
+        # slots라 __dict__가 없음 → 필드별 새 dict (결과 객체와 분리된 사본)
+        return {
+            'test_name': self.test_name,
+            'statistic': self.statistic,
+            'p_value': self.p_value,
+            'effect_size': self.effect_size,
+            'effect_interpretation': self.effect_interpretation,
+            'conclusion': self.conclusion,
+            'metadata': self.metadata,
+        }
 
 
 class StatisticalTest(ABC):
@@ -68,6 +209,7 @@ class StatisticalTest(ABC):
         *,
         labels: Optional[list] = None,
         alpha: Optional[float] = None,
+        n_jobs: int = 1,
         **kwargs
     ):
         alpha = alpha if alpha is not None else self.alpha
@@ -75,29 +217,98 @@ class StatisticalTest(ABC):
         if labels is None:
             labels = [0, 1]
 
-        results = []
-        for dv_col in dv_cols:
-            result = self.execute(
+        return self._map_dv_cols(
+            lambda dv_col: self.execute(
                 data=data,
                 iv_col=iv_col,
                 dv_col=dv_col,
                 labels=labels,
                 alpha=alpha,
                 **kwargs
-            )
-            results.append(result)
-
-        return results
+            ),
+            dv_cols,
+            n_jobs
+        )
     
     @abstractmethod
     def execute(self):
         pass
+
+    @staticmethod
+    def _make_reporter(reporter: Optional[Callable[[str], None]], lines: list) -> Callable:
+        """
+        print 대체용 출력 함수 생성
+
+        모든 메시지를 lines에 모으고 (→ metadata['report']), reporter가 있으면 전달한다.
+        reporter=None이면 노트북에서만 print, 그 외에는 출력하지 않는다.
+        """
+        if reporter is None and is_running_in_notebook():
+            reporter = print
+
+        def report(*parts, sep: str = ' '):
+            msg = sep.join(map(str, parts))
+            lines.append(msg)
+            if reporter is not None:
+                reporter(msg)
+
+        return report
+
+    @staticmethod
+    def _map_dv_cols(func: Callable, dv_cols: Sequence, n_jobs: int = 1) -> list:
+        """
+        dv_col별 독립 검정을 순서대로 실행 (n_jobs > 1이면 스레드 풀로 병렬 실행)
+
+        dv_col 사이에 공유되는 가변 상태가 없고, 무거운 연산(NumPy/SciPy)은
+        GIL을 해제하므로 스레드로 충분하다. 결과 순서는 dv_cols 순서를 따른다.
+        n_jobs=-1이면 CPU 코어 수만큼 사용.
+        """
+        if n_jobs == 1 or len(dv_cols) <= 1:
+            return [func(dv_col) for dv_col in dv_cols]
+
+        max_workers = os.cpu_count() if n_jobs == -1 else n_jobs
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            return list(ex.map(func, dv_cols))
+
+    @classmethod
+    def _batch_moments(cls, mat: ArrayLike):
+        """
+        열별 왜도/첨도를 한 번의 벡터 연산으로 계산 (NaN 무시)
+
+        scipy.stats.skew / kurtosis(fisher=True, bias=True)와 같은 값이며,
+        여러 종속 변수를 (n, k) 행렬로 받아 Python 루프 없이 처리한다.
+
+        Parameters
+        ----------
+        mat : array-like, shape (n, k)
+            열마다 하나의 변수
+
+        Returns
+        -------
+        skew : np.ndarray, shape (k,)
+        kurt : np.ndarray, shape (k,)
+            분산이 0이거나 유효값이 없는 열은 NaN
+        """
+        mat = np.asarray(mat, dtype=np.float64)
+        valid = ~np.isnan(mat)
+        n = valid.sum(axis=0)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(valid, mat, 0.0).sum(axis=0) / n
+            c = np.where(valid, mat - mean, 0.0)
+            c2 = c * c
+            m2 = c2.sum(axis=0) / n
+            m3 = (c2 * c).sum(axis=0) / n
+            m4 = (c2 * c2).sum(axis=0) / n
+            skew = m3 / m2 ** 1.5
+            kurt = m4 / m2 ** 2 - 3.0
+
+        return skew, kurt
     
     @abstractmethod
     def interpret(self):
         pass
 
-    def check_homogeneity(self, data: List[pd.Series], alpha: Optional[float] = None):
+    def check_homogeneity(self, data: List[pd.Series], alpha: Optional[float] = None, report: Callable = print):
         """
         등분산성 검정 수행 (Levene's Test)
 
@@ -111,6 +322,8 @@ class StatisticalTest(ABC):
             예: [group1, group2, group3]
         alpha : float, optional
             유의수준 (기본값: 0.05)
+        report : callable, default=print
+            출력 콜백
 
         Returns
         -------
@@ -124,20 +337,20 @@ class StatisticalTest(ABC):
             - False : 등분산성 위반
         """
         alpha = alpha if alpha else self.alpha
-        print("\n[등분산성 검정 - Levene's Test]")
-        print("-" * 50)
+        report("\n[등분산성 검정 - Levene's Test]")
+        report("-" * 50)
 
         stat, p_value = levene(*data)
 
-        print(f"Levene 통계량: {stat:.4f}")
-        print(f"p-value: {p_value:.4f}")
+        report(f"Levene 통계량: {stat:.4f}")
+        report(f"p-value: {p_value:.4f}")
 
         if p_value > self.alpha:
-            print("✅ 등분산성 가정을 만족합니다.")
+            report("✅ 등분산성 가정을 만족합니다.")
             is_equal_var = True
         else:
-            print("⚠️ 등분산성 가정을 만족하지 않습니다.")
-            print("   → Welch 방법 또는 비모수 검정 고려")
+            report("⚠️ 등분산성 가정을 만족하지 않습니다.")
+            report("   → Welch 방법 또는 비모수 검정 고려")
             is_equal_var = False
 
         return stat, p_value, is_equal_var
@@ -159,17 +372,17 @@ class StatisticalTest(ABC):
         all_normal = all(r['판정'] for r in results)
         return all_normal
 
-    def check_normality(self, data: ArrayLike, label: str, mode: str, alpha: Optional[float] = None):
+    def check_normality(self, data: ArrayLike, label: str, mode: str, alpha: Optional[float] = None, moments: Optional[tuple] = None, report: Callable = print):
         alpha = alpha if alpha else self.alpha
         if mode == 'soft':
-            return self.check_normality_soft(data, label, alpha)
+            return self.check_normality_soft(data, label, alpha, moments, report)
         elif mode == 'hard':
-            return self.check_normality_hard(data, label, alpha)
+            return self.check_normality_hard(data, label, alpha, report)
         else:
             msg = f'Invalid mode: "{mode}". Expected one of ["soft", "hard"].'
             raise ValueError(msg)
 
-    def check_normality_soft(self, data: ArrayLike, label: str = "데이터", alpha: Optional[float] = None):
+    def check_normality_soft(self, data: ArrayLike, label: str = "데이터", alpha: Optional[float] = None, moments: Optional[tuple] = None, report: Callable = print):
         alpha = alpha if alpha else self.alpha
         """
         데이터의 정규성을 검정하는 함수: t-test용
@@ -180,6 +393,10 @@ class StatisticalTest(ABC):
             정규성을 검정할 데이터 (NaN은 자동 제거)
         label : str, default="데이터"
             출력 시 표시될 데이터 이름
+        moments : tuple, optional
+            미리 계산한 (왜도, 첨도). 없으면 여기서 계산
+        report : callable, default=print
+            출력 콜백
 
         Returns
         -------
@@ -194,27 +411,32 @@ class StatisticalTest(ABC):
         - 30 ≤ n < 100: 왜도/첨도 우선, 필요시 Shapiro-Wilk
         - n ≥ 100: 왜도 기준 (|왜도| < 2, 중심극한정리)
         """
-        # NaN 체크
-        if pd.isna(data).any():
-            print(f"⚠️ 경고: {label}에 NaN 값이 {pd.isna(data).sum()}개 포함됨")
-            data = data.dropna()
-            print(f"   → NaN 제거 후 n={len(data)}")
+        # NaN 체크 (float 배열로 한 번 변환 + 마스크 한 번으로 개수/제거 처리)
+        data = np.asarray(data, dtype=np.float64)
+        nan_mask = np.isnan(data)
+        n_nan = int(nan_mask.sum())
+        if n_nan:
+            report(f"⚠️ 경고: {label}에 NaN 값이 {n_nan}개 포함됨")
+            data = data[~nan_mask]
+            report(f"   → NaN 제거 후 n={len(data)}")
 
         n = len(data)
 
-        print(f"\n[{label} 정규성 검정] n={n}")
-        print("-"*40)
+        report(f"\n[{label} 정규성 검정] n={n}")
+        report("-"*40)
 
         # 왜도와 첨도
-        skew = stats.skew(data)
-        kurt = stats.kurtosis(data, fisher=True)
-        print(f"왜도(Skewness): {skew:.3f}")
-        print(f"첨도(Kurtosis): {kurt:.3f}")
+        if moments is None:
+            skews, kurts = self._batch_moments(data[:, None])
+            moments = (skews[0], kurts[0])
+        skew, kurt = moments
+        report(f"왜도(Skewness): {skew:.3f}")
+        report(f"첨도(Kurtosis): {kurt:.3f}")
 
         # 표본 크기에 따른 판단
         if n < 30:
-            stat, p_value = shapiro(data)
-            print(f"Shapiro-Wilk p-value: {p_value:.4f}")
+            stat, p_value = _shapiro_wilk(data)
+            report(f"Shapiro-Wilk p-value: {p_value:.4f}")
             is_normal = p_value > self.alpha
             reason = f"Shapiro p={'>' if is_normal else '≤'}{self.alpha}"
         elif n < 100:
@@ -223,8 +445,8 @@ class StatisticalTest(ABC):
                 is_normal = True
                 reason = "|왜도|<1, |첨도|<2"
             else:
-                stat, p_value = shapiro(data)
-                print(f"추가 Shapiro-Wilk p-value: {p_value:.4f}")
+                stat, p_value = _shapiro_wilk(data)
+                report(f"추가 Shapiro-Wilk p-value: {p_value:.4f}")
                 is_normal = p_value > self.alpha
                 reason = f"Shapiro p={'>' if is_normal else '≤'}{self.alpha}"
         else:
@@ -232,29 +454,32 @@ class StatisticalTest(ABC):
             is_normal = abs(skew) < 2
             reason = f"|왜도|{'<' if is_normal else '≥'}2 (중심극한정리)"
 
-        print(f"결과: {'✅ 정규분포 가정 충족' if is_normal else '❌ 정규분포 가정 위반'} ({reason})")
+        report(f"결과: {'✅ 정규분포 가정 충족' if is_normal else '❌ 정규분포 가정 위반'} ({reason})")
         return stat, p_value, is_normal
 
-    def check_normality_hard(self, data: ArrayLike, label: str = "데이터", alpha: float = None):
+    def check_normality_hard(self, data: ArrayLike, label: str = "데이터", alpha: float = None, report: Callable = print):
         alpha = alpha if alpha else self.alpha
         
-        # NaN 체크
-        if pd.isna(data).any():
-            print(f"⚠️ 경고: {label}에 NaN 값이 {pd.isna(data).sum()}개 포함됨")
-            data = data.dropna()
-            print(f"   → NaN 제거 후 n={len(data)}")
+        # NaN 체크 (float 배열로 한 번 변환 + 마스크 한 번으로 개수/제거 처리)
+        data = np.asarray(data, dtype=np.float64)
+        nan_mask = np.isnan(data)
+        n_nan = int(nan_mask.sum())
+        if n_nan:
+            report(f"⚠️ 경고: {label}에 NaN 값이 {n_nan}개 포함됨")
+            data = data[~nan_mask]
+            report(f"   → NaN 제거 후 n={len(data)}")
 
         n = len(data)
-        print(f"\n[{label} 정규성 검정] n={n}")
-        print("-"*40)
+        report(f"\n[{label} 정규성 검정] n={n}")
+        report("-"*40)
         
-        stat, p_value = shapiro(data)
+        stat, p_value = _shapiro_wilk(data)
         is_normal = p_value > alpha
-        print(f"Shapiro-Wilk p-value: {p_value:.4f}")
+        report(f"Shapiro-Wilk p-value: {p_value:.4f}")
         reason = f"Shapiro p={'>' if is_normal else '≤'}{self.alpha}"
         is_normal = True if p_value > self.alpha else False
         
-        print(f"결과: {'✅ 정규분포 가정 충족' if is_normal else '❌ 정규분포 가정 위반'} ({reason})")
+        report(f"결과: {'✅ 정규분포 가정 충족' if is_normal else '❌ 정규분포 가정 위반'} ({reason})")
     
         return stat, p_value, is_normal
 
@@ -264,14 +489,66 @@ class TTest(StatisticalTest):
     """
     
     def __init__(self):
+        super().__init__()
         self.test_name = 't-검정'
+
+    def execute_all(
+        self,
+        data: pd.DataFrame,
+        iv_col: str,
+        dv_cols: List[str],
+        *,
+        labels: Optional[list] = None,
+        alpha: Optional[float] = None,
+        n_jobs: int = 1,
+        **kwargs
+    ):
+        alpha = alpha if alpha is not None else self.alpha
+
+        if labels is None:
+            labels = [0, 1]
+
+        # matplotlib은 스레드 안전하지 않으므로 병렬 실행 시 시각화 생략,
+        # 스레드별 출력이 섞이지 않도록 기본 무출력 (metadata['report']로 확인)
+        if n_jobs != 1:
+            kwargs['plot'] = False
+            kwargs.setdefault('reporter', _silent)
+
+        # iv_col을 한 번만 스캔해 클래스별 행 위치를 구해두고 모든 dv_col에 재사용
+        indices = data.groupby(iv_col, sort=False).indices
+        empty = np.array([], dtype=np.intp)
+        group_idx = tuple(indices.get(label, empty) for label in labels[:2])
+
+        # 클래스별 왜도/첨도를 모든 dv_col에 대해 한 번에 계산
+        class_moments = [
+            self._batch_moments(data[dv_cols].iloc[idx])
+            for idx in group_idx
+        ]
+
+        def run(j):
+            return self.execute(
+                data=data,
+                iv_col=iv_col,
+                dv_col=dv_cols[j],
+                labels=labels,
+                alpha=alpha,
+                moments=tuple((skew[j], kurt[j]) for skew, kurt in class_moments),
+                group_idx=group_idx,
+                **kwargs
+            )
+
+        return self._map_dv_cols(run, range(len(dv_cols)), n_jobs)
     
     def execute(self, 
         data: pd.DataFrame, 
         iv_col: str, dv_col: str, 
         labels: list = [0, 1], 
         alpha: Optional[float] = None,
-        mode: str = 'soft'
+        mode: str = 'soft',
+        moments: Optional[tuple] = None,
+        group_idx: Optional[tuple] = None,
+        plot: bool = True,
+        reporter: Optional[Callable[[str], None]] = None
     ):
         """
         두 그룹 간 평균 차이에 대한 가설검정을 수행하는 함수.
@@ -289,46 +566,70 @@ class TTest(StatisticalTest):
             독립 변수의 값들
         alpha : float, optional
             유의수준 (default=0.05)
+        moments : tuple, optional
+            클래스별 (왜도, 첨도) 쌍. execute_all이 일괄 계산해 전달
+        group_idx : tuple, optional
+            클래스별 행 위치 배열. 있으면 전체 DataFrame 마스킹 없이 해당 컬럼만 추출
+        plot : bool, default=True
+            분포 시각화 여부. 배치/대시보드처럼 그림이 필요 없으면 False
+            (matplotlib 렌더링이 검정 자체보다 훨씬 느림)
+        reporter : callable, optional
+            출력 콜백. None이면 노트북에서만 print, 대시보드/배치에서는 출력 없음
+            (전체 출력은 result.metadata['report']에 모임)
 
         Returns
         -------
         result : TestResult
         """
         alpha = alpha if alpha is not None else self.alpha
+        moments_0, moments_1 = moments if moments is not None else (None, None)
+        lines = []
+        report = self._make_reporter(reporter, lines)
+        
+        if group_idx is not None:
+            col = data[dv_col]
+            class0_data = col.iloc[group_idx[0]].dropna()
+            class1_data = col.iloc[group_idx[1]].dropna()
+        else:
+            class0_data = data[data[iv_col] == labels[0]][dv_col].dropna()
+            class1_data = data[data[iv_col] == labels[1]][dv_col].dropna()
         
-        class0_data = data[data[iv_col] == labels[0]][dv_col].dropna()
-        class1_data = data[data[iv_col] == labels[1]][dv_col].dropna()
-        
-        self.plot(class0_data, class1_data, labels, iv_col, dv_col)
+        if plot:
+            self.plot(class0_data, class1_data, labels, iv_col, dv_col)
         
-        stat, p_levene, is_equal_var = self.check_homogeneity([class0_data, class1_data], alpha)
+        stat, p_levene, is_equal_var = self.check_homogeneity([class0_data, class1_data], alpha, report=report)
         
-        _, _, is_normal_0 = self.check_normality(class0_data, label=labels[0], mode=mode)
-        _, _, is_normal_1 = self.check_normality(class0_data, label=labels[1], mode=mode)
+        _, _, is_normal_0 = self.check_normality(class0_data, label=labels[0], mode=mode, moments=moments_0, report=report)
+        _, _, is_normal_1 = self.check_normality(class1_data, label=labels[1], mode=mode, moments=moments_1, report=report)
         
-        print("\n[가설검정]")
-        print("-" * 40)
+        report("\n[가설검정]")
+        report("-" * 40)
 
         if is_normal_0 and is_normal_1:
-            print("H₀: μ₀ = μ₁ (두 클래스의 평균이 같다)")
-            print("H₁: μ₀ ≠ μ₁ (두 클래스의 평균이 다르다)")
+            report("H₀: μ₀ = μ₁ (두 클래스의 평균이 같다)")
+            report("H₁: μ₀ ≠ μ₁ (두 클래스의 평균이 다르다)")
         else:
-            print("H₀: 두 클래스의 분포가 같다 (중앙값 차이가 없다)")
-            print("H₁: 두 클래스의 분포가 다르다 (중앙값 차이가 있다)")
+            report("H₀: 두 클래스의 분포가 같다 (중앙값 차이가 없다)")
+            report("H₁: 두 클래스의 분포가 다르다 (중앙값 차이가 있다)")
             
-        print(f"유의수준: α = {alpha}\n")
+        report(f"유의수준: α = {alpha}\n")
 
         # --- 검정 수행 ---
         if is_normal_0 and is_normal_1:
             # 모수 검정
             test_name = "Student's t-test" if is_equal_var else "Welch's t-test"
-            t_stat, p_value = ttest_ind(class0_data, class1_data, is_equal_var=is_equal_var)
-            print(f"{test_name} 결과:")
-            print(f"t = {t_stat:.4f}, p = {p_value:.4f}")
+            t_stat, p_value = ttest_ind(class0_data, class1_data, equal_var=is_equal_var)
+            report(f"{test_name} 결과:")
+            report(f"t = {t_stat:.4f}, p = {p_value:.4f}")
             
-            # Cohen's d 계산
-            pooled_std = np.sqrt((class0_data.var() + class1_data.var()) / 2)
-            cohens_d = (class0_data.mean() - class1_data.mean()) / pooled_std
+            # Cohen's d 계산 (표본 크기 가중 pooled SD)
+            a0 = class0_data.to_numpy(dtype=np.float64)
+            a1 = class1_data.to_numpy(dtype=np.float64)
+            n0, n1 = a0.size, a1.size
+            m0, m1 = a0.mean(), a1.mean()
+            v0, v1 = a0.var(ddof=1), a1.var(ddof=1)
+            pooled_std = np.sqrt(((n0 - 1) * v0 + (n1 - 1) * v1) / (n0 + n1 - 2))
+            cohens_d = (m0 - m1) / pooled_std
             abs_d = abs(cohens_d)
 
             if abs_d < 0.2:
@@ -340,7 +641,7 @@ class TTest(StatisticalTest):
             else:
                 effect = "큰 효과"
 
-            print(f"Cohen's d = {cohens_d:.3f} ({effect})")
+            report(f"Cohen's d = {cohens_d:.3f} ({effect})")
 
             test_stat = t_stat
             effect_size = cohens_d
@@ -349,9 +650,9 @@ class TTest(StatisticalTest):
         else:
             # 비모수 검정
             test_name = "Mann-Whitney U test"
-            u_stat, p_value = mannwhitneyu(class0_data, class1_data, alternative='two-sided')
-            print(f"{test_name} 결과:")
-            print(f"U = {u_stat:.4f}, p = {p_value:.4f}")
+            u_stat, p_value = _mannwhitneyu_two_sided(class0_data, class1_data)
+            report(f"{test_name} 결과:")
+            report(f"U = {u_stat:.4f}, p = {p_value:.4f}")
             
             # 총 샘플 크기 (N)
             n0 = len(class0_data)
@@ -376,17 +677,18 @@ class TTest(StatisticalTest):
             effect_interpretation = effect
 
         # --- 결론 ---
-        print("\n[결론]")
+        report("\n[결론]")
         if p_value < alpha:
             conclusion = f"✅ p-value({p_value:.4f}) < {alpha} → 귀무가설 기각\n   두 클래스에 유의한 차이가 있음"
         else:
             conclusion = f"❌ p-value({p_value:.4f}) ≥ {alpha} → 귀무가설 채택\n   두 클래스에 유의한 차이가 없음"
 
-        print(conclusion)
+        report(conclusion)
         
         metadata = {
             'f_stat': stat,
-            'p_levene': p_levene
+            'p_levene': p_levene,
+            'report': "\n".join(lines)
         }
         
         # 결과 반환
@@ -431,8 +733,14 @@ class TTest(StatisticalTest):
         axes[1].legend()
         axes[1].grid(True, alpha=0.3)
 
-        # Q-Q plot (Class 0)
-        stats.probplot(class0_data, dist="norm", plot=axes[2])
+        # Q-Q plot (Class 0) - 정렬 한 번 + 캐시된 이론 분위수 (probplot 재정렬/재계산 생략)
+        osr = np.sort(np.asarray(class0_data, dtype=np.float64))
+        osm = _normal_order_quantiles(osr.size)
+        slope, intercept = np.polyfit(osm, osr, 1)
+        axes[2].plot(osm, osr, 'bo')
+        axes[2].plot(osm, slope * osm + intercept, 'r-')
+        axes[2].set_xlabel('Theoretical quantiles')
+        axes[2].set_ylabel('Ordered Values')
         axes[2].set_title(f'Q-Q Plot ({labels[0]})')
         axes[2].grid(True, alpha=0.3)
 
@@ -444,24 +752,54 @@ class Chi2Test(StatisticalTest):
     def __init__(self):
         super().__init__()
         self.test_name = '카이제곱 검정'
+
+    def execute_all(
+        self,
+        data: pd.DataFrame,
+        iv_col: str,
+        dv_cols: List[str],
+        *,
+        alpha: Optional[float] = None,
+        n_jobs: int = 1,
+        **kwargs
+    ):
+        alpha = alpha if alpha is not None else self.alpha
+
+        # 스레드별 출력이 섞이지 않도록 병렬 실행 시 기본 무출력 (metadata['report']로 확인)
+        if n_jobs != 1:
+            kwargs.setdefault('reporter', _silent)
+
+        # iv_col 범주 인코딩은 모든 dv_col에서 동일 → 한 번만 계산
+        iv_cat = pd.Categorical(data[iv_col])
+
+        return self._map_dv_cols(
+            lambda dv_col: self.execute(data, iv_col, dv_col, alpha=alpha, iv_cat=iv_cat, **kwargs),
+            dv_cols,
+            n_jobs
+        )
     
     def execute(self, 
         data: pd.DataFrame, 
         iv_col: str, dv_col: str, 
-        alpha: Optional[float] = None
+        alpha: Optional[float] = None,
+        iv_cat: Optional[pd.Categorical] = None,
+        reporter: Optional[Callable[[str], None]] = None
     ):
         alpha = alpha if alpha else self.alpha
-        df = data[[iv_col, dv_col]]
+        lines = []
+        report = self._make_reporter(reporter, lines)
         
         # 교차표
-        contingency_table = pd.crosstab(df[iv_col], df[dv_col])
+        if iv_cat is None:
+            iv_cat = pd.Categorical(data[iv_col])
+        contingency_table = self.crosstab(iv_cat, data[dv_col], iv_col, dv_col)
         
-        # 기대빈도 확인
-        is_valid = self.check_expected_frequencies(contingency_table)
-        
-        # 카이제곱 검정
+        # 카이제곱 검정 (기대빈도까지 한 번에)
         chi2_stat, p_value, dof, expected = chi2_contingency(contingency_table)
         
+        # 기대빈도 확인
+        is_valid = self.check_expected_frequencies(expected, report=report)
+        
         n = contingency_table.values.sum()  # 전체 표본 수
         r, c = contingency_table.shape      # 행수, 열수
         
@@ -482,8 +820,8 @@ class Chi2Test(StatisticalTest):
             index=contingency_table.index,
             columns=contingency_table.columns
         )
-        print("\n[기대빈도]")
-        print(expected_df.round(2))
+        report("\n[기대빈도]")
+        report(expected_df.round(2).to_string())
 
         
         # ==============================================
@@ -499,37 +837,43 @@ class Chi2Test(StatisticalTest):
             index=contingency_table.index,
             columns=contingency_table.columns
         )
-        print("\n[표준화 잔차]")
-        display(residuals_df.round(2))
-        print("(|잔차| > 2: 유의한 차이, |잔차| > 3: 매우 강한 연관성)")
+        report("\n[표준화 잔차]")
+        report(residuals_df.round(2).to_string())
+        report("(|잔차| > 2: 유의한 차이, |잔차| > 3: 매우 강한 연관성)")
         
         # 결과 요약
-        print("\n[결론]")
+        report("\n[결론]")
         if p_value < alpha:
             conclusion = f"✅ p-value({p_value:.4f}) < {alpha} → 귀무가설 기각\n" \
                             f"   {iv_col}과(와) {dv_col}은(는) 관련이 있음" \
                             f"   효과 크기: {effect_interpretation}"
-            print(conclusion)
+            report(conclusion)
             
             # 사후분석
-            print("\n[사후분석]")
-            print("   표준화 잔차 |값| > 2인 셀 해석:")
-            post_hoc = "   표준화 잔차 |값| > 2인 셀 해석:"
-            for i, row_label in enumerate(contingency_table.index):
-                for j, col_label in enumerate(contingency_table.columns):
-                    if abs(std_residuals[i, j]) > 2:
-                        if std_residuals[i, j] > 0:
-                            post_hoc += f"\n   • {row_label} - {col_label}: 예상보다 많음 (잔차={std_residuals[i, j]:.2f})"
-                        else:
-                            post_hoc += f"\n   • {row_label} - {col_label}: 예상보다 적음 (잔차={std_residuals[i, j]:.2f})"
-            print(post_hoc)
+            report("\n[사후분석]")
+            report("   표준화 잔차 |값| > 2인 셀 해석:")
+            # |잔차| > 2인 셀만 골라 포맷 (행 우선 순서 유지)
+            idx = np.argwhere(np.abs(std_residuals) > 2)
+            values = std_residuals[idx[:, 0], idx[:, 1]]
+            cells = [
+                f"   • {row_label} - {col_label}: 예상보다 {'많음' if value > 0 else '적음'} (잔차={value:.2f})"
+                for row_label, col_label, value in zip(
+                    contingency_table.index[idx[:, 0]],
+                    contingency_table.columns[idx[:, 1]],
+                    values
+                )
+            ]
+            post_hoc = "\n".join(["   표준화 잔차 |값| > 2인 셀 해석:", *cells])
+            report(post_hoc)
             metadata = {'post_hoc': post_hoc}
         else:
             conclusion = f"❌ p-value({p_value:.4f}) ≥ {alpha} → 귀무가설 채택" \
                             f"   {iv_col}과(와) {dv_col}은(는) 독립적임 (연관 없음)"
-            print(conclusion)
+            report(conclusion)
             metadata = {}
         
+        metadata['report'] = "\n".join(lines)
+
         return TestResult(
             test_name=self.test_name,
             statistic=test_stat,
@@ -584,7 +928,48 @@ class Chi2Test(StatisticalTest):
         return v, interpretation
     
     @staticmethod
-    def check_expected_frequencies(contingency_table):
+    def crosstab(iv_cat: pd.Categorical, dv_values: pd.Series, iv_col: str, dv_col: str) -> pd.DataFrame:
+        """
+        정수 코드 기반 교차표 (pd.crosstab과 같은 결과)
+
+        pd.crosstab의 MultiIndex groupby 대신 범주 코드를 np.bincount로 바로 집계한다.
+        어느 한쪽이라도 결측인 행은 제외하고, 관측되지 않은 행/열은 제거한다.
+
+        Parameters
+        ----------
+        iv_cat : pd.Categorical
+            독립 변수의 범주 인코딩 (execute_all에서 재사용)
+        dv_values : pd.Series
+            종속 변수 값
+        iv_col, dv_col : str
+            교차표 index / columns 이름
+
+        Returns
+        -------
+        pd.DataFrame
+            관측 빈도 분할표
+        """
+        dv_cat = pd.Categorical(dv_values)
+        r, c = len(iv_cat.categories), len(dv_cat.categories)
+
+        iv_codes = np.asarray(iv_cat.codes, dtype=np.int64)
+        dv_codes = np.asarray(dv_cat.codes, dtype=np.int64)
+        valid = (iv_codes >= 0) & (dv_codes >= 0)
+
+        # (행, 열) 코드를 평탄화한 인덱스 하나로 bincount → (r, c)로 reshape
+        flat = iv_codes[valid] * c + dv_codes[valid]
+        table = np.bincount(flat, minlength=r * c).reshape(r, c)
+
+        rows = table.sum(axis=1) > 0
+        cols = table.sum(axis=0) > 0
+        return pd.DataFrame(
+            table[rows][:, cols],
+            index=pd.Index(iv_cat.categories[rows], name=iv_col),
+            columns=pd.Index(dv_cat.categories[cols], name=dv_col)
+        )
+
+    @staticmethod
+    def check_expected_frequencies(expected: np.ndarray, report: Callable = print):
         """
         카이제곱 검정의 기대빈도 가정 확인
         
@@ -593,8 +978,10 @@ class Chi2Test(StatisticalTest):
         
         Parameters
         ----------
-        contingency_table : array-like
-            분할표 (관측 빈도)
+        expected : np.ndarray
+            chi2_contingency가 계산한 기대빈도 (중복 계산 방지)
+        report : callable, default=print
+            출력 콜백
         
         Returns
         -------
@@ -613,17 +1000,14 @@ class Chi2Test(StatisticalTest):
         - 2×2 분할표에서 기대빈도 < 5인 경우: Fisher's exact test 필수
         - 큰 분할표에서 일부 셀만 < 5: 카이제곱 검정 여전히 사용 가능
         """
-        # 카이제곱 검정으로 기대빈도 계산
-        chi2_stat, p_val, dof, expected = chi2_contingency(contingency_table)
-        
-        print("\n[기대빈도 확인]")
-        print("-"*40)
+        report("\n[기대빈도 확인]")
+        report("-"*40)
         
         # -------------------------------------------------------------------------
         # 1. 최소 기대빈도 확인
         # -------------------------------------------------------------------------
         min_expected = expected.min()
-        print(f"최소 기대빈도: {min_expected:.2f}")
+        report(f"최소 기대빈도: {min_expected:.2f}")
         
         # -------------------------------------------------------------------------
         # 2. 기대빈도 < 5인 셀의 비율 계산
@@ -632,18 +1016,18 @@ class Chi2Test(StatisticalTest):
         total_cells = expected.size  # 전체 셀 개수
         percent_below_5 = (cells_below_5 / total_cells) * 100
         
-        print(f"5 미만 셀: {cells_below_5}/{total_cells} ({percent_below_5:.1f}%)")
+        report(f"5 미만 셀: {cells_below_5}/{total_cells} ({percent_below_5:.1f}%)")
         
         # -------------------------------------------------------------------------
         # 3. 카이제곱 검정 적합성 판단
         # -------------------------------------------------------------------------
         # 조건: 최소 기대빈도 ≥ 5 AND 5 미만 셀 비율 ≤ 20%
         if min_expected < 5 or percent_below_5 > 20:
-            print("⚠️ 주의: Fisher's exact test 사용 권장")
-            print("   (기대빈도가 너무 작아 카이제곱 검정 부정확)")
+            report("⚠️ 주의: Fisher's exact test 사용 권장")
+            report("   (기대빈도가 너무 작아 카이제곱 검정 부정확)")
             return False
         else:
-            print("✅ 카이제곱검정 사용 가능")
+            report("✅ 카이제곱검정 사용 가능")
             return True
         
 
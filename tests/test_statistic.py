@@ -0,0 +1,111 @@
+"""src.utils.statistic 회귀 테스트"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import mannwhitneyu, shapiro, ttest_ind
+
+statistic = pytest.importorskip("src.utils.statistic")
+
+
+def _two_normal_groups(n0: int, n1: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'group': [0] * n0 + [1] * n1,
+        'y': np.concatenate([rng.normal(0.0, 1.0, n0), rng.normal(0.5, 1.0, n1)]),
+    })
+
+
+def test_ttest_execute_all_on_normal_groups():
+    data = _two_normal_groups(200, 200)
+
+    results = statistic.TTest().execute_all(data, 'group', ['y'], plot=False)
+
+    assert len(results) == 1
+    result = results[0]
+    assert result.test_name in ("Student's t-test", "Welch's t-test")
+
+    y0 = data.loc[data['group'] == 0, 'y']
+    y1 = data.loc[data['group'] == 1, 'y']
+    equal_var = result.test_name == "Student's t-test"
+    expected_t, expected_p = ttest_ind(y0, y1, equal_var=equal_var)
+    assert result.statistic == pytest.approx(expected_t)
+    assert result.p_value == pytest.approx(expected_p)
+
+
+def test_ttest_cohens_d_uses_weighted_pooled_sd_for_unbalanced_groups():
+    rng = np.random.default_rng(1)
+    y0 = rng.normal(0.0, 1.0, 120)
+    y1 = rng.normal(1.0, 3.0, 360)
+    data = pd.DataFrame({'group': [0] * y0.size + [1] * y1.size, 'y': np.concatenate([y0, y1])})
+
+    result = statistic.TTest().execute(data, 'group', 'y', plot=False)
+
+    n0, n1 = y0.size, y1.size
+    pooled_sd = np.sqrt(((n0 - 1) * y0.var(ddof=1) + (n1 - 1) * y1.var(ddof=1)) / (n0 + n1 - 2))
+    expected_d = (y0.mean() - y1.mean()) / pooled_sd
+    unweighted_d = (y0.mean() - y1.mean()) / np.sqrt((y0.var(ddof=1) + y1.var(ddof=1)) / 2)
+
+    assert result.effect_size == pytest.approx(expected_d)
+    assert result.effect_size != pytest.approx(unweighted_d)
+
+
+def _sample(kind: str, n: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    if kind == 'normal':
+        return rng.normal(size=n)
+    if kind == 'skewed':
+        return rng.exponential(size=n)
+    # 반올림으로 동순위가 많은 표본
+    return np.round(rng.exponential(size=n))
+
+
+# 3: 정확식, 4~11: 소표본 근사, 12 이상: 대표본 근사
+@pytest.mark.parametrize('n', [3, 4, 5, 6, 11, 12, 20, 50, 200, 1000, 5000])
+@pytest.mark.parametrize('kind', ['normal', 'skewed', 'ties'])
+def test_shapiro_wilk_matches_scipy(n, kind):
+    x = _sample(kind, n, seed=n)
+
+    w, p = statistic._shapiro_wilk(x)
+    expected_w, expected_p = shapiro(x)
+
+    assert w == pytest.approx(expected_w, abs=1e-8)
+    assert p == pytest.approx(expected_p, rel=1e-5, abs=5e-7)
+
+
+@pytest.mark.parametrize('x', [
+    np.array([1.0, 2.0]),       # n < 3 → scipy 위임
+    np.full(10, 3.0),           # 분산 0 → scipy 위임
+])
+def test_shapiro_wilk_delegates_degenerate_input(x):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        expected = shapiro(x)
+        result = statistic._shapiro_wilk(x)
+
+    np.testing.assert_allclose(result, tuple(expected), equal_nan=True)
+
+
+def _mwu_cases():
+    rng = np.random.default_rng(7)
+    return {
+        'continuous': (rng.normal(size=30), rng.normal(0.5, size=30)),
+        'unequal_sizes': (rng.normal(size=9), rng.normal(0.3, size=200)),
+        'ties': (rng.integers(0, 5, 40).astype(float), rng.integers(0, 6, 25).astype(float)),
+        'separated': (np.arange(10.0), np.arange(10.0) + 100),
+        'small_n_delegated': (rng.normal(size=8), rng.normal(size=20)),
+        'zero_variance': (np.ones(12), np.ones(15)),
+    }
+
+
+@pytest.mark.parametrize('case', list(_mwu_cases()))
+def test_mannwhitneyu_two_sided_matches_scipy(case):
+    x, y = _mwu_cases()[case]
+
+    u, p = statistic._mannwhitneyu_two_sided(x, y)
+    expected = mannwhitneyu(x, y, alternative='two-sided')
+
+    assert u == pytest.approx(expected.statistic)
+    assert p == pytest.approx(expected.pvalue, rel=1e-9)
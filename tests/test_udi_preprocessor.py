@@ -0,0 +1,38 @@
+"""src.preprocess.udi_preprocessor 회귀 테스트"""
+
+import pytest
+
+pl = pytest.importorskip("polars")
+udi_preprocessor = pytest.importorskip("src.preprocess.udi_preprocessor")
+
+
+def _processor():
+    # config 로딩 없이 후처리에 필요한 속성만 설정
+    processor = udi_preprocessor.UDIProcessor.__new__(udi_preprocessor.UDIProcessor)
+    processor.compliance = 0.5
+    processor.match_types = {"no_match": "no_match", "not_in_mapping": "not_in_mapping"}
+    processor.confidence_map = {"no_match": "VERY_LOW"}
+    return processor
+
+
+def test_tier3_ids_are_null_when_mfr_std_is_null():
+    maude_lf = pl.LazyFrame({
+        "mfr_std": ["LOWCO", "LOWCO", "OKCO", "OKCO", None, None],
+        "udi_combined": [None, None, "u1", "u2", None, None],
+    })
+    matched_lf = pl.LazyFrame({
+        "mfr_std": ["LOWCO", "OKCO", None, None],
+        "brand_final": ["b1", None, "b2", "b3"],
+        "catalog_number_final": ["c1", None, "c2", None],
+        "match_source": ["no_match", "not_in_mapping", "no_match", "no_match"],
+        "device_version_id": [None, None, None, None],
+    }, schema_overrides={"device_version_id": pl.Utf8})
+
+    result = _processor()._post_process_complex_cases(matched_lf, maude_lf).collect()
+
+    assert result["device_version_id"].to_list() == [
+        "LOW_LOWCO_b1",
+        "UNK_OKCO_UNKNOWN_NA",
+        None,
+        None,
+    ]